@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for Stagediver.
+
+Run a benchmark as a module from the repository root, e.g.
+``python -m benchmarks.startup``.
+"""
@@ -0,0 +1,64 @@
+"""
+Benchmark for the cross-festival analytics over many festival-years.
+
+Builds the analytics tables from synthetic lineups (three festivals over a
+span of years, with artists returning between years) and times each query.
+
+Usage:
+    python -m benchmarks.analytics [--years 12] [--artists 2000]
+"""
+
+import argparse
+import timeit
+
+from benchmarks.synthetic import make_lineup
+from stagediver.analytics import LineupAnalytics
+
+FESTIVALS = ["Synthetic Festival", "Other Festival", "Third Festival"]
+
+
+def _time_ms(func, number: int = 5) -> float:
+    """Best average time of a few repeats, in milliseconds."""
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the lineup analytics")
+    parser.add_argument(
+        "-y", "--years", type=int, default=12, help="Years per festival"
+    )
+    parser.add_argument(
+        "-a", "--artists", type=int, default=2000, help="Artists per lineup"
+    )
+    args = parser.parse_args()
+
+    # Seeds repeat across festivals and years, so the same artists return
+    lineups = [
+        make_lineup(
+            args.artists,
+            festival_name=festival,
+            festival_year=2000 + year,
+            seed=year % 4,
+        )
+        for festival in FESTIVALS
+        for year in range(args.years)
+    ]
+    sets = sum(len(lineup["artists"]) for lineup in lineups)
+    print(f"{len(lineups)} festival-years, {sets} sets")
+
+    print(
+        f"  build tables:      {_time_ms(lambda: LineupAnalytics(lineups), 1):8.1f} ms"
+    )
+    analytics = LineupAnalytics(lineups)
+    for name in (
+        "festival_years",
+        "country_mix",
+        "stage_allocation",
+        "returning_artists",
+    ):
+        query = getattr(analytics, name)
+        print(f"  {name + ':':<18} {_time_ms(query):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
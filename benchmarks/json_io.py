@@ -0,0 +1,110 @@
+"""
+Benchmark loading and saving lineup JSON files.
+
+Times the standard library json module against the common I/O layer (orjson
+when installed) for the lineup files in ``data/`` and a large synthetic
+lineup, shows the size of the compact and compressed variants, and compares
+the peak memory of streaming the artists with loading the whole file.
+
+Usage:
+    python -m benchmarks.json_io [--artists 20000] [--no-data]
+"""
+
+import argparse
+import glob
+import json
+import os
+import tempfile
+import timeit
+import tracemalloc
+
+from benchmarks.synthetic import write_lineup
+from stagediver import common
+from stagediver.common import DATA_DIR, iter_json_array, load_json_file, save_json_file
+
+
+def _time_ms(func, number: int = 3) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1000
+
+
+def _peak_kb(func) -> float:
+    """Peak memory allocated while func runs, in KB."""
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def _stdlib_load(file_path: str):
+    with open(file_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _stdlib_save(data, file_path: str) -> None:
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def benchmark_file(file_path: str, out_dir: str) -> None:
+    """Print load, save and streaming numbers for one lineup file."""
+    data = load_json_file(file_path)
+    print(f"\n{file_path}: {len(data.get('artists', []))} artists")
+
+    stdlib_ms = _time_ms(lambda: _stdlib_load(file_path))
+    print(f"  load  stdlib json:       {stdlib_ms:8.2f} ms")
+    common_ms = _time_ms(lambda: load_json_file(file_path))
+    print(f"  load  load_json_file:    {common_ms:8.2f} ms")
+
+    stdlib_path = os.path.join(out_dir, "stdlib.json")
+    print(
+        f"  save  stdlib json:       "
+        f"{_time_ms(lambda: _stdlib_save(data, stdlib_path)):8.2f} ms"
+        f"  {os.path.getsize(stdlib_path) / 1024:9.1f} KB"
+    )
+    variants = [("indented", ".json", False), ("compact", ".json", True)]
+    variants.append(("compact gzip", ".json.gz", True))
+    if common.zstandard is not None:
+        variants.append(("compact zstd", ".json.zst", True))
+    for label, extension, compact in variants:
+        path = os.path.join(out_dir, f"variant{extension}")
+        save_ms = _time_ms(lambda: save_json_file(data, path, compact=compact))
+        load_ms = _time_ms(lambda: load_json_file(path))
+        print(
+            f"  save  {label + ':':<19}{save_ms:8.2f} ms"
+            f"  {os.path.getsize(path) / 1024:9.1f} KB  (load {load_ms:.2f} ms)"
+        )
+
+    if "artists" in data:
+        del data
+        full_kb = _peak_kb(lambda: load_json_file(file_path))
+        stream_kb = _peak_kb(lambda: sum(1 for _ in iter_json_array(file_path)))
+        stream_ms = _time_ms(lambda: sum(1 for _ in iter_json_array(file_path)), 1)
+        print(f"  peak memory full load:   {full_kb:9.1f} KB")
+        print(f"  peak memory streaming:   {stream_kb:9.1f} KB  ({stream_ms:.2f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lineup JSON I/O")
+    parser.add_argument(
+        "-a", "--artists", type=int, default=20000, help="Artists in synthetic lineup"
+    )
+    parser.add_argument(
+        "--no-data", action="store_true", help="Skip the lineup files in data/"
+    )
+    args = parser.parse_args()
+
+    print(f"orjson: {'yes' if common.orjson else 'no (stdlib json)'}")
+    print(f"zstandard: {'yes' if common.zstandard else 'no'}")
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        files = (
+            [] if args.no_data else sorted(glob.glob(os.path.join(DATA_DIR, "*.json")))
+        )
+        files.append(write_lineup(out_dir, args.artists))
+        for file_path in files:
+            benchmark_file(file_path, out_dir)
+
+
+if __name__ == "__main__":
+    main()
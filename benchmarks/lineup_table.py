@@ -0,0 +1,94 @@
+"""
+Benchmark for the paginated My Lineup table on a large synthetic lineup.
+
+Measures building the lineup index, filter/sort queries against it, and the
+size of the table sent to the browser for one page versus the full lineup.
+
+Usage:
+    python -m benchmarks.lineup_table [--artists 5000] [--page-size 100]
+"""
+
+import argparse
+import io
+import random
+import timeit
+
+import pandas as pd
+import pyarrow as pa
+
+from benchmarks.synthetic import STAGES, make_lineup
+from stagediver.web.components.lineup_index import LineupIndex
+from stagediver.web.components.ratings import RATING_INFO
+
+
+def _time_ms(func, number: int = 20) -> float:
+    """Best average time of a few repeats, in milliseconds."""
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1000
+
+
+def _arrow_bytes(frame: pd.DataFrame) -> int:
+    """Size of a frame serialised to Arrow IPC, as sent to the browser."""
+    sink = io.BytesIO()
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.tell()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the lineup table")
+    parser.add_argument(
+        "-a", "--artists", type=int, default=5000, help="Artists in synthetic lineup"
+    )
+    parser.add_argument(
+        "-p", "--page-size", type=int, default=100, help="Artists per page"
+    )
+    args = parser.parse_args()
+
+    artists = make_lineup(args.artists)["artists"]
+    rng = random.Random(0)
+    ratings = {
+        artist["artist_name"]: rng.choice(list(RATING_INFO))
+        for artist in rng.sample(artists, len(artists) // 5)
+    }
+    rating_order = list(RATING_INFO)
+
+    print(f"Lineup of {len(artists)} artists, {len(ratings)} rated")
+    print(f"Build index: {_time_ms(lambda: LineupIndex(artists), number=3):.2f} ms")
+
+    index = LineupIndex(artists)
+    queries = {
+        "no filters": {},
+        "sort by artist": {"sort_by": "Artist"},
+        "stage + day": {"stages": STAGES[:2], "days": index.days[:1]},
+        "rating filter": {"rating_filter": ["❤️", "🟢"]},
+        "sort by rating": {"sort_by": "Rating", "descending": True},
+    }
+    for label, kwargs in queries.items():
+        ms = _time_ms(lambda: index.query(ratings, rating_order, **kwargs))
+        matches = len(index.query(ratings, rating_order, **kwargs))
+        print(f"Query {label:<15} {ms:7.3f} ms  ({matches} matches)")
+
+    table = pd.DataFrame(
+        {
+            "Rating": [ratings.get(a["artist_name"], "") for a in artists],
+            "Artist": [a["artist_name"] for a in artists],
+            "Stage": [a["stage_name"] for a in artists],
+            "Description": [a["bio_short"] for a in artists],
+            "Spotify": [a["social_links"]["spotify"] for a in artists],
+        }
+    )
+    positions = index.query(ratings, rating_order)[: args.page_size].tolist()
+    page = table.iloc[positions].reset_index(drop=True)
+    print(
+        f"Payload full table: {_arrow_bytes(table) / 1024:8.1f} KB, "
+        f"one page: {_arrow_bytes(page) / 1024:8.1f} KB"
+    )
+    print(
+        f"Serialise full table: {_time_ms(lambda: _arrow_bytes(table), 5):.2f} ms, "
+        f"one page: {_time_ms(lambda: _arrow_bytes(page), 5):.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
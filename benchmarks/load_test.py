@@ -0,0 +1,223 @@
+"""
+Load test for the web app pages using Streamlit's AppTest.
+
+Simulates many sessions against a synthetic lineup, with no browser and no
+network. Each session repeatedly performs a page's main interaction and reruns
+the page:
+- rating page: rate the current artist
+- My Lineup: change a rating, as an edit in the lineup table would
+- Calendar: click an event to open its artist card
+
+AppTest cannot drive ``st.data_editor`` or custom components, so the My Lineup
+and Calendar interactions are applied through session state instead. Rating
+edits go through the same incremental listener updates as ``set_rating``.
+
+Reports per-rerun latency percentiles for each page, rerun throughput (and the
+number of sessions that sustains at a given think time) and per-session state
+size, not counting the lineups shared by all sessions.
+Exits with status 1 if a page's p95 latency exceeds ``--max-p95-ms``, so it can
+be used as a regression gate for web performance changes.
+
+Usage:
+    python -m benchmarks.load_test [--sessions 8] [--reruns 20] [--artists 2000]
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.synthetic import write_lineup
+from stagediver.web.components.session_memory import measure_state, reachable_ids
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "stagediver", "web"
+)
+PAGE_FILES = {
+    "rating": os.path.join(WEB_DIR, "🎸_Stagediver.py"),
+    "lineup": os.path.join(WEB_DIR, "pages", "1_⭐_My_Lineup.py"),
+    "calendar": os.path.join(WEB_DIR, "pages", "2_📅_Calendar.py"),
+}
+# Session state is accessed outside script runs, which Streamlit warns about
+logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").setLevel(
+    logging.ERROR
+)
+
+RATINGS = ["❤️", "🟢", "🟡", "🚫"]
+RATING_OPTIONS = ["❤️ Must see", "🟢 Yes", "🟡 Meh", "🚫 No"]
+
+
+def _rate_current_artist(at: AppTest, step: int) -> None:
+    if buttons := at.get("button_group"):
+        buttons[0].set_value(RATING_OPTIONS[step % len(RATING_OPTIONS)])
+
+
+def _edit_lineup_rating(at: AppTest, step: int) -> None:
+    # As set_rating does for an edit in the table, which only runs in a script
+    name, rating = f"Artist {step:05d}", RATINGS[step % len(RATINGS)]
+    ratings = at.session_state["ratings"]
+    old_rating = ratings.get(name)
+    ratings[name] = rating
+    if "rating_listeners" in at.session_state:
+        for listener in at.session_state["rating_listeners"].values():
+            listener.update(name, old_rating, rating)
+
+
+def _click_calendar_event(at: AppTest, step: int) -> None:
+    at.session_state["clicked_event"] = {"title": f"⚪ Artist {step:05d}"}
+
+
+PAGE_ACTIONS: Dict[str, Callable[[AppTest, int], None]] = {
+    "rating": _rate_current_artist,
+    "lineup": _edit_lineup_rating,
+    "calendar": _click_calendar_event,
+}
+
+
+def session_state_bytes(at: AppTest) -> int:
+    """Measure a session's state, as the web app's memory panel does."""
+    shared = reachable_ids(at.session_state["artists_data"])
+    return measure_state(at.session_state, shared).total
+
+
+def _run(at: AppTest, page: str) -> float:
+    start = time.perf_counter()
+    at.run()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(f"{page} page raised: {at.exception[0].value}")
+    return elapsed_ms
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of values (q between 0 and 100)."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+def run_page(page: str, sessions: int, reruns: int, think_time_s: float) -> Dict:
+    """
+    Simulate concurrent sessions on a page and summarise latency and memory.
+
+    Sessions take turns, like reruns queued on one app instance (script runs
+    are effectively serialised by the GIL), and share its caches.
+
+    Args:
+        page: Page to load, one of PAGE_FILES
+        sessions: Number of simulated sessions
+        reruns: Number of interactions (each followed by a rerun) per session
+        think_time_s: Assumed time a user spends between interactions
+
+    Returns:
+        Dict of latency percentiles, throughput and session state sizes
+    """
+    apps = []
+    first_render = []
+    for _ in range(sessions):
+        at = AppTest.from_file(PAGE_FILES[page], default_timeout=120)
+        at.session_state["ratings"] = {}
+        first_render.append(_run(at, page))
+        apps.append(at)
+
+    latencies = []
+    start = time.perf_counter()
+    for step in range(reruns):
+        for at in apps:
+            PAGE_ACTIONS[page](at, step)
+            latencies.append(_run(at, page))
+    reruns_per_s = len(latencies) / (time.perf_counter() - start)
+
+    state_bytes = [session_state_bytes(at) for at in apps]
+    return {
+        "first_render_p50_ms": round(statistics.median(first_render), 1),
+        "rerun_p50_ms": round(percentile(latencies, 50), 1),
+        "rerun_p95_ms": round(percentile(latencies, 95), 1),
+        "rerun_p99_ms": round(percentile(latencies, 99), 1),
+        "rerun_max_ms": round(max(latencies), 1),
+        "reruns_per_s": round(reruns_per_s, 1),
+        # Sessions one instance keeps up with if each user acts every think_time_s
+        "sustainable_sessions": int(reruns_per_s * think_time_s),
+        "session_state_kb_mean": round(statistics.mean(state_bytes) / 1024, 1),
+        "session_state_kb_max": round(max(state_bytes) / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the web app pages")
+    parser.add_argument(
+        "-s", "--sessions", type=int, default=8, help="Concurrent sessions per page"
+    )
+    parser.add_argument(
+        "-r", "--reruns", type=int, default=20, help="Interactions per session"
+    )
+    parser.add_argument(
+        "-a", "--artists", type=int, default=2000, help="Artists in synthetic lineup"
+    )
+    parser.add_argument(
+        "-p",
+        "--pages",
+        nargs="+",
+        choices=sorted(PAGE_FILES),
+        default=list(PAGE_FILES),
+        help="Pages to load test (default: all)",
+    )
+    parser.add_argument(
+        "-t",
+        "--think-time",
+        type=float,
+        default=5.0,
+        help="Seconds a user spends between interactions (default: 5)",
+    )
+    parser.add_argument(
+        "--max-p95-ms",
+        type=float,
+        help="Fail if any page's p95 rerun latency exceeds this",
+    )
+    parser.add_argument("-o", "--output", help="Optional JSON file for the results")
+    args = parser.parse_args()
+
+    results = {
+        "sessions": args.sessions,
+        "reruns": args.reruns,
+        "artists": args.artists,
+        "think_time_s": args.think_time,
+        "pages": {},
+    }
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # The app reads lineups from ./data, so run against a synthetic one
+        write_lineup(os.path.join(tmp_dir, "data"), args.artists)
+        os.chdir(tmp_dir)
+        try:
+            for page in args.pages:
+                print(f"Load testing {page} page...")
+                results["pages"][page] = run_page(
+                    page, args.sessions, args.reruns, args.think_time
+                )
+                print("    " + json.dumps(results["pages"][page]))
+        finally:
+            os.chdir(cwd)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.max_p95_ms is not None:
+        slow = {
+            page: stats["rerun_p95_ms"]
+            for page, stats in results["pages"].items()
+            if stats["rerun_p95_ms"] > args.max_p95_ms
+        }
+        if slow:
+            print(f"p95 rerun latency above {args.max_p95_ms} ms: {slow}")
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
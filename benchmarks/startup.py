@@ -0,0 +1,145 @@
+"""
+Cold start benchmark for the web app pages.
+
+For every page this measures, each in a fresh interpreter:
+- import time, from a ``python -X importtime`` report
+- time to first render, running the page once with Streamlit's AppTest
+
+Results are appended to a JSON lines file so cold start can be tracked over time.
+
+Usage:
+    python -m benchmarks.startup [--runs 3] [--output benchmarks/results/startup.jsonl]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Dict, List
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WEB_DIR = os.path.join(ROOT_DIR, "stagediver", "web")
+PAGES = [
+    os.path.join(WEB_DIR, "🎸_Stagediver.py"),
+    os.path.join(WEB_DIR, "pages", "1_⭐_My_Lineup.py"),
+    os.path.join(WEB_DIR, "pages", "2_📅_Calendar.py"),
+]
+DEFAULT_OUTPUT = os.path.join(ROOT_DIR, "benchmarks", "results", "startup.jsonl")
+
+IMPORT_SCRIPT = (
+    "import runpy, sys; runpy.run_path(sys.argv[1], run_name='__benchmark__')"
+)
+RENDER_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=60).run()
+print(time.perf_counter() - start, len(at.exception))
+"""
+
+
+def _run(script: str, page: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", script, page],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def parse_importtime(report: str) -> List[Dict]:
+    """
+    Parse a ``-X importtime`` report into top-level imports.
+
+    Args:
+        report: stderr of a Python process run with ``-X importtime``
+
+    Returns:
+        Top-level imports as dicts with "module" and cumulative "ms"
+    """
+    imports = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Nested imports are indented below the module that triggered them
+        if not name[1:].startswith(" "):
+            imports.append({"module": name.strip(), "ms": int(cumulative) / 1000})
+    return imports
+
+
+def measure_page(page: str, runs: int) -> Dict:
+    """Measure import time and time to first render for a page."""
+    import_ms, render_ms, top_imports = [], [], []
+    for _ in range(runs):
+        imports = parse_importtime(_run(IMPORT_SCRIPT, page, "-X", "importtime").stderr)
+        import_ms.append(sum(i["ms"] for i in imports))
+        top_imports = sorted(imports, key=lambda i: -i["ms"])[:10]
+
+        seconds, exceptions = _run(RENDER_SCRIPT, page).stdout.split()
+        if int(exceptions):
+            print(f"Warning: {os.path.basename(page)} raised during first render")
+        render_ms.append(float(seconds) * 1000)
+
+    return {
+        "import_ms": round(statistics.median(import_ms), 1),
+        "first_render_ms": round(statistics.median(render_ms), 1),
+        "top_imports": top_imports,
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark web app cold start")
+    parser.add_argument(
+        "-r", "--runs", type=int, default=3, help="Runs per page (default: 3)"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=DEFAULT_OUTPUT,
+        help="JSON lines file results are appended to",
+    )
+    args = parser.parse_args()
+
+    result = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "pages": {},
+    }
+    for page in PAGES:
+        name = os.path.basename(page)
+        result["pages"][name] = measure_page(page, args.runs)
+        stats = result["pages"][name]
+        print(
+            f"{name}: import {stats['import_ms']:.0f} ms, "
+            f"first render {stats['first_render_ms']:.0f} ms"
+        )
+        for top in stats["top_imports"][:5]:
+            print(f"    {top['ms']:8.1f} ms  {top['module']}")
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, "a", encoding="utf-8") as f:
+        f.write(json.dumps(result, ensure_ascii=False) + "\n")
+    print(f"Appended results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Synthetic festival lineups for benchmarks.
+
+Lineups follow the format written by ``run_scraper``, with enough variety
+(stages, days, countries, late night sets, bios) to exercise every page.
+"""
+
+import os
+import random
+from datetime import datetime, timedelta
+
+from stagediver.common import save_json_file
+from stagediver.scraper import get_performance_times
+
+FESTIVAL_NAME = "Synthetic Festival"
+FESTIVAL_YEAR = 2099
+STAGES = [
+    "Orange Scene",
+    "Arena",
+    "Apollo",
+    "Avalon",
+    "Gaia",
+    "Gloria",
+    "Platform",
+    "Eos",
+    "Flokkr",
+    "Re:Act",
+]
+COUNTRIES = ["DK", "SE", "NO", "UK", "US", "DE", "FR", "NL", "NG", "JP", "BR", "INT"]
+WORDS = (
+    "energisk elektronisk rock pop punk metal jazz soul folk drømmende "
+    "melankolsk festlig danseglad intens rolig hypnotisk techno house rap "
+    "album debut koncert scene publikum guitar synth bas trommer stemme "
+    "turné single sange musik lyd rytme aften nat festival"
+).split()
+
+
+def _bio(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def make_lineup(
+    n_artists: int,
+    festival_name: str = FESTIVAL_NAME,
+    festival_year: int = FESTIVAL_YEAR,
+    days: int = 4,
+    seed: int = 0,
+) -> dict:
+    """
+    Generate a synthetic lineup.
+
+    Args:
+        n_artists: Number of artists in the lineup
+        festival_name: Festival name to use
+        festival_year: Festival year to use
+        days: Number of festival days performances are spread over
+        seed: Random seed, so lineups are reproducible
+
+    Returns:
+        Lineup dict in the format saved by run_scraper
+    """
+    rng = random.Random(seed)
+    first_day = datetime.fromisoformat(f"{festival_year}-07-01T00:00:00+02:00")
+
+    artists = []
+    for i in range(n_artists):
+        # Sets start between 12:00 and 02:00, on a 15 minute grid
+        start = first_day + timedelta(
+            days=rng.randrange(days), minutes=12 * 60 + 15 * rng.randrange(57)
+        )
+        end = start + timedelta(hours=1)
+        spotify_id = "".join(
+            rng.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(22)
+        )
+        artists.append(
+            {
+                "artist_name": f"Artist {i:05d}",
+                "stage_name": rng.choice(STAGES),
+                "start_ts": start.isoformat(),
+                "end_ts": end.isoformat(),
+                **get_performance_times(start, end),
+                "social_links": {
+                    "spotify": f"https://open.spotify.com/artist/{spotify_id}"
+                },
+                "bio_short": _bio(rng, 12),
+                "bio_long": "\n".join(_bio(rng, 60) for _ in range(3)),
+                "country_code": rng.sample(COUNTRIES, rng.choice([1, 1, 1, 2])),
+                "scrape_url": f"https://example.com/program/artist-{i:05d}",
+                "other_data": {},
+            }
+        )
+
+    return {
+        "festival_name": festival_name,
+        "festival_year": festival_year,
+        "timezone": "Europe/Copenhagen",
+        "scrape_ts": datetime(festival_year, 4, 1).isoformat(),
+        "artists": artists,
+    }
+
+
+def write_lineup(data_dir: str, n_artists: int, seed: int = 0) -> str:
+    """Write a synthetic lineup to data_dir and return its path."""
+    lineup = make_lineup(n_artists, seed=seed)
+    festival_id = f"{FESTIVAL_NAME.lower().replace(' ', '_')}__{FESTIVAL_YEAR}"
+    file_path = os.path.join(data_dir, f"{festival_id}.json")
+    save_json_file(lineup, file_path)
+    return file_path
@@ -0,0 +1,228 @@
+"""
+Analytics across every scraped festival-year, without Streamlit.
+
+All lineups are loaded once into columnar pandas tables: one row per set, and
+one row per set and country. Festival, stage and country columns are
+categoricals, so every question is a vectorized group-by over a few compact
+columns rather than a loop over nested lineup dicts. Artists are matched across
+festival-years with the ArtistIdentityIndex, so renamed acts still count as
+returning.
+"""
+
+import glob
+import os
+from typing import List, Optional
+
+import pandas as pd
+
+from stagediver.common import DATA_DIR, get_start_and_day, load_json_file
+from stagediver.models.identity import ArtistIdentityIndex
+
+TBA = "TBA"
+FESTIVAL_YEAR = ["festival", "year"]
+
+
+def load_lineups(data_dir: str = DATA_DIR) -> List[dict]:
+    """
+    Load every lineup file in a directory.
+
+    Args:
+        data_dir: Directory of lineup JSON files
+
+    Returns:
+        Lineup dicts, by file name
+    """
+    lineups = []
+    for file_path in sorted(glob.glob(os.path.join(data_dir, "*.json"))):
+        lineup = load_json_file(file_path)
+        # Skip other JSON files kept with the lineups, like caches
+        if (
+            isinstance(lineup, dict)
+            and lineup.get("festival_name")
+            and lineup.get("festival_year")
+        ):
+            lineups.append(lineup)
+    return lineups
+
+
+class LineupAnalytics:
+    """Columnar tables of all lineups and the aggregations over them"""
+
+    def __init__(self, lineups: List[dict]):
+        identity = ArtistIdentityIndex.from_lineups(lineups)
+        columns = {
+            "festival": [],
+            "year": [],
+            "artist": [],
+            "artist_id": [],
+            "stage": [],
+            "start": [],
+            "festival_day": [],
+        }
+        country_rows = {"festival": [], "year": [], "artist_id": [], "country": []}
+        for lineup in lineups:
+            festival, year = lineup["festival_name"], lineup["festival_year"]
+            for position, artist in enumerate(lineup.get("artists", [])):
+                artist_id = identity.performances[(festival, year, position)]
+                start, festival_day = get_start_and_day(artist)
+                columns["festival"].append(festival)
+                columns["year"].append(year)
+                columns["artist"].append(artist["artist_name"])
+                columns["artist_id"].append(artist_id)
+                columns["stage"].append(artist.get("stage_name") or TBA)
+                columns["start"].append(start)
+                columns["festival_day"].append(festival_day)
+                for country in artist.get("country_code") or []:
+                    country_rows["festival"].append(festival)
+                    country_rows["year"].append(year)
+                    country_rows["artist_id"].append(artist_id)
+                    country_rows["country"].append(country)
+
+        self.sets = pd.DataFrame(columns).astype(
+            {"festival": "category", "year": "int16", "stage": "category"}
+        )
+        self.sets["start"] = pd.to_datetime(
+            self.sets["start"].astype("Float64"), unit="s", utc=True
+        )
+        self.countries = pd.DataFrame(country_rows).astype(
+            {"festival": "category", "year": "int16", "country": "category"}
+        )
+
+    @classmethod
+    def from_dir(cls, data_dir: str = DATA_DIR) -> "LineupAnalytics":
+        """Load the analytics tables from every lineup file in a directory."""
+        return cls(load_lineups(data_dir))
+
+    def _festivals(self, table: pd.DataFrame, festivals: Optional[List[str]]):
+        return table[table["festival"].isin(festivals)] if festivals else table
+
+    def festival_years(self, festivals: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Summarize each festival-year.
+
+        Args:
+            festivals: Festival names to include (default: all)
+
+        Returns:
+            Frame indexed by festival and year, with counts of sets, artists,
+            stages and countries, the share of sets with announced times and
+            the share of artists not in any earlier year's lineup (missing for
+            the first year, which has no earlier lineups to compare with)
+        """
+        # Lineups of every festival count as earlier ones, even when filtered out
+        sets = self.sets.assign(
+            first_year=self.sets.groupby("artist_id")["year"].transform("min")
+        )
+        sets = self._festivals(sets, festivals)
+        summary = sets.groupby(FESTIVAL_YEAR, observed=True).agg(
+            sets=("artist", "size"),
+            artists=("artist_id", "nunique"),
+            stages=("stage", "nunique"),
+            scheduled=("start", "count"),
+        )
+        summary["countries"] = (
+            self._festivals(self.countries, festivals)
+            .groupby(FESTIVAL_YEAR, observed=True)["country"]
+            .nunique()
+        )
+        summary["countries"] = summary["countries"].fillna(0).astype(int)
+        summary["scheduled"] = summary["scheduled"] / summary["sets"]
+        first_timers = (
+            sets[sets["year"] == sets["first_year"]]
+            .groupby(FESTIVAL_YEAR, observed=True)["artist_id"]
+            .nunique()
+        )
+        summary["new_artists"] = first_timers.reindex(summary.index).fillna(0) / (
+            summary["artists"]
+        )
+        earliest = summary.index.get_level_values("year") == self.sets["year"].min()
+        summary.loc[earliest, "new_artists"] = float("nan")
+        return summary
+
+    def country_mix(
+        self, festivals: Optional[List[str]] = None, top: int = 10
+    ) -> pd.DataFrame:
+        """
+        Share of each festival-year's artists by country.
+
+        Artists with several countries count towards each, so a row can add
+        up to more than 1.
+
+        Args:
+            festivals: Festival names to include (default: all)
+            top: Countries to show; the rest are summed up as "Other"
+
+        Returns:
+            Frame indexed by festival and year, with one column per country
+        """
+        countries = self._festivals(self.countries, festivals).drop_duplicates()
+        artists = (
+            self._festivals(self.sets, festivals)
+            .groupby(FESTIVAL_YEAR, observed=True)["artist_id"]
+            .nunique()
+        )
+        counts = countries.groupby(FESTIVAL_YEAR + ["country"], observed=True).size()
+        mix = counts.unstack("country", fill_value=0)
+        order = mix.sum().sort_values(ascending=False).index
+        if len(order) > top:
+            mix["Other"] = mix[order[top:]].sum(axis=1)
+            mix = mix[list(order[:top]) + ["Other"]]
+        else:
+            mix = mix[order]
+        mix.columns = mix.columns.astype(str)
+        return mix.div(artists.reindex(mix.index), axis=0)
+
+    def stage_allocation(
+        self, festivals: Optional[List[str]] = None, share: bool = False
+    ) -> pd.DataFrame:
+        """
+        Sets on each stage per festival-year.
+
+        Args:
+            festivals: Festival names to include (default: all)
+            share: Give each stage's share of the festival-year's sets instead
+                of counts
+
+        Returns:
+            Frame indexed by festival and year, with one column per stage,
+            busiest stages first
+        """
+        sets = self._festivals(self.sets, festivals)
+        allocation = (
+            sets.groupby(FESTIVAL_YEAR + ["stage"], observed=True)
+            .size()
+            .unstack("stage", fill_value=0)
+        )
+        allocation = allocation[allocation.sum().sort_values(ascending=False).index]
+        allocation.columns = allocation.columns.astype(str)
+        if share:
+            allocation = allocation.div(allocation.sum(axis=1), axis=0)
+        return allocation
+
+    def returning_artists(
+        self, festivals: Optional[List[str]] = None, min_appearances: int = 2
+    ) -> pd.DataFrame:
+        """
+        Artists appearing in several festival-years, most frequent first.
+
+        Args:
+            festivals: Festival names to include (default: all)
+            min_appearances: Festival-years an artist must appear in
+
+        Returns:
+            Frame indexed by canonical artist id, with the latest name used,
+            appearances and the first and last year
+        """
+        sets = self._festivals(self.sets, festivals)
+        appearances = sets.drop_duplicates(["artist_id"] + FESTIVAL_YEAR)
+        appearances = appearances.sort_values("year")
+        returning = appearances.groupby("artist_id").agg(
+            artist=("artist", "last"),
+            appearances=("year", "size"),
+            first_year=("year", "min"),
+            last_year=("year", "max"),
+        )
+        returning = returning[returning["appearances"] >= min_appearances]
+        return returning.sort_values(
+            ["appearances", "last_year", "artist"], ascending=[False, False, True]
+        )
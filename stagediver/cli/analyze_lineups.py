@@ -0,0 +1,84 @@
+"""
+Script to compare festival-years across every scraped lineup.
+"""
+
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from stagediver.analytics import LineupAnalytics
+from stagediver.common import DATA_DIR
+
+REPORTS = ["festivals", "countries", "stages", "returning"]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare festival-years across all lineup files"
+    )
+
+    parser.add_argument(
+        "-r",
+        "--report",
+        action="append",
+        choices=REPORTS,
+        help="Report to show, may be repeated (default: all)",
+    )
+    parser.add_argument(
+        "-d",
+        "--data-dir",
+        default=DATA_DIR,
+        help=f"Directory of lineup files (default: {DATA_DIR})",
+    )
+    parser.add_argument(
+        "-f",
+        "--festival",
+        action="append",
+        help="Festival name to include, may be repeated (default: all)",
+    )
+    parser.add_argument(
+        "-n",
+        "--top",
+        type=int,
+        default=10,
+        help="Countries and returning artists to show (default: 10)",
+    )
+    parser.add_argument(
+        "--csv-dir",
+        help="Optional: Directory to also write each report to as <report>.csv",
+    )
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    analytics = LineupAnalytics.from_dir(args.data_dir)
+    print(
+        f"Loaded {len(analytics.sets)} sets from {args.data_dir} "
+        f"in {time.perf_counter() - start:.2f} s"
+    )
+
+    queries = {
+        "festivals": lambda: analytics.festival_years(args.festival),
+        "countries": lambda: analytics.country_mix(args.festival, top=args.top),
+        "stages": lambda: analytics.stage_allocation(args.festival),
+        "returning": lambda: analytics.returning_artists(args.festival).head(args.top),
+    }
+    if args.csv_dir:
+        os.makedirs(args.csv_dir, exist_ok=True)
+    with pd.option_context(
+        "display.width", 200, "display.max_columns", None, "display.precision", 2
+    ):
+        for report in args.report or REPORTS:
+            start = time.perf_counter()
+            result = queries[report]()
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"\n{report.capitalize()} ({elapsed_ms:.0f} ms):")
+            print(result)
+            if args.csv_dir:
+                result.to_csv(os.path.join(args.csv_dir, f"{report}.csv"))
+
+
+if __name__ == "__main__":
+    main()
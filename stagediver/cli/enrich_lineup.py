@@ -0,0 +1,80 @@
+"""
+Script to run the offline enrichment stage on already scraped lineup files.
+"""
+
+import argparse
+
+from stagediver.common import load_json_file, save_json_file
+from stagediver.scraper import enrich_lineup
+from stagediver.scraper.spotify import (
+    BATCH_SIZE,
+    MAX_WORKERS,
+    TTL_DAYS,
+    FileMetadataSource,
+    HttpMetadataSource,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Add similar artists, tags and Spotify metadata to lineup files"
+    )
+
+    parser.add_argument(
+        "files",
+        nargs="+",
+        help="Lineup JSON files to enrich (e.g. data/roskilde_festival__2026.json)",
+    )
+
+    # Optional Spotify metadata enrichment
+    spotify = parser.add_mutually_exclusive_group()
+    spotify.add_argument(
+        "--spotify-dataset",
+        help="Optional: JSON file of Spotify metadata keyed by artist id",
+    )
+    spotify.add_argument(
+        "--spotify-url",
+        help="Optional: Base URL of a service serving GET /artists?ids=...",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"Spotify artist ids per request (default: {BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=f"Concurrent Spotify requests (default: {MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--ttl-days",
+        type=float,
+        default=TTL_DAYS,
+        help=f"Days before cached Spotify metadata is refreshed (default: {TTL_DAYS})",
+    )
+
+    args = parser.parse_args()
+
+    spotify_source = None
+    if args.spotify_dataset:
+        spotify_source = FileMetadataSource(args.spotify_dataset)
+    elif args.spotify_url:
+        spotify_source = HttpMetadataSource(args.spotify_url)
+
+    for file_path in args.files:
+        print(f"Enriching {file_path}...")
+        lineup = load_json_file(file_path)
+        enrich_lineup(
+            lineup,
+            spotify_source,
+            batch_size=args.batch_size,
+            max_workers=args.workers,
+            ttl_days=args.ttl_days,
+        )
+        save_json_file(lineup, file_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Script to export calendars, clash reports and plans for many users' ratings.
+"""
+
+import argparse
+import os
+
+from stagediver.common import get_lineups_file
+from stagediver.export.batch import export_schedules
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Export schedules for a directory of ratings files"
+    )
+
+    parser.add_argument(
+        "ratings_dir",
+        help="Directory of ratings files saved from the web app (*.json)",
+    )
+    parser.add_argument("festival", help="Festival name (e.g. roskilde)")
+    parser.add_argument("year", type=int, help="Festival year (e.g. 2026)")
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        default="exports",
+        help="Directory to write the exports to (default: exports)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="Worker processes (default: one per CPU)",
+    )
+
+    args = parser.parse_args()
+
+    lineup_file = get_lineups_file(args.festival, args.year)
+    if not os.path.exists(lineup_file):
+        parser.error(f"No lineup file for {args.festival} {args.year}: {lineup_file}")
+
+    summary = export_schedules(
+        lineup_file, args.ratings_dir, args.output_dir, max_workers=args.workers
+    )
+    for row in summary:
+        if row["error"]:
+            print(f"{row['user']}: {row['error']}")
+
+
+if __name__ == "__main__":
+    main()
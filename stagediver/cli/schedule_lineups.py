@@ -0,0 +1,40 @@
+"""
+Script to keep festival lineups up to date in the background.
+"""
+
+import argparse
+
+from stagediver.scraper.scheduler import LineupScheduler, available_scrapers
+
+
+def main():
+    scrapers = available_scrapers()
+    parser = argparse.ArgumentParser(
+        description="Refresh festival lineups on a schedule"
+    )
+
+    parser.add_argument(
+        "-c",
+        "--class-names",
+        nargs="+",
+        choices=sorted(scrapers),
+        default=sorted(scrapers),
+        help="Scraper classes to refresh (default: all)",
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Refresh every lineup once and exit",
+    )
+
+    args = parser.parse_args()
+
+    scheduler = LineupScheduler([scrapers[name] for name in args.class_names])
+    if args.once:
+        scheduler.run_pending()
+    else:
+        scheduler.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ import inspect
 from typing import Optional
 
 from stagediver.scraper import run_scraper
+from stagediver.scraper.pipeline import FETCH_WORKERS
+from stagediver.scraper.validation import WARN_THRESHOLDS
 
 
 def get_scraper_class(class_name: str):
@@ -27,7 +29,8 @@ def get_scraper_class(class_name: str):
         available = [
             name
             for name, cls in inspect.getmembers(module, inspect.isclass)
-            if cls.__module__ == module.__name__ and name != "BaseFestivalScraper"
+            # Base classes (those with subclasses) are not scrapers themselves
+            if cls.__module__ == module.__name__ and not cls.__subclasses__()
         ]
         raise ValueError(
             f"No scraper found for class:\n{class_name}\n\n"
@@ -54,6 +57,23 @@ def main():
         type=int,
         help="Optional: Limit number of artists to scrape (default: all artists)",
     )
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=FETCH_WORKERS,
+        help=f"Artist pages fetched at once (default: {FETCH_WORKERS})",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        help="Processes parsing artist pages (default: one per CPU, 0: none)",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Reject the scrape on any data-quality problem, not only on "
+        "invalid or duplicate artists",
+    )
 
     args = parser.parse_args()
 
@@ -64,7 +84,17 @@ def main():
         raise SystemExit(1)
 
     scraper = scraper_class()
-    run_scraper(scraper, sample_size=args.sample_size)
+    try:
+        run_scraper(
+            scraper,
+            sample_size=args.sample_size,
+            fail_thresholds=WARN_THRESHOLDS if args.strict else None,
+            fetch_workers=args.fetch_workers,
+            parse_workers=args.parse_workers,
+        )
+    except ValueError as error:
+        print(error)
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -1,30 +1,263 @@
 """
 Common utilities and configuration management.
+
+JSON files are read and written with orjson when it is installed (``pip
+install stagediver[fast]``) and the standard library otherwise. Files ending
+in ``.gz`` or ``.zst`` are compressed; zstd needs the zstandard package.
 """
 
+import gzip
+import io
 import json
 import os
-from typing import Any, Dict, List
+import re
+import tempfile
+from datetime import date, datetime, timedelta
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional compression
+    zstandard = None
+
+_NUMBER_END = re.compile(r"[,\]}\s]")
 
 DATA_DIR = "data"
 
+# Sets starting before this hour belong to the previous festival day
+FESTIVAL_DAY_START_HOUR = 6
+
 
 def get_lineups_file(festival: str, year: int) -> str:
     """Generate the file path for a specific festival and year."""
     return os.path.join(DATA_DIR, f"{festival.lower()}_festival__{year}.json")
 
 
+def get_festival_day(start_time: datetime) -> str:
+    """Festival day (ISO date) of a set, counting night sets as the day before."""
+    return (start_time - timedelta(hours=FESTIVAL_DAY_START_HOUR)).date().isoformat()
+
+
+def get_start_and_day(artist: dict) -> Tuple[Optional[int], Optional[str]]:
+    """Start time in epoch seconds and festival day of a set (None if TBA)."""
+    if "start_epoch" in artist:
+        return artist["start_epoch"], artist.get("festival_day")
+    # Lineups scraped before epochs were stored only have ISO strings
+    if start_ts := artist.get("start_ts"):
+        start_time = datetime.fromisoformat(start_ts)
+        return int(start_time.timestamp()), get_festival_day(start_time)
+    return None, None
+
+
+def format_festival_day(day: str) -> str:
+    """Label a festival day (ISO date), e.g. "Wednesday 1 July"."""
+    return date.fromisoformat(day).strftime("%A %-d %B")
+
+
+def _open_binary(filepath: str) -> IO[bytes]:
+    """Open a file for binary reading, decompressing by extension."""
+    if filepath.endswith(".gz"):
+        return gzip.open(filepath, "rb")
+    if filepath.endswith(".zst"):
+        if zstandard is None:
+            raise ImportError("Install zstandard to read and write .zst files")
+        return zstandard.open(filepath, "rb")
+    return open(filepath, "rb")
+
+
+def _compress(raw: bytes, filepath: str) -> bytes:
+    """Compress encoded data as the file's extension asks for."""
+    if filepath.endswith(".gz"):
+        return gzip.compress(raw)
+    if filepath.endswith(".zst"):
+        if zstandard is None:
+            raise ImportError("Install zstandard to read and write .zst files")
+        return zstandard.ZstdCompressor().compress(raw)
+    return raw
+
+
+def dumps_json(data: Any, compact: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON.
+
+    Args:
+        data: JSON-serializable data
+        compact: Leave out indentation and spaces after separators
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if compact:
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    else:
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+    return text.encode("utf-8")
+
+
+def loads_json(raw: bytes) -> Any:
+    """Parse UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def load_json_file(filepath: str) -> Any:
-    """Load and parse a JSON file."""
+    """Load and parse a JSON file, decompressing .gz and .zst files."""
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"File not found: {filepath}")
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with _open_binary(filepath) as f:
+        return loads_json(f.read())
+
+
+def save_json_file(data: Any, filepath: str, compact: bool = False) -> None:
+    """
+    Save data to a JSON file, replacing it atomically.
+
+    The data is written to a temporary file in the same directory, flushed to
+    disk and renamed over the target, so readers see either the old or the new
+    file and a crash never leaves a partial one behind.
+
+    Args:
+        data: JSON-serializable data
+        filepath: Target file; a .gz or .zst extension compresses it
+        compact: Leave out indentation, for files nobody reads by hand
+    """
+    directory = os.path.dirname(filepath) or "."
+    os.makedirs(directory, exist_ok=True)
+    raw = _compress(dumps_json(data, compact), filepath)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _fsync_directory(directory)
+
+
+def _fsync_directory(directory: str) -> None:
+    """Flush a rename to disk (not supported on Windows)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class _StreamDecoder:
+    """Decode JSON values one at a time from a text stream read in chunks"""
+
+    def __init__(self, stream: IO[str], chunk_size: int):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read(self) -> bool:
+        """Append the next chunk to the buffer; False at end of file."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and get the next character ("" at end of file)."""
+        while True:
+            while (
+                self._pos < len(self._buffer) and self._buffer[self._pos] in " \t\n\r"
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._read():
+                return self._buffer[self._pos : self._pos + 1]
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of chars."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(
+                f"Expected one of {chars!r} but found {char or 'end of file'!r}"
+            )
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next value, reading more of the file until it is complete."""
+        if self.peek() in "-0123456789":
+            # A number may go on in the next chunk; read up to the first delimiter
+            while not _NUMBER_END.search(self._buffer, self._pos) and self._read():
+                pass
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._read():
+                    raise
+                continue
+            self._pos = end
+            return value
+
+
+def iter_json_array(
+    filepath: str, key: str = "artists", chunk_size: int = 1 << 16
+) -> Iterator[Any]:
+    """
+    Stream the items of an array in a JSON object without loading the file.
+
+    Only one item is held in memory at a time, so very large lineup files can
+    be processed in constant memory.
 
+    Args:
+        filepath: JSON file holding an object, optionally .gz or .zst
+        key: Top-level key of the array
+        chunk_size: Characters read from the file at a time
 
-def save_json_file(data: Any, filepath: str) -> None:
-    """Save data to a JSON file."""
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    Yields:
+        Items of the array, in order (nothing if the key is missing)
+    """
+    with _open_binary(filepath) as raw:
+        decoder = _StreamDecoder(io.TextIOWrapper(raw, encoding="utf-8"), chunk_size)
+        decoder.expect("{")
+        if decoder.peek() == "}":
+            return
+        while True:
+            name = decoder.value()
+            decoder.expect(":")
+            if name != key:
+                decoder.value()
+            else:
+                decoder.expect("[")
+                if decoder.peek() == "]":
+                    return
+                while True:
+                    yield decoder.value()
+                    if decoder.expect(",]") == "]":
+                        return
+            if decoder.expect(",}") == "}":
+                return
@@ -0,0 +1,206 @@
+"""
+Exports of a user's ratings for a festival-year, without Streamlit.
+
+Used by the web app for a single session and by the batch export CLI for many
+users at once: ratings files, ICS calendars, clash reports and day-by-day plans.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from stagediver.common import format_festival_day, get_festival_day
+
+RATING_INFO = {
+    "❤️": {"text": "Must see", "short_name": "heart", "bg_color": "#ff4b4b"},
+    "🟢": {"text": "Yes", "short_name": "yes", "bg_color": "#177233"},
+    "🟡": {"text": "Meh", "short_name": "meh", "bg_color": "#ffa421"},
+    "🚫": {"text": "No", "short_name": "no", "bg_color": "#808080"},
+}
+# Ratings of artists the user does not want to see
+SKIPPED_RATINGS = {"🚫"}
+
+
+def ratings_to_export(ratings: Dict[str, str]) -> dict:
+    """
+    Convert ratings to the ratings file format.
+
+    Args:
+        ratings: Ratings by artist name
+
+    Returns:
+        Dict of sorted artist names by rating text, plus a timestamp
+    """
+    export_data = {
+        info["text"]: sorted(
+            artist for artist, rating in ratings.items() if rating == emoji
+        )
+        for emoji, info in RATING_INFO.items()
+    }
+    export_data["timestamp"] = datetime.now().isoformat()
+    return export_data
+
+
+def ratings_from_export(data: dict) -> Dict[str, str]:
+    """
+    Read ratings from the ratings file format.
+
+    Args:
+        data: Parsed ratings file
+
+    Returns:
+        Ratings by artist name
+    """
+    return {
+        artist: emoji
+        for emoji, info in RATING_INFO.items()
+        for artist in data.get(info["text"], [])
+    }
+
+
+def _set_times(artist: dict) -> Tuple[Optional[float], Optional[float]]:
+    """Start and end of a set as epoch seconds, if announced."""
+    if (start := artist.get("start_epoch")) is None and artist.get("start_ts"):
+        start = datetime.fromisoformat(artist["start_ts"]).timestamp()
+    if (end := artist.get("end_epoch")) is None and artist.get("end_ts"):
+        end = datetime.fromisoformat(artist["end_ts"]).timestamp()
+    return start, end
+
+
+def _planned_artists(artists: List[dict], ratings: Dict[str, str]) -> List[dict]:
+    return [
+        artist
+        for artist in artists
+        if artist["artist_name"] in ratings
+        and ratings[artist["artist_name"]] not in SKIPPED_RATINGS
+    ]
+
+
+def create_calendar_export(artists_data, ratings):
+    """Create ICS calendar with rated artists"""
+    # ics is slow to import and only needed once the user has rated artists
+    from ics import Calendar, Event
+
+    cal = Calendar()
+
+    # Only artists that have been rated and don't suck
+    for artist in _planned_artists(artists_data["artists"], ratings):
+        event = Event()
+        event.name = f"{ratings[artist['artist_name']]} {artist['artist_name']}"
+        # Parsed here, as ics parses ISO strings far more slowly
+        begin = datetime(artists_data["festival_year"], 7, 1, 13, 37)
+        if artist.get("start_ts"):
+            begin = datetime.fromisoformat(artist["start_ts"])
+        event.begin = begin
+        if artist.get("end_ts"):
+            event.end = datetime.fromisoformat(artist["end_ts"])
+        else:
+            event.end = begin + timedelta(hours=1)
+        event.url = artist.get("scrape_url", "")
+        event.location = artist.get("stage_name", "TBA")
+
+        description = artist.get("bio_short", "")
+        if spotify_url := (artist.get("social_links") or {}).get("spotify"):
+            description += f"\n\n▶️: {spotify_url}"
+        event.description = description
+
+        cal.events.add(event)
+    return cal
+
+
+def find_clashes(artists: List[dict], ratings: Dict[str, str]) -> List[dict]:
+    """
+    Find overlapping sets among the artists a user wants to see.
+
+    Args:
+        artists: The lineup's artists
+        ratings: Ratings by artist name
+
+    Returns:
+        List of clashes (artist, other_artist, their stages and ratings, and
+        overlap in minutes), by start time
+    """
+    timed = []
+    for artist in _planned_artists(artists, ratings):
+        start, end = _set_times(artist)
+        if start is not None:
+            timed.append((start, end if end is not None else start, artist))
+    timed.sort(key=lambda item: item[:2])
+
+    clashes = []
+    active = []
+    for start, end, artist in timed:
+        active = [item for item in active if item[1] > start]
+        for _, other_end, other in active:
+            clashes.append(
+                {
+                    "artist": other["artist_name"],
+                    "stage": other.get("stage_name") or "TBA",
+                    "rating": ratings[other["artist_name"]],
+                    "other_artist": artist["artist_name"],
+                    "other_stage": artist.get("stage_name") or "TBA",
+                    "other_rating": ratings[artist["artist_name"]],
+                    "overlap_minutes": round((min(end, other_end) - start) / 60),
+                }
+            )
+        active.append((start, end, artist))
+    return clashes
+
+
+def build_plan(lineup: dict, ratings: Dict[str, str]) -> str:
+    """
+    Write a user's day-by-day plan for a festival-year as Markdown.
+
+    Args:
+        lineup: Lineup dict, as saved by run_scraper
+        ratings: Ratings by artist name
+
+    Returns:
+        Markdown plan listing the wanted sets by festival day, with clashes
+    """
+    artists = lineup["artists"]
+    planned = _planned_artists(artists, ratings)
+    clashes = find_clashes(artists, ratings)
+    clashing = {}
+    for clash in clashes:
+        clashing.setdefault(clash["artist"], []).append(clash["other_artist"])
+        clashing.setdefault(clash["other_artist"], []).append(clash["artist"])
+
+    rated = sum(artist["artist_name"] in ratings for artist in artists)
+    lines = [
+        f"# {lineup['festival_name']} {lineup['festival_year']}",
+        "",
+        f"Rated {rated} of {len(artists)} artists: {len(planned)} sets planned, "
+        f"{len(clashes)} clashes.",
+    ]
+
+    by_day = {}
+    unscheduled = []
+    for artist in planned:
+        if not artist.get("start_ts"):
+            unscheduled.append(artist)
+            continue
+        start = datetime.fromisoformat(artist["start_ts"])
+        day = artist.get("festival_day") or get_festival_day(start)
+        by_day.setdefault(day, []).append((start, artist))
+
+    for day, sets in sorted(by_day.items()):
+        lines += ["", f"## {format_festival_day(day)}", ""]
+        for start, artist in sorted(sets, key=lambda item: item[0]):
+            name = artist["artist_name"]
+            end = artist.get("end_ts")
+            times = start.strftime("%H:%M")
+            if end:
+                times += "–" + datetime.fromisoformat(end).strftime("%H:%M")
+            stage = artist.get("stage_name") or "TBA"
+            line = f"- {times} {ratings[name]} {name} ({stage})"
+            if name in clashing:
+                line += f" ⚠️ clashes with {', '.join(clashing[name])}"
+            lines.append(line)
+
+    if unscheduled:
+        lines += ["", "## Not scheduled yet", ""]
+        lines += [
+            f"- {ratings[artist['artist_name']]} {artist['artist_name']}"
+            for artist in unscheduled
+        ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,137 @@
+"""
+Export calendars, clash reports and plans for many users' ratings at once.
+
+The lineup is parsed once and handed to each worker process when it starts, so
+every ratings file only costs its own parsing and the exports themselves.
+"""
+
+import csv
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from stagediver.common import load_json_file
+from stagediver.export import (
+    build_plan,
+    create_calendar_export,
+    find_clashes,
+    ratings_from_export,
+)
+
+CLASH_FIELDS = [
+    "artist",
+    "stage",
+    "rating",
+    "other_artist",
+    "other_stage",
+    "other_rating",
+    "overlap_minutes",
+]
+
+# Set in each worker process by _init_worker
+_lineup: Optional[dict] = None
+
+
+def _init_worker(lineup: dict) -> None:
+    global _lineup
+    _lineup = lineup
+
+
+def export_user(ratings_file: str, output_dir: str) -> Dict[str, object]:
+    """
+    Write one user's calendar, clash report and plan.
+
+    Args:
+        ratings_file: Ratings file in the web app's export format
+        output_dir: Directory for <user>.ics, <user>_clashes.csv and <user>_plan.md
+
+    Returns:
+        Summary row with the user's rating, planned set and clash counts
+    """
+    user = os.path.splitext(os.path.basename(ratings_file))[0]
+    try:
+        ratings = ratings_from_export(load_json_file(ratings_file))
+    except (ValueError, AttributeError) as e:
+        return {"user": user, "error": f"Invalid ratings file: {e}"}
+
+    artists = _lineup["artists"]
+    names = {artist["artist_name"] for artist in artists}
+    calendar = create_calendar_export(_lineup, ratings)
+    clashes = find_clashes(artists, ratings)
+
+    with open(os.path.join(output_dir, f"{user}.ics"), "w", encoding="utf-8") as f:
+        f.write(calendar.serialize())
+    with open(
+        os.path.join(output_dir, f"{user}_clashes.csv"),
+        "w",
+        newline="",
+        encoding="utf-8",
+    ) as f:
+        writer = csv.DictWriter(f, fieldnames=CLASH_FIELDS)
+        writer.writeheader()
+        writer.writerows(clashes)
+    with open(os.path.join(output_dir, f"{user}_plan.md"), "w", encoding="utf-8") as f:
+        f.write(build_plan(_lineup, ratings))
+
+    return {
+        "user": user,
+        "rated": sum(name in names for name in ratings),
+        "planned": len(calendar.events),
+        "clashes": len(clashes),
+        "error": "",
+    }
+
+
+def export_schedules(
+    lineup_file: str,
+    ratings_dir: str,
+    output_dir: str,
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, object]]:
+    """
+    Export schedules for every ratings file in a directory.
+
+    Args:
+        lineup_file: Lineup JSON file of the festival-year
+        ratings_dir: Directory of ratings files (*.json)
+        output_dir: Directory for the exports and summary.csv
+        max_workers: Worker processes (default: one per CPU)
+
+    Returns:
+        Summary rows, one per ratings file
+    """
+    lineup = load_json_file(lineup_file)
+    ratings_files = sorted(glob.glob(os.path.join(ratings_dir, "*.json")))
+    os.makedirs(output_dir, exist_ok=True)
+    workers = max_workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(lineup,)
+    ) as executor:
+        summary = list(
+            executor.map(
+                export_user,
+                ratings_files,
+                [output_dir] * len(ratings_files),
+                chunksize=max(1, len(ratings_files) // (4 * workers)),
+            )
+        )
+    elapsed = time.perf_counter() - start
+
+    with open(
+        os.path.join(output_dir, "summary.csv"), "w", newline="", encoding="utf-8"
+    ) as f:
+        writer = csv.DictWriter(
+            f, fieldnames=["user", "rated", "planned", "clashes", "error"]
+        )
+        writer.writeheader()
+        writer.writerows(summary)
+
+    print(
+        f"Exported {len(ratings_files)} schedules for {lineup['festival_name']} "
+        f"{lineup['festival_year']} to {output_dir} in {elapsed:.2f} s"
+    )
+    return summary
@@ -7,6 +7,8 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
+from stagediver.models.identity import ArtistIdentityIndex, normalize_name
+
 
 class ScrapedData(BaseModel):
     """Raw data scraped from festival websites"""
@@ -23,4 +25,8 @@ class ScrapedData(BaseModel):
     metadata: dict = Field(default_factory=dict)
 
 
-__all__ = ["ScrapedData"]
+__all__ = [
+    "ArtistIdentityIndex",
+    "ScrapedData",
+    "normalize_name",
+]
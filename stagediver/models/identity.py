@@ -0,0 +1,144 @@
+"""
+Cross-festival artist identity.
+
+The same act appears in several lineup files, sometimes spelled differently
+("The Smile" / "Smile", "Simon & Garfunkel" / "Simon and Garfunkel"). The
+identity index maps every performance to a canonical artist id, matching on
+Spotify artist id first and normalized name second (names never merge two
+different Spotify ids), so ratings and other per-artist data can be shared
+between festival-years.
+"""
+
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from stagediver.scraper.spotify import spotify_artist_id
+
+_NON_WORD = re.compile(r"\W+")
+
+# (festival name, festival year, position in the lineup's artists)
+PerformanceKey = Tuple[str, int, int]
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize an artist name for matching.
+
+    Case, accents, punctuation, "&" versus "and" and a leading "The" are
+    ignored.
+    """
+    text = unicodedata.normalize("NFKD", name.casefold())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = _NON_WORD.sub(" ", text.replace("&", " and ")).strip()
+    if text.startswith("the "):
+        text = text[4:]
+    # Names made only of punctuation (e.g. "!!!") are kept as they are
+    return text or name.casefold()
+
+
+class ArtistIdentityIndex:
+    """Canonical artist ids for every performance across lineups"""
+
+    def __init__(self):
+        self._by_spotify: Dict[str, str] = {}
+        self._by_name: Dict[str, str] = {}
+        # Canonical ids of each exact artist name, as resolved when registered
+        self._by_artist_name: Dict[str, List[str]] = {}
+        # Canonical ids that have a Spotify id, so names never merge two of them
+        self._with_spotify: Set[str] = set()
+        self.performances: Dict[PerformanceKey, str] = {}
+
+    @classmethod
+    def from_lineups(cls, lineups: Iterable[dict]) -> "ArtistIdentityIndex":
+        """Build the index in one pass over lineup dicts, as saved by run_scraper."""
+        index = cls()
+        for lineup in lineups:
+            for position, artist in enumerate(lineup.get("artists", [])):
+                key = (lineup["festival_name"], lineup["festival_year"], position)
+                index.performances[key] = index.add(artist)
+        return index
+
+    def add(self, artist: dict) -> str:
+        """
+        Register an artist and return its canonical id.
+
+        Args:
+            artist: Artist record with artist_name and optional social_links
+
+        Returns:
+            Canonical id shared by every record of the same artist
+        """
+        spotify_id = spotify_artist_id(artist)
+        name = normalize_name(artist["artist_name"])
+
+        canonical_id = self._match(spotify_id, name)
+        if canonical_id is None:
+            canonical_id = f"spotify:{spotify_id}" if spotify_id else f"name:{name}"
+
+        if spotify_id:
+            self._by_spotify.setdefault(spotify_id, canonical_id)
+            self._with_spotify.add(canonical_id)
+        self._by_name.setdefault(name, canonical_id)
+        same_name = self._by_artist_name.setdefault(artist["artist_name"], [])
+        if canonical_id not in same_name:
+            same_name.append(canonical_id)
+        return canonical_id
+
+    def _match(self, spotify_id: Optional[str], name: str) -> Optional[str]:
+        """
+        Canonical id of a known artist, by Spotify id first and name second.
+
+        Two different Spotify ids are two different acts, however alike their
+        names: a name only matches when one of the two sides has no Spotify id.
+        """
+        if spotify_id and (canonical_id := self._by_spotify.get(spotify_id)):
+            return canonical_id
+        canonical_id = self._by_name.get(name)
+        if spotify_id and canonical_id in self._with_spotify:
+            return None
+        return canonical_id
+
+    def lookup(self, artist: dict) -> Optional[str]:
+        """Get an artist's canonical id without registering it."""
+        return self._match(
+            spotify_artist_id(artist), normalize_name(artist["artist_name"])
+        )
+
+    def lookup_name(self, name: str) -> Optional[str]:
+        """Get the canonical id of an artist name."""
+        return self._by_name.get(normalize_name(name))
+
+    def carry_over(
+        self, ratings: Dict[str, str], festival: str, year: int, artists: list
+    ) -> Dict[str, str]:
+        """
+        Find ratings of the same artists given at other festival-years.
+
+        Args:
+            ratings: The user's ratings by artist name
+            festival: Festival name of the lineup
+            year: Festival year of the lineup
+            artists: The lineup's artists
+
+        Returns:
+            Dict of rating by artist name, for unrated artists in the lineup
+            whose canonical artist was rated under another name
+        """
+        rated = {}
+        for name, rating in ratings.items():
+            # Records registered under the exact name were matched by Spotify id
+            canonical_ids = self._by_artist_name.get(name) or [self.lookup_name(name)]
+            for canonical_id in canonical_ids:
+                if canonical_id:
+                    rated.setdefault(canonical_id, rating)
+
+        carried = {}
+        for position, artist in enumerate(artists):
+            name = artist["artist_name"]
+            if name in ratings:
+                continue
+            canonical_id = self.performances.get((festival, year, position))
+            if canonical_id in rated:
+                carried[name] = rated[canonical_id]
+        return carried
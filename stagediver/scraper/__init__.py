@@ -10,7 +10,20 @@ Contains:
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
-from stagediver.common import save_json_file
+from stagediver.common import get_festival_day, save_json_file
+from stagediver.scraper.similarity import add_similar_artists
+from stagediver.scraper.spotify import (
+    MetadataSource,
+    apply_cached_metadata,
+    enrich_spotify,
+    load_cache,
+)
+from stagediver.scraper.tagging import build_tag_index, tag_artists
+from stagediver.scraper.validation import (
+    FAIL_THRESHOLDS,
+    WARN_THRESHOLDS,
+    validate_artists,
+)
 
 
 def transform_artist_data(raw_data: dict) -> dict:
@@ -33,12 +46,91 @@ def transform_artist_data(raw_data: dict) -> dict:
     }
 
 
-def run_scraper(scraper, sample_size: Optional[int] = None) -> None:
+def get_performance_times(
+    start_ts: Optional[datetime], end_ts: Optional[datetime]
+) -> dict:
+    """Epoch seconds and festival day of a set, so readers need not parse ISO strings.
+
+    Args:
+        start_ts: Timezone-aware start time, or None if not announced
+        end_ts: Timezone-aware end time, or None if not announced
+
+    Returns:
+        Dict with start_epoch, end_epoch and festival_day (None when unknown)
+    """
+    return {
+        "start_epoch": int(start_ts.timestamp()) if start_ts else None,
+        "end_epoch": int(end_ts.timestamp()) if end_ts else None,
+        "festival_day": get_festival_day(start_ts) if start_ts else None,
+    }
+
+
+def add_performance_times(artists: List[dict]) -> None:
+    """Add epoch and festival day fields to lineups scraped before they existed."""
+    for artist in artists:
+        if "start_epoch" in artist:
+            continue
+        start_ts, end_ts = artist.get("start_ts"), artist.get("end_ts")
+        artist.update(
+            get_performance_times(
+                datetime.fromisoformat(start_ts) if start_ts else None,
+                datetime.fromisoformat(end_ts) if end_ts else None,
+            )
+        )
+
+
+def enrich_lineup(
+    lineup: dict, spotify_source: Optional[MetadataSource] = None, **spotify_options
+) -> None:
+    """Add offline enrichments (similar artists, genre/mood tags) to a lineup.
+
+    Args:
+        lineup: Lineup dict as saved by run_scraper (modified in place)
+        spotify_source: Optional source of Spotify metadata to add as well
+        **spotify_options: Cache, batching and concurrency options for
+            enrich_spotify
+    """
+    add_performance_times(lineup["artists"])
+
+    if spotify_source:
+        report = enrich_spotify(lineup["artists"], spotify_source, **spotify_options)
+        print(
+            f"Spotify metadata for {report['artists']} artists: "
+            f"{report['cache_hits']} cached ({report['hit_rate']:.0%} hit rate), "
+            f"{report['fetched']} fetched in {report['requests']} requests "
+            f"(batch size {report['batch_size']}, {report['max_workers']} workers)"
+        )
+
+    # Precompute similar artists so the web app can re-rank without the bios
+    add_similar_artists(lineup["artists"])
+
+    stats = tag_artists(lineup["artists"])
+    print(f"Tagged {stats['tagged']} artists ({stats['cached']} from cache)")
+    lineup["tag_index"] = build_tag_index(lineup["artists"])
+
+
+def run_scraper(
+    scraper,
+    sample_size: Optional[int] = None,
+    fail_thresholds: Optional[Dict[str, float]] = None,
+    **fetch_options,
+) -> str:
     """Run a scraper and save results.
 
     Args:
         scraper: The scraper instance with festival_id, festival_name, festival_year
         sample_size: Optional maximum number of artists to fetch
+        fail_thresholds: Largest share of artists with each data-quality
+            problem before the scrape is rejected (default: FAIL_THRESHOLDS)
+        **fetch_options: Concurrency options for the scraper's fetch_lineup
+            (fetch_workers, parse_workers)
+
+    Returns:
+        Path of the saved lineup file
+
+    Raises:
+        ValueError: If the scraped artists exceed a fail threshold; the saved
+            lineup file is left as it was
     """
     print(f"Running {scraper.__class__.__name__}...")
 
@@ -48,12 +140,22 @@ def run_scraper(scraper, sample_size: Optional[int] = None) -> None:
     file_path = f"{DATA_DIR}/{scraper.festival_id}.json"
 
     # Get lineup data
-    lineup_data = scraper.fetch_lineup(sample_size=sample_size)
+    lineup_data = scraper.fetch_lineup(sample_size=sample_size, **fetch_options)
+
+    report = validate_artists(lineup_data.raw_content["artists"])
+    print(report.summary())
+    for problem in report.exceeded(WARN_THRESHOLDS):
+        print(f"Warning: {problem}")
+    if failed := report.exceeded(
+        FAIL_THRESHOLDS if fail_thresholds is None else fail_thresholds
+    ):
+        raise ValueError(f"Rejected {scraper.festival_id} scrape: {'; '.join(failed)}")
 
     # Convert ScrapedData to dictionary format
     new_lineup = {
         "festival_name": lineup_data.festival_name,
         "festival_year": scraper.festival_year,
+        "timezone": scraper.timezone,
         "scrape_ts": datetime.utcnow().isoformat(),
         "artists": [],
     }
@@ -61,14 +163,14 @@ def run_scraper(scraper, sample_size: Optional[int] = None) -> None:
     # Process each artist from raw content
     for artist_data in lineup_data.raw_content["artists"]:
         start_ts = artist_data.get("start_ts")
+        # assume 1 hour performance if no end_ts is provided
+        end_ts = start_ts + timedelta(hours=1) if start_ts else None
         artist = {
             "artist_name": artist_data["name"],
             "stage_name": artist_data.get("stage", ""),
             "start_ts": start_ts.isoformat() if start_ts else None,
-            # assume 1 hour performance if no end_ts is provided
-            "end_ts": (
-                (start_ts + timedelta(hours=1)).isoformat() if start_ts else None
-            ),
+            "end_ts": end_ts.isoformat() if end_ts else None,
+            **get_performance_times(start_ts, end_ts),
             "social_links": (
                 {"spotify": artist_data.get("spotify_link")}
                 if artist_data.get("spotify_link")
@@ -82,6 +184,11 @@ def run_scraper(scraper, sample_size: Optional[int] = None) -> None:
         }
         new_lineup["artists"].append(artist)
 
+    # Scraping fetches no Spotify metadata; keep what earlier enrich runs cached
+    apply_cached_metadata(new_lineup["artists"], load_cache())
+    enrich_lineup(new_lineup)
+
     # Save to file
     save_json_file(new_lineup, file_path)
     print(f"Saved {len(new_lineup['artists'])} artists to {file_path}")
+    return file_path
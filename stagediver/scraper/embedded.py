@@ -0,0 +1,258 @@
+"""
+Lineup data embedded in festival program pages.
+
+Framework-rendered sites (Next.js and the like) ship the data of the whole page
+as JSON in a script tag, e.g. ``<script id="__NEXT_DATA__">``. Reading artist
+records from it takes one request instead of one per artist page.
+
+The payload's layout is not documented and changes between site versions, so
+records are found by structure rather than by path: any JSON object with a
+URL or slug pointing at one of the program's artist pages is that artist's
+record, and its fields are looked up by a list of likely key names. Scrapers
+fetch artist pages only for the fields a record does not have a value for.
+"""
+
+import json
+import re
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+# Fields of the artist details dict returned by scrapers' parse_artist_page
+DETAIL_FIELDS = (
+    "performance_date",
+    "stage",
+    "start_ts",
+    "short_description",
+    "long_description",
+    "spotify_link",
+    "country_code",
+)
+
+# Likely key names for each field in embedded records, in order of preference
+URL_KEYS = ("url", "href", "path", "slug", "link")
+STAGE_KEYS = ("stage", "stageName", "location", "venue", "scene")
+START_KEYS = ("startTime", "start", "startDate", "startsAt", "startDateTime")
+SHORT_DESCRIPTION_KEYS = ("subtitle", "teaser", "shortDescription", "headline")
+LONG_DESCRIPTION_KEYS = ("longDescription", "description", "body", "text")
+COUNTRY_KEYS = ("countryCode", "countryCodes", "country", "countries", "nationality")
+NAME_KEYS = ("title", "name", "label")
+
+_SPOTIFY_ARTIST_URL = re.compile(r"https?://open\.spotify\.com/artist/[A-Za-z0-9]+")
+
+
+def extract_embedded_data(html: str) -> Optional[dict]:
+    """
+    Get the JSON payload embedded in a page.
+
+    Args:
+        html: Page HTML
+
+    Returns:
+        The ``__NEXT_DATA__`` payload, or else the largest JSON script on the
+        page, or None if there is none
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    if script := soup.find("script", id="__NEXT_DATA__"):
+        candidates = [script]
+    else:
+        candidates = soup.find_all("script", type=re.compile(r"json"))
+
+    payloads = []
+    for script in candidates:
+        try:
+            payloads.append(json.loads(script.string or ""))
+        except ValueError:
+            continue
+    if not payloads:
+        return None
+    return max(payloads, key=lambda payload: len(json.dumps(payload)))
+
+
+def _walk(node) -> Iterator[dict]:
+    """Every JSON object in a payload, depth first."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            yield node
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+
+
+def _url_key(url: str) -> str:
+    """Normalize an absolute or relative URL (or bare slug) for matching."""
+    return urlparse(url).path.rstrip("/").rsplit("/", 1)[-1].lower()
+
+
+def find_artist_records(payload: dict, artist_urls: Iterable[str]) -> Dict[str, dict]:
+    """
+    Find the embedded record of each artist page.
+
+    Args:
+        payload: Embedded JSON payload
+        artist_urls: URLs of the program's artist pages
+
+    Returns:
+        Dict of record by artist URL, for the artists that have one
+    """
+    urls_by_key = {_url_key(url): url for url in artist_urls if url}
+    records = {}
+    for node in _walk(payload):
+        for key in URL_KEYS:
+            value = node.get(key)
+            if isinstance(value, str) and (url := urls_by_key.get(_url_key(value))):
+                # Links to an artist can appear in other records too; the
+                # artist's own record is the one with the most fields
+                if len(node) > len(records.get(url, ())):
+                    records[url] = node
+                break
+    return records
+
+
+def _objects(value) -> Iterator[dict]:
+    """JSON objects directly in a value, looking through lists."""
+    if isinstance(value, dict):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            yield from _objects(item)
+
+
+def _find(record: dict, keys: Iterable[str]):
+    """
+    Value of the first of keys found in a record, nearest objects first.
+
+    Nested objects are searched one level at a time, so a key of the record
+    itself wins over the same key deeper down. Nested objects with a URL of
+    their own (images, links, other records) describe something else and are
+    not searched, e.g. an image's description is not the artist's.
+    """
+    level = [record]
+    while level:
+        for key in keys:
+            for node in level:
+                if key in node:
+                    return node[key]
+        level = [
+            child
+            for node in level
+            for value in node.values()
+            for child in _objects(value)
+            if not any(url_key in child for url_key in URL_KEYS)
+        ]
+    raise KeyError(keys)
+
+
+def _as_text(value) -> Optional[str]:
+    """Text of a plain, rich-text (HTML) or named ({"title": ...}) value."""
+    if isinstance(value, dict):
+        value = next((value[key] for key in NAME_KEYS if key in value), None)
+    if not isinstance(value, str):
+        return None
+    if "<" in value:
+        soup = BeautifulSoup(value, "html.parser")
+        for br in soup.find_all("br"):
+            br.replace_with("\n")
+        for p in soup.find_all("p"):
+            p.append("\n")
+        value = soup.get_text()
+    return value.strip() or None
+
+
+def _as_codes(value) -> Optional[List[str]]:
+    if isinstance(value, list):
+        codes = [text for item in value if (text := _as_text(item))]
+    else:
+        codes = [code.strip() for code in (_as_text(value) or "").split("/")]
+    return [code for code in codes if code] or None
+
+
+def record_details(
+    record: dict, localize: Callable[[datetime], datetime]
+) -> Dict[str, object]:
+    """
+    Read artist details from an embedded record.
+
+    Args:
+        record: Embedded artist record
+        localize: Attaches the festival's timezone to naive local times
+
+    Returns:
+        The DETAIL_FIELDS the record has a value for; empty and missing fields
+        are left out, so they can be fetched from the artist page instead
+    """
+    details = {}
+    try:
+        start = _find(record, START_KEYS)
+    except KeyError:
+        pass
+    else:
+        start_ts = None
+        if isinstance(start, str) and start:
+            try:
+                start_ts = datetime.fromisoformat(start.replace("Z", "+00:00"))
+            except ValueError:
+                start_ts = None
+        if start_ts is not None:
+            if start_ts.tzinfo is None:
+                start_ts = localize(start_ts)
+            details["start_ts"] = start_ts
+            # The calendar date of the set, as in the scrapers' DATE_MAPPING
+            details["performance_date"] = start_ts.date().isoformat()
+
+    for field, keys in (
+        ("stage", STAGE_KEYS),
+        ("short_description", SHORT_DESCRIPTION_KEYS),
+        ("long_description", LONG_DESCRIPTION_KEYS),
+    ):
+        try:
+            if text := _as_text(_find(record, keys)):
+                details[field] = text
+        except KeyError:
+            continue
+
+    try:
+        if codes := _as_codes(_find(record, COUNTRY_KEYS)):
+            details["country_code"] = codes
+    except KeyError:
+        pass
+
+    # Spotify links can sit under any key, e.g. in a list of social links
+    for node in _walk(record):
+        for value in node.values():
+            if isinstance(value, str) and (match := _SPOTIFY_ARTIST_URL.match(value)):
+                details["spotify_link"] = match.group(0)
+                break
+        if "spotify_link" in details:
+            break
+    return details
+
+
+def embedded_artist_details(
+    html: str, artist_urls: List[str], localize: Callable[[datetime], datetime]
+) -> Dict[str, Dict[str, object]]:
+    """
+    Read the details of a program's artists from the page's embedded data.
+
+    Only fields with a value are returned: a record without a set time or a
+    Spotify link says nothing about whether the artist page has one.
+
+    Args:
+        html: Program page HTML
+        artist_urls: URLs of the program's artist pages
+        localize: Attaches the festival's timezone to naive local times
+
+    Returns:
+        Dict of (possibly partial) details by artist URL, for the artists
+        with an embedded record
+    """
+    if (payload := extract_embedded_data(html)) is None:
+        return {}
+    return {
+        url: record_details(record, localize)
+        for url, record in find_artist_records(payload, artist_urls).items()
+    }
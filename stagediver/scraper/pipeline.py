@@ -0,0 +1,179 @@
+"""
+Pipelined fetching and parsing of many pages.
+
+Fetching is I/O-bound, but parsing with BeautifulSoup is CPU-bound and holds
+the GIL, so the two run as separate stages: fetch threads put pages on a
+bounded queue, a process pool parses them, and a single writer hands the
+results back in input order. When parsing falls behind, the full queue blocks
+the fetchers (backpressure), so memory stays bounded however long the lineup.
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+FETCH_WORKERS = 8
+QUEUE_SIZE = 16
+
+
+def _timed_parse(parse: Callable[[Any], Any], page: Any) -> Tuple[Any, float]:
+    """Parse a page in a worker and measure how long it took."""
+    start = time.perf_counter()
+    return parse(page), time.perf_counter() - start
+
+
+def _stage(workers: int) -> Dict[str, float]:
+    return {"workers": workers, "items": 0, "busy": 0.0, "blocked": 0.0}
+
+
+def run_pipeline(
+    items: Sequence[Any],
+    fetch: Callable[[Any], Any],
+    parse: Callable[[Any], Any],
+    fetch_workers: int = FETCH_WORKERS,
+    parse_workers: Optional[int] = None,
+    queue_size: int = QUEUE_SIZE,
+) -> Tuple[List[Any], Dict[str, Any]]:
+    """
+    Fetch and parse items in a pipeline.
+
+    Args:
+        items: Items to process, e.g. URLs
+        fetch: Fetches one item (called in fetch threads)
+        parse: Parses one fetched page; must be picklable, as it runs in
+            worker processes
+        fetch_workers: Fetch threads
+        parse_workers: Parse processes (default: one per CPU); 0 parses in a
+            thread of this process instead
+        queue_size: Fetched pages that may wait for parsing before the fetch
+            threads block
+
+    Returns:
+        Tuple of the parsed results in input order and metrics per stage
+        (workers, items, busy and blocked seconds, items per second), the
+        largest queue depth and elapsed time
+
+    Raises:
+        Exception: The first error raised by fetch or parse; the pipeline is
+            stopped
+    """
+    if parse_workers is None:
+        parse_workers = os.cpu_count() or 1
+    metrics = {
+        "fetch": _stage(fetch_workers),
+        "parse": _stage(parse_workers),
+        "write": _stage(1),
+        "max_queue": 0,
+    }
+    todo = queue.Queue()
+    for index, item in enumerate(items):
+        todo.put((index, item))
+    pages = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    lock = threading.Lock()
+
+    def fetcher():
+        while not stop.is_set():
+            try:
+                index, item = todo.get_nowait()
+            except queue.Empty:
+                return
+            start = time.perf_counter()
+            try:
+                entry = (index, fetch(item), None)
+            except Exception as e:
+                entry = (index, None, e)
+            fetched = time.perf_counter()
+            # Blocks while the queue is full, unless the pipeline is stopped
+            while not stop.is_set():
+                try:
+                    pages.put(entry, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            with lock:
+                stage = metrics["fetch"]
+                stage["items"] += 1
+                stage["busy"] += fetched - start
+                stage["blocked"] += time.perf_counter() - fetched
+                metrics["max_queue"] = max(metrics["max_queue"], pages.qsize())
+
+    results = [None] * len(items)
+    in_flight = {}
+    finished = {}
+    next_index = 0
+
+    def write(done):
+        """Collect finished parses and hand them on in input order."""
+        nonlocal next_index
+        for future in done:
+            index = in_flight.pop(future)
+            result, seconds = future.result()
+            metrics["parse"]["items"] += 1
+            metrics["parse"]["busy"] += seconds
+            finished[index] = result
+        start = time.perf_counter()
+        while next_index in finished:
+            results[next_index] = finished.pop(next_index)
+            next_index += 1
+            metrics["write"]["items"] += 1
+        metrics["write"]["busy"] += time.perf_counter() - start
+
+    start = time.perf_counter()
+    fetch_pool = ThreadPoolExecutor(
+        max_workers=fetch_workers, thread_name_prefix="fetch"
+    )
+    parse_pool = (
+        ProcessPoolExecutor(max_workers=parse_workers)
+        if parse_workers
+        else ThreadPoolExecutor(max_workers=1)
+    )
+    with fetch_pool, parse_pool:
+        try:
+            for _ in range(fetch_workers):
+                fetch_pool.submit(fetcher)
+            for _ in range(len(items)):
+                waited = time.perf_counter()
+                index, page, error = pages.get()
+                metrics["parse"]["blocked"] += time.perf_counter() - waited
+                if error is not None:
+                    raise error
+                in_flight[parse_pool.submit(_timed_parse, parse, page)] = index
+                # Parse at most two pages per worker ahead of the writer
+                if len(in_flight) >= 2 * max(parse_workers, 1):
+                    write(wait(in_flight, return_when=FIRST_COMPLETED).done)
+            while in_flight:
+                write(wait(in_flight, return_when=FIRST_COMPLETED).done)
+        except BaseException:
+            stop.set()
+            for future in in_flight:
+                future.cancel()
+            raise
+
+    elapsed = time.perf_counter() - start
+    metrics["elapsed"] = elapsed
+    for name in ("fetch", "parse", "write"):
+        metrics[name]["rate"] = metrics[name]["items"] / elapsed if elapsed else 0.0
+    return results, metrics
+
+
+def format_metrics(metrics: Dict[str, Any]) -> str:
+    """Describe pipeline metrics in one line per stage."""
+    lines = [f"Pipeline finished in {metrics['elapsed']:.2f} s"]
+    for name in ("fetch", "parse", "write"):
+        stage = metrics[name]
+        lines.append(
+            f"  {name}: {stage['items']} items, {stage['rate']:.1f}/s with "
+            f"{stage['workers']} workers ({stage['busy']:.2f} s busy, "
+            f"{stage['blocked']:.2f} s waiting)"
+        )
+    lines.append(f"  largest queue: {metrics['max_queue']} pages")
+    return "\n".join(lines)
@@ -0,0 +1,169 @@
+"""
+Scheduled background refresh of festival lineups.
+
+Each festival-year is scraped on its own cadence, more often as the festival
+gets closer and most often while it is on. Due scrapes run one after another;
+lineup files are replaced atomically, so the web app (which checks the files
+for changes) reloads only the festival-years that changed.
+
+The clock and the scraper classes are injectable, so tests can drive the
+scheduler with a fake clock and scrapers that never touch the network.
+"""
+
+import heapq
+import inspect
+import time
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from stagediver.scraper import run_scraper
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Retry failed scrapes sooner than their normal cadence, but not right away
+RETRY_INTERVAL = 15 * MINUTE
+
+
+class SystemClock:
+    """Wall clock time"""
+
+    def now(self) -> float:
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+
+class FakeClock:
+    """Clock that only moves when slept on, for tests"""
+
+    def __init__(self, start: float = 0.0):
+        self.time = start
+
+    def now(self) -> float:
+        return self.time
+
+    def sleep(self, seconds: float) -> None:
+        self.time += seconds
+
+
+def refresh_interval(today: date, festival_dates: Optional[Tuple[date, date]]) -> float:
+    """
+    Get how often a festival-year's lineup should be refreshed.
+
+    Args:
+        today: Current date
+        festival_dates: First and last festival date, if known
+
+    Returns:
+        Seconds until the next refresh
+    """
+    if not festival_dates:
+        return DAY
+    start, end = festival_dates
+    if start <= today <= end:
+        return 15 * MINUTE  # Last-minute changes while the festival is on
+    if today > end:
+        return 7 * DAY  # Only the odd correction after the festival
+    days_left = (start - today).days
+    if days_left <= 7:
+        return HOUR
+    if days_left <= 60:
+        return 6 * HOUR
+    return DAY
+
+
+def available_scrapers() -> Dict[str, Type]:
+    """Get the concrete scraper classes by name."""
+    from stagediver.scraper import scraper
+
+    return {
+        name: cls
+        for name, cls in inspect.getmembers(scraper, inspect.isclass)
+        if cls.__module__ == scraper.__name__ and not cls.__subclasses__()
+    }
+
+
+class LineupScheduler:
+    """Refresh festival lineups on per-festival cadences"""
+
+    def __init__(
+        self,
+        scraper_classes: List[Type],
+        clock=None,
+        scrape: Callable[[object], str] = run_scraper,
+        on_refresh: Optional[Callable[[str, float], None]] = None,
+    ):
+        """
+        Args:
+            scraper_classes: Scraper classes to refresh
+            clock: Clock with now() and sleep() (default: SystemClock())
+            scrape: Function that runs a scraper and saves its lineup
+            on_refresh: Optional: Called with festival ID and time after each
+                refresh
+        """
+        self.clock = clock or SystemClock()
+        self.scrape = scrape
+        self.on_refresh = on_refresh
+        self.history: List[Tuple[float, str, bool]] = []
+
+        # Everything is due straight away; ties go by class name
+        now = self.clock.now()
+        self._queue = [(now, cls.__name__, cls) for cls in scraper_classes]
+        heapq.heapify(self._queue)
+
+    def _refresh(self, scraper_class: Type) -> str:
+        scraper = scraper_class()
+        self.scrape(scraper)
+        return scraper.festival_id
+
+    def run_pending(self) -> int:
+        """
+        Run every scrape that is due, one at a time, and schedule the next runs.
+
+        Returns:
+            Number of scrapes run
+        """
+        now = self.clock.now()
+        due = []
+        while self._queue and self._queue[0][0] <= now:
+            due.append(heapq.heappop(self._queue)[2])
+        if not due:
+            return 0
+
+        today = datetime.fromtimestamp(now).date()
+        # Not in threads: scrapes share the tag cache file, and each parses
+        # artist pages in a process pool of its own
+        for cls in due:
+            interval = refresh_interval(today, cls.festival_dates())
+            try:
+                festival_id = self._refresh(cls)
+            except Exception as e:
+                print(f"Refreshing {cls.__name__} failed: {e}")
+                self.history.append((now, cls.__name__, False))
+                interval = min(interval, RETRY_INTERVAL)
+            else:
+                if self.on_refresh:
+                    self.on_refresh(festival_id, self.clock.now())
+                self.history.append((now, cls.__name__, True))
+            heapq.heappush(self._queue, (now + interval, cls.__name__, cls))
+            print(f"Next refresh of {cls.__name__} in {interval / HOUR:g} hours")
+        return len(due)
+
+    def run(self, until: Optional[float] = None) -> None:
+        """
+        Keep refreshing lineups.
+
+        Args:
+            until: Stop at this time (default: run forever)
+        """
+        while until is None or self.clock.now() < until:
+            self.run_pending()
+            if not self._queue:
+                return
+            wake_at = self._queue[0][0]
+            if until is not None:
+                wake_at = min(wake_at, until)
+            self.clock.sleep(max(0.0, wake_at - self.clock.now()))
@@ -6,19 +6,32 @@ Each scraper inherits from BaseFestivalScraper and implements festival-specific
 """
 
 import re
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import threading
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import pytz
 import requests
 from bs4 import BeautifulSoup
 
 from stagediver.models import ScrapedData
+from stagediver.scraper.embedded import DETAIL_FIELDS, embedded_artist_details
+from stagediver.scraper.pipeline import FETCH_WORKERS, format_metrics, run_pipeline
+
+
+@lru_cache(maxsize=None)
+def _get_zone(name: str) -> pytz.BaseTzInfo:
+    """Look up a pytz zone once, instead of for every localized set time."""
+    return pytz.timezone(name)
 
 
 class BaseFestivalScraper:
     """Base class for all festival scrapers with common functionality."""
 
+    # IANA timezone of the festival; times on festival websites are local
+    timezone: str = "UTC"
+
     def __init__(self):
         self.festival_name: str
         self.festival_year: int
@@ -32,34 +45,45 @@ class BaseFestivalScraper:
         normalized_name = self.festival_name.lower().replace(" ", "_")
         return f"{normalized_name}__{self.festival_year}"
 
+    @classmethod
+    def localize(cls, local_time: datetime) -> datetime:
+        """Attach the festival's timezone to a naive local time."""
+        return _get_zone(cls.timezone).localize(local_time)
 
-class RoskildeFestival2025Scraper(BaseFestivalScraper):
+    @classmethod
+    def festival_dates(cls) -> Optional[Tuple[date, date]]:
+        """First and last festival date, if known without scraping."""
+        return None
+
+
+class RoskildeFestivalScraper(BaseFestivalScraper):
     """
-    Scraper for Roskilde Festival 2025 lineup and schedule.
+    Shared scraper logic for Roskilde Festival lineups.
+
+    Subclasses set the festival year, program page and DATE_MAPPING of the
+    Danish day labels used on the artist pages that year.
     """
 
-    # Mapping of Danish dates to ISO format dates for Roskilde Festival 2025
-    DATE_MAPPING = {
-        "søndag 29. juni": "2025-06-29",
-        "mandag 30. juni": "2025-06-30",
-        "tirsdag 1. juli": "2025-07-01",
-        "onsdag 2. juli": "2025-07-02",
-        "torsdag 3. juli": "2025-07-03",
-        "fredag 4. juli": "2025-07-04",
-        "lørdag 5. juli": "2025-07-05",
-        "onsdag nat 2. juli*": "2025-07-03",
-        "torsdag nat 3. juli*": "2025-07-04",
-        "fredag nat 4. juli*": "2025-07-05",
-        "lørdag nat 5. juli*": "2025-07-06",
-    }
+    timezone = "Europe/Copenhagen"
+    base_url = "https://www.roskilde-festival.dk"
+    program_path = "/program"
+    DATE_MAPPING: Dict[str, str] = {}
 
     def __init__(self):
+        super().__init__()
         self.festival_name = "Roskilde Festival"
-        self.festival_year = 2025
-        self.base_url = "https://www.roskilde-festival.dk"
-        self.program_url = f"{self.base_url}/program"
+        self.program_url = f"{self.base_url}{self.program_path}"
         self.session = requests.Session()
         self._setup_cookies()
+        self._local = threading.local()
+
+    @classmethod
+    def festival_dates(cls) -> Optional[Tuple[date, date]]:
+        """First and last festival date, from the dates in DATE_MAPPING."""
+        if not cls.DATE_MAPPING:
+            return None
+        dates = sorted(cls.DATE_MAPPING.values())
+        return date.fromisoformat(dates[0]), date.fromisoformat(dates[-1])
 
     def _setup_cookies(self):
         """Setup cookies to accept all cookie categories."""
@@ -72,17 +96,31 @@ class RoskildeFestival2025Scraper(BaseFestivalScraper):
         # Make an initial request to set cookies
         self.session.get(self.base_url)
 
+    def _get_session(self) -> requests.Session:
+        """Session of the current fetch thread, with the consent cookies set."""
+        if (session := getattr(self._local, "session", None)) is None:
+            session = self._local.session = requests.Session()
+            session.cookies.update(self.session.cookies)
+        return session
+
+    def _fetch_page(self, url: str) -> str:
+        """Fetch a page's HTML (runs in fetch threads)."""
+        return self._get_session().get(url).text
+
+    @staticmethod
     def _find_element(
-        self, soup: BeautifulSoup, class_pattern: str
+        soup: BeautifulSoup, class_pattern: str
     ) -> Optional[BeautifulSoup]:
         """Helper method to find elements by class pattern."""
         return soup.find("div", class_=lambda c: c and class_pattern in c)
 
-    def _get_text(self, element: Optional[BeautifulSoup]) -> Optional[str]:
+    @staticmethod
+    def _get_text(element: Optional[BeautifulSoup]) -> Optional[str]:
         """Helper method to safely get text from an element."""
         return element.text.strip() if element else None
 
-    def _parse_stage_info(self, stage_info: str) -> List[Dict[str, str]]:
+    @staticmethod
+    def _parse_stage_info(stage_info: str) -> List[Dict[str, str]]:
         """Parse stage information into time and stage name pairs."""
         if not stage_info:
             return []
@@ -94,8 +132,9 @@ class RoskildeFestival2025Scraper(BaseFestivalScraper):
                 stage_times.append({"time": time, "stage": stage})
         return stage_times
 
+    @classmethod
     def _get_start_timestamp(
-        self, date: str, stage_times: List[Dict[str, str]]
+        cls, date: str, stage_times: List[Dict[str, str]]
     ) -> Optional[datetime]:
         """Convert date and time to timezone-aware datetime object."""
         if not (date and stage_times):
@@ -103,25 +142,35 @@ class RoskildeFestival2025Scraper(BaseFestivalScraper):
 
         try:
             time_str = stage_times[0]["time"].replace(".", ":")
-            # Create datetime in Denmark's timezone (CET/CEST)
-            denmark_tz = pytz.timezone("Europe/Copenhagen")
-            dt = datetime.fromisoformat(f"{date}T{time_str}:00")
-            return denmark_tz.localize(dt)
+            return cls.localize(datetime.fromisoformat(f"{date}T{time_str}:00"))
         except ValueError:
             return None
 
-    def fetch_lineup(self, sample_size=None) -> ScrapedData:
+    def fetch_lineup(
+        self,
+        sample_size=None,
+        fetch_workers: int = FETCH_WORKERS,
+        parse_workers: Optional[int] = None,
+    ) -> ScrapedData:
         """
         Fetch the festival lineup from the website.
 
+        Artist details are read from the data embedded in the program page
+        where it has them. The remaining artist pages are fetched and parsed in
+        a pipeline: fetch threads feed parse worker processes through a
+        bounded queue.
+
         Args:
             sample_size: Maximum number of artists to fetch. If None, fetches all artists.
+            fetch_workers: Artist pages fetched at once
+            parse_workers: Processes parsing artist pages (default: one per CPU)
 
         Returns:
             ScrapedData: Raw scraped data including artist links and basic info
         """
         print("Fetching program page...")
-        soup = BeautifulSoup(self.session.get(self.program_url).text, "html.parser")
+        html = self.session.get(self.program_url).text
+        soup = BeautifulSoup(html, "html.parser")
         artist_cards = (
             soup.find_all("div", class_=re.compile(r"artistCard"))[:sample_size]
             if sample_size
@@ -129,9 +178,8 @@ class RoskildeFestival2025Scraper(BaseFestivalScraper):
         )
 
         print(f"Processing {len(artist_cards)} artists")
-        artists_data = []
-
-        for i, card in enumerate(artist_cards, 1):
+        artists = []
+        for card in artist_cards:
             if link_element := card.find("a"):
                 href = link_element.get("href", "")
                 full_url = self.base_url + href if href else ""
@@ -140,16 +188,40 @@ class RoskildeFestival2025Scraper(BaseFestivalScraper):
                     "div", class_=lambda c: c and "card_content" in c
                 ):
                     if name := self._get_text(content_div.find("h2")):
-                        print(
-                            f"Fetching details for {name} ({i}/{len(artist_cards)})..."
-                        )
-                        artists_data.append(
-                            {
-                                "name": name,
-                                "url": full_url,
-                                **self._fetch_artist_details(full_url),
-                            }
-                        )
+                        artists.append({"name": name, "url": full_url})
+
+        urls = [artist["url"] for artist in artists]
+        embedded = embedded_artist_details(html, urls, self.localize)
+        to_fetch = [
+            url
+            for url in urls
+            if not all(field in embedded.get(url, {}) for field in DETAIL_FIELDS)
+        ]
+        print(
+            f"Found embedded data for {len(embedded)} of {len(artists)} artists; "
+            f"fetching {len(to_fetch)} artist pages..."
+        )
+        fetched = {}
+        if to_fetch:
+            details, metrics = run_pipeline(
+                to_fetch,
+                fetch=self._fetch_page,
+                parse=self.parse_artist_page,
+                fetch_workers=fetch_workers,
+                parse_workers=parse_workers,
+            )
+            print(format_metrics(metrics))
+            fetched = dict(zip(to_fetch, details))
+        # Embedded details only hold fields with a value, so artist pages fill
+        # in the rest, and their placeholders (None, "TBA") never win
+        artists_data = [
+            {
+                **artist,
+                **fetched.get(artist["url"], {}),
+                **embedded.get(artist["url"], {}),
+            }
+            for artist in artists
+        ]
 
         return ScrapedData(
             source_url=self.program_url,
@@ -158,16 +230,20 @@ class RoskildeFestival2025Scraper(BaseFestivalScraper):
             festival_year=self.festival_year,
         )
 
-    def _fetch_artist_details(self, url: str) -> Dict:
-        """Fetch detailed information from artist's page."""
-        soup = BeautifulSoup(self.session.get(url).text, "html.parser")
+    @classmethod
+    def parse_artist_page(cls, html: str) -> Dict:
+        """
+        Extract detailed information from an artist page's HTML.
 
-        # Get performance date and stage info
-        performance_date = self.DATE_MAPPING.get(
-            self._get_text(self._find_element(soup, "showTimesDay")).lower().strip()
-        )
-        stage_info = self._get_text(self._find_element(soup, "showTimesLocation"))
-        stage_times = self._parse_stage_info(stage_info)
+        A classmethod, so it can be sent to parse worker processes.
+        """
+        soup = BeautifulSoup(html, "html.parser")
+
+        # Get performance date and stage info (no date until times are announced)
+        day = cls._get_text(cls._find_element(soup, "showTimesDay"))
+        performance_date = cls.DATE_MAPPING.get(day.lower().strip()) if day else None
+        stage_info = cls._get_text(cls._find_element(soup, "showTimesLocation"))
+        stage_times = cls._parse_stage_info(stage_info)
 
         # Get country codes
         country_element = soup.find(
@@ -180,11 +256,11 @@ class RoskildeFestival2025Scraper(BaseFestivalScraper):
         )
 
         # Get descriptions
-        short_desc = self._get_text(
+        short_desc = cls._get_text(
             soup.find("h2", class_=lambda c: c and "headlineSmall" in c)
         )
 
-        long_desc_element = self._find_element(soup, "rich-text_component")
+        long_desc_element = cls._find_element(soup, "rich-text_component")
         if long_desc_element:
             for br in long_desc_element.find_all("br"):
                 br.replace_with("\n")
@@ -205,7 +281,7 @@ class RoskildeFestival2025Scraper(BaseFestivalScraper):
             "stage": (
                 stage_times[0]["stage"] if stage_times else "TBA"
             ),  # required for calendar view
-            "start_ts": self._get_start_timestamp(performance_date, stage_times),
+            "start_ts": cls._get_start_timestamp(performance_date, stage_times),
             "short_description": short_desc,
             "long_description": long_desc,
             "spotify_link": spotify_link,
@@ -213,11 +289,37 @@ class RoskildeFestival2025Scraper(BaseFestivalScraper):
         }
 
 
-class RoskildeFestival2026Scraper(BaseFestivalScraper):
+class RoskildeFestival2025Scraper(RoskildeFestivalScraper):
+    """
+    Scraper for Roskilde Festival 2025 lineup and schedule.
+    """
+
+    festival_year = 2025
+
+    # Mapping of Danish dates to ISO format dates for Roskilde Festival 2025
+    DATE_MAPPING = {
+        "søndag 29. juni": "2025-06-29",
+        "mandag 30. juni": "2025-06-30",
+        "tirsdag 1. juli": "2025-07-01",
+        "onsdag 2. juli": "2025-07-02",
+        "torsdag 3. juli": "2025-07-03",
+        "fredag 4. juli": "2025-07-04",
+        "lørdag 5. juli": "2025-07-05",
+        "onsdag nat 2. juli*": "2025-07-03",
+        "torsdag nat 3. juli*": "2025-07-04",
+        "fredag nat 4. juli*": "2025-07-05",
+        "lørdag nat 5. juli*": "2025-07-06",
+    }
+
+
+class RoskildeFestival2026Scraper(RoskildeFestivalScraper):
     """
     Scraper for Roskilde Festival 2026 lineup and schedule.
     """
 
+    festival_year = 2026
+    program_path = "/program/musik"
+
     # Mapping of Danish dates to ISO format dates for Roskilde Festival 2026
     DATE_MAPPING = {
         "søndag 28. juni": "2026-06-28",
@@ -232,162 +334,3 @@ class RoskildeFestival2026Scraper(BaseFestivalScraper):
         "fredag nat 3. juli*": "2026-07-04",
         "lørdag nat 4. juli*": "2026-07-05",
     }
-
-    def __init__(self):
-        self.festival_name = "Roskilde Festival"
-        self.festival_year = 2026
-        self.base_url = "https://www.roskilde-festival.dk"
-        self.program_url = f"{self.base_url}/program/musik"
-        self.session = requests.Session()
-        self._setup_cookies()
-
-    def _setup_cookies(self):
-        """Setup cookies to accept all cookie categories."""
-        cookies = {
-            "CookieInformationConsent": '{"consents_approved":["cookie_cat_necessary","cookie_cat_functional","cookie_cat_statistic","cookie_cat_marketing"],"consents_denied":[]}',
-            "CookieInformationConsent_marketing": "true",
-        }
-        self.session.cookies.update(cookies)
-
-        # Make an initial request to set cookies
-        self.session.get(self.base_url)
-
-    def _find_element(
-        self, soup: BeautifulSoup, class_pattern: str
-    ) -> Optional[BeautifulSoup]:
-        """Helper method to find elements by class pattern."""
-        return soup.find("div", class_=lambda c: c and class_pattern in c)
-
-    def _get_text(self, element: Optional[BeautifulSoup]) -> Optional[str]:
-        """Helper method to safely get text from an element."""
-        return element.text.strip() if element else None
-
-    def _parse_stage_info(self, stage_info: str) -> List[Dict[str, str]]:
-        """Parse stage information into time and stage name pairs."""
-        if not stage_info:
-            return []
-
-        stage_times = []
-        for info in stage_info.split("/"):
-            if match := re.match(r".*?(\d{2}\.\d{2}),\s*(.*)", info.strip()):
-                time, stage = match.groups()
-                stage_times.append({"time": time, "stage": stage})
-        return stage_times
-
-    def _get_start_timestamp(
-        self, date: str, stage_times: List[Dict[str, str]]
-    ) -> Optional[datetime]:
-        """Convert date and time to timezone-aware datetime object."""
-        if not (date and stage_times):
-            return None
-
-        try:
-            time_str = stage_times[0]["time"].replace(".", ":")
-            # Create datetime in Denmark's timezone (CET/CEST)
-            denmark_tz = pytz.timezone("Europe/Copenhagen")
-            dt = datetime.fromisoformat(f"{date}T{time_str}:00")
-            return denmark_tz.localize(dt)
-        except ValueError:
-            return None
-
-    def fetch_lineup(self, sample_size=None) -> ScrapedData:
-        """
-        Fetch the festival lineup from the website.
-
-        Args:
-            sample_size: Maximum number of artists to fetch. If None, fetches all artists.
-
-        Returns:
-            ScrapedData: Raw scraped data including artist links and basic info
-        """
-        print("Fetching program page...")
-        soup = BeautifulSoup(self.session.get(self.program_url).text, "html.parser")
-        artist_cards = (
-            soup.find_all("div", class_=re.compile(r"artistCard"))[:sample_size]
-            if sample_size
-            else soup.find_all("div", class_=re.compile(r"artistCard"))
-        )
-
-        print(f"Processing {len(artist_cards)} artists")
-        artists_data = []
-
-        for i, card in enumerate(artist_cards, 1):
-            if link_element := card.find("a"):
-                href = link_element.get("href", "")
-                full_url = self.base_url + href if href else ""
-
-                if content_div := card.find(
-                    "div", class_=lambda c: c and "card_content" in c
-                ):
-                    if name := self._get_text(content_div.find("h2")):
-                        print(
-                            f"Fetching details for {name} ({i}/{len(artist_cards)})..."
-                        )
-                        artists_data.append(
-                            {
-                                "name": name,
-                                "url": full_url,
-                                **self._fetch_artist_details(full_url),
-                            }
-                        )
-
-        return ScrapedData(
-            source_url=self.program_url,
-            raw_content={"artists": artists_data},
-            festival_name=self.festival_name,
-            festival_year=self.festival_year,
-        )
-
-    def _fetch_artist_details(self, url: str) -> Dict:
-        """Fetch detailed information from artist's page."""
-        soup = BeautifulSoup(self.session.get(url).text, "html.parser")
-
-        # Get performance date and stage info
-        performance_date = self.DATE_MAPPING.get(
-            self._get_text(self._find_element(soup, "showTimesDay")).lower().strip()
-        )
-        stage_info = self._get_text(self._find_element(soup, "showTimesLocation"))
-        stage_times = self._parse_stage_info(stage_info)
-
-        # Get country codes
-        country_element = soup.find(
-            "sup", class_=lambda c: c and "typography_superscript" in c
-        )
-        country_codes = (
-            [c.strip() for c in country_element.text.split("/")]
-            if country_element
-            else None
-        )
-
-        # Get descriptions
-        short_desc = self._get_text(
-            soup.find("h2", class_=lambda c: c and "headlineSmall" in c)
-        )
-
-        long_desc_element = self._find_element(soup, "rich-text_component")
-        if long_desc_element:
-            for br in long_desc_element.find_all("br"):
-                br.replace_with("\n")
-            for p in long_desc_element.find_all("p"):
-                p.append("\n")
-            long_desc = long_desc_element.get_text().strip()
-        else:
-            long_desc = None
-
-        # Get Spotify link
-        spotify_links = soup.find_all(
-            "a", href=lambda x: x and "open.spotify.com/artist" in x
-        )
-        spotify_link = spotify_links[0]["href"].split("?")[0] if spotify_links else None
-
-        return {
-            "performance_date": performance_date,
-            "stage": (
-                stage_times[0]["stage"] if stage_times else "TBA"
-            ),  # required for calendar view
-            "start_ts": self._get_start_timestamp(performance_date, stage_times),
-            "short_description": short_desc,
-            "long_description": long_desc,
-            "spotify_link": spotify_link,
-            "country_code": country_codes,
-        }
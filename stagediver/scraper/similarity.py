@@ -0,0 +1,104 @@
+"""
+Artist similarity based on bio text.
+
+Bios are vectorised with TF-IDF at scrape time and each artist keeps its most
+similar artists in ``other_data["similar_to"]``. Together these rows form a
+sparse similarity matrix for the festival-year, so the web app can re-rank
+artists without touching the bio text again.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[^\W\d_]{3,}")
+SIMILAR_ARTISTS_LIMIT = 10
+_CHUNK_SIZE = 256
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split text into lowercase word unigrams and bigrams."""
+    words = TOKEN_PATTERN.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def build_tfidf_matrix(
+    documents: List[str], min_df: int = 2, max_df: float = 0.5
+) -> np.ndarray:
+    """
+    Build an L2-normalised TF-IDF matrix with one row per document.
+
+    Args:
+        documents: Texts to vectorise
+        min_df: Ignore terms found in fewer documents than this
+        max_df: Ignore terms found in more than this fraction of documents
+
+    Returns:
+        Array of shape (len(documents), vocabulary size)
+    """
+    term_counts = [Counter(_tokenize(doc)) for doc in documents]
+    document_frequency = Counter(term for counts in term_counts for term in counts)
+
+    max_count = max_df * len(documents)
+    vocabulary: Dict[str, int] = {}
+    for term, df in document_frequency.items():
+        if min_df <= df <= max_count:
+            vocabulary[term] = len(vocabulary)
+
+    idf = np.zeros(len(vocabulary), dtype=np.float32)
+    for term, column in vocabulary.items():
+        idf[column] = math.log(len(documents) / document_frequency[term]) + 1.0
+
+    matrix = np.zeros((len(documents), len(vocabulary)), dtype=np.float32)
+    for row, counts in enumerate(term_counts):
+        for term, count in counts.items():
+            if (column := vocabulary.get(term)) is not None:
+                matrix[row, column] = 1.0 + math.log(count)
+
+    matrix *= idf
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def add_similar_artists(
+    artists: List[dict], limit: int = SIMILAR_ARTISTS_LIMIT
+) -> None:
+    """
+    Store the most similar artists for each artist in ``other_data``.
+
+    Args:
+        artists: Artist records as written by run_scraper (modified in place)
+        limit: Number of similar artists kept per artist
+    """
+    if len(artists) < 2:
+        return
+
+    names = [artist["artist_name"] for artist in artists]
+    matrix = build_tfidf_matrix(
+        [
+            f"{artist.get('bio_short') or ''}\n{artist.get('bio_long') or ''}"
+            for artist in artists
+        ]
+    )
+    limit = min(limit, len(artists) - 1)
+
+    # Compute similarities in row chunks to keep memory bounded
+    for start in range(0, len(artists), _CHUNK_SIZE):
+        scores = matrix[start : start + _CHUNK_SIZE] @ matrix.T
+        for offset, row in enumerate(scores):
+            row[start + offset] = -1.0  # never similar to itself
+            # Rank on the stored (rounded) scores, with ties in lineup order, so
+            # the same lineup always gives the same similar artists
+            kth = np.partition(row, len(row) - limit)[len(row) - limit]
+            candidates = np.flatnonzero(row >= kth - 0.00005)
+            rounded = np.round(row[candidates].astype(np.float64), 4)
+            top = np.argsort(-rounded, kind="stable")[:limit]
+            artists[start + offset].setdefault("other_data", {})["similar_to"] = [
+                {"artist_name": names[candidates[i]], "score": float(rounded[i])}
+                for i in top
+                if rounded[i] > 0
+            ]
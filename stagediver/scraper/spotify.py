@@ -0,0 +1,195 @@
+"""
+Spotify metadata enrichment (genres, popularity, related artists).
+
+Metadata comes from a pluggable source: an exported dataset file, or an HTTP
+service answering Spotify-style batch requests (``GET /artists?ids=a,b,c``),
+such as a local fixture server standing in for the Spotify API. Results are
+cached by Spotify artist id with a time-to-live, so re-running over an
+unchanged lineup makes no requests.
+"""
+
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+
+from stagediver.common import DATA_DIR, load_json_file, save_json_file
+
+CACHE_FILE = os.path.join(DATA_DIR, "cache", "spotify.json")
+BATCH_SIZE = 50  # Spotify's limit for batch artist lookups
+MAX_WORKERS = 4
+TTL_DAYS = 30
+METADATA_FIELDS = ("genres", "popularity", "related_artists")
+
+_SPOTIFY_ARTIST_ID = re.compile(r"artist/([a-zA-Z0-9]+)")
+
+
+def spotify_artist_id(artist: dict) -> Optional[str]:
+    """Get the Spotify artist id from an artist's social links."""
+    url = (artist.get("social_links") or {}).get("spotify")
+    match = _SPOTIFY_ARTIST_ID.search(url) if url else None
+    return match.group(1) if match else None
+
+
+class MetadataSource(ABC):
+    """Source of artist metadata; subclasses implement fetch."""
+
+    @abstractmethod
+    def fetch(self, artist_ids: List[str]) -> Dict[str, dict]:
+        """
+        Fetch metadata for a batch of artists.
+
+        Args:
+            artist_ids: Spotify artist ids, at most one batch
+
+        Returns:
+            Dict of metadata by artist id (ids the source does not know are
+            left out)
+        """
+
+
+class FileMetadataSource(MetadataSource):
+    """Metadata from an exported dataset: a JSON object keyed by artist id."""
+
+    def __init__(self, file_path: str):
+        self._data: Dict[str, dict] = load_json_file(file_path)
+
+    def fetch(self, artist_ids: List[str]) -> Dict[str, dict]:
+        return {
+            artist_id: self._data[artist_id]
+            for artist_id in artist_ids
+            if artist_id in self._data
+        }
+
+
+class HttpMetadataSource(MetadataSource):
+    """Metadata from an HTTP service with a Spotify-style batch endpoint."""
+
+    def __init__(self, base_url: str, timeout: float = 10.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _get_session(self) -> requests.Session:
+        """Session of the current fetch thread; sessions are not thread-safe."""
+        if (session := getattr(self._local, "session", None)) is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def fetch(self, artist_ids: List[str]) -> Dict[str, dict]:
+        response = self._get_session().get(
+            f"{self.base_url}/artists",
+            params={"ids": ",".join(artist_ids)},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return {
+            artist["id"]: artist
+            for artist in response.json().get("artists", [])
+            if artist
+        }
+
+
+def load_cache(cache_file: Optional[str] = CACHE_FILE) -> Dict[str, dict]:
+    """Load the metadata cache, or an empty one if there is none yet."""
+    if cache_file and os.path.exists(cache_file):
+        return load_json_file(cache_file)
+    return {}
+
+
+def apply_cached_metadata(artists: List[dict], cache: Dict[str, dict]) -> int:
+    """
+    Write cached metadata into ``other_data["spotify"]``, however old it is.
+
+    Args:
+        artists: Artist records as written by run_scraper (modified in place)
+        cache: Metadata cache keyed by artist id, as loaded by load_cache
+
+    Returns:
+        Number of artists that got metadata
+    """
+    applied = 0
+    for artist in artists:
+        artist_id = spotify_artist_id(artist)
+        entry = cache.get(artist_id) if artist_id else None
+        if entry and entry["metadata"]:
+            artist.setdefault("other_data", {})["spotify"] = entry["metadata"]
+            applied += 1
+    return applied
+
+
+def enrich_spotify(
+    artists: List[dict],
+    source: MetadataSource,
+    cache_file: Optional[str] = CACHE_FILE,
+    ttl_days: float = TTL_DAYS,
+    batch_size: int = BATCH_SIZE,
+    max_workers: int = MAX_WORKERS,
+    now: Optional[float] = None,
+) -> Dict[str, float]:
+    """
+    Write Spotify metadata into ``other_data["spotify"]`` for every artist.
+
+    Args:
+        artists: Artist records as written by run_scraper (modified in place)
+        source: Where to fetch metadata that is not cached
+        cache_file: JSON cache keyed by artist id, or None to disable
+        ttl_days: Days before cached metadata is fetched again
+        batch_size: Artist ids per request
+        max_workers: Requests in flight at once
+        now: Current time as epoch seconds (default: time.time())
+
+    Returns:
+        Report with artist, cache hit, request and batching counts
+    """
+    now = time.time() if now is None else now
+    cache = load_cache(cache_file)
+
+    artist_ids = {
+        artist_id for artist in artists if (artist_id := spotify_artist_id(artist))
+    }
+    # Ids the source did not know are cached too, so they are not asked for again
+    stale = sorted(
+        artist_id
+        for artist_id in artist_ids
+        if now - cache.get(artist_id, {}).get("fetched_at", -float("inf"))
+        >= ttl_days * 86400
+    )
+
+    batches = [
+        stale[start : start + batch_size] for start in range(0, len(stale), batch_size)
+    ]
+    if batches:
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for batch, found in zip(batches, executor.map(source.fetch, batches)):
+                    for artist_id in batch:
+                        metadata = found.get(artist_id)
+                        if metadata:
+                            metadata = {
+                                field: metadata.get(field) for field in METADATA_FIELDS
+                            }
+                        cache[artist_id] = {"fetched_at": now, "metadata": metadata}
+        finally:
+            # Keep the batches that did arrive if a later one fails
+            if cache_file:
+                save_json_file(cache, cache_file)
+
+    apply_cached_metadata(artists, cache)
+
+    return {
+        "artists": len(artist_ids),
+        "cache_hits": len(artist_ids) - len(stale),
+        "fetched": len(stale),
+        "requests": len(batches),
+        "batch_size": batch_size,
+        "max_workers": max_workers,
+        "hit_rate": (
+            (len(artist_ids) - len(stale)) / len(artist_ids) if artist_ids else 1.0
+        ),
+    }
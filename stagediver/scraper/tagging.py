@@ -0,0 +1,280 @@
+"""
+Offline genre and mood tagging based on artist bios.
+
+Tags come from keyword lexicons (Danish and English stems, since the festival
+bios are mostly Danish), so no network access or model download is needed.
+Results are cached by a hash of the bio text, so artists whose bio has not
+changed since the last scrape are never re-tagged.
+"""
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from stagediver.common import DATA_DIR, load_json_file, save_json_file
+
+# Mood tags from docs/design.md, matched on word stems
+MOOD_LEXICON = {
+    "🌅 Hangover": [
+        r"afslappe",
+        r"akusti",
+        r"acousti",
+        r"blid",
+        r"chill",
+        r"lo-?fi",
+        r"mild",
+        r"relax",
+        r"rolig",
+        r"stille",
+    ],
+    "💪 Fistpump": [
+        r"banger",
+        r"club",
+        r"dance\b",
+        r"danse",
+        r"edm\b",
+        r"eurodance",
+        r"klub",
+        r"rave",
+    ],
+    "🤘 Moshpit": [
+        r"brutal",
+        r"hardcore",
+        r"larm",
+        r"metal",
+        r"mosh",
+        r"noise",
+        r"punk",
+        r"støj",
+        r"thrash",
+        r"tung",
+    ],
+    "🌿 Zen": [
+        r"ambient",
+        r"atmosf",
+        r"atmospher",
+        r"drone",
+        r"meditat",
+        r"minimalis",
+    ],
+    "🎭 Emotional": [
+        r"emotion",
+        r"følelse",
+        r"hjerteskær",
+        r"inderlig",
+        r"intim",
+        r"melankol",
+        r"rørende",
+        r"sorg",
+        r"sårbar",
+        r"vulnerab",
+    ],
+    "🕺 Groovy": [
+        r"afrobeat",
+        r"boogie",
+        r"disco",
+        r"funk",
+        r"groove",
+        r"rytm",
+        r"rhythm",
+        r"soul",
+        r"swing",
+    ],
+    "🌙 Late Night": [
+        r"dark",
+        r"elektronisk",
+        r"electronic",
+        r"industrial",
+        r"mørk",
+        r"natte",
+        r"techno",
+        r"warehouse",
+    ],
+    "🎪 Party": [
+        r"fest\b",
+        r"festlig",
+        r"feststemning",
+        r"glad",
+        r"humør",
+        r"karneval",
+        r"party",
+        r"sjov",
+    ],
+    "🌊 Wave": [
+        r"dream",
+        r"drøm",
+        r"hypnoti",
+        r"psykedel",
+        r"psychedel",
+        r"shoegaze",
+        r"svæve",
+        r"æteris",
+    ],
+    "🔥 Hype": [
+        r"adrenalin",
+        r"eksplosiv",
+        r"energi",
+        r"energetic",
+        r"hype",
+        r"intens",
+        r"kaoti",
+        r"vild",
+    ],
+}
+
+GENRE_LEXICON = {
+    "pop": [r"pop(?!ul)"],
+    "rock": [r"rock"],
+    "hip hop": [r"hip ?hop", r"rap", r"grime", r"drill"],
+    "electronic": [r"elektronisk", r"electronic", r"synth"],
+    "techno": [r"techno"],
+    "house": [r"house"],
+    "jazz": [r"jazz"],
+    "metal": [r"metal"],
+    "punk": [r"punk"],
+    "folk": [r"folk(?!e)"],
+    "soul": [r"soul", r"r&b", r"rnb"],
+    "indie": [r"indie"],
+    "reggae": [r"reggae", r"dancehall", r"dub\b"],
+    "afrobeats": [r"afrobeat", r"amapiano"],
+    "country": [r"country", r"americana"],
+    "classical": [r"klassisk", r"classical", r"orkester", r"orchestra"],
+    "experimental": [r"eksperiment", r"experiment", r"avantgarde"],
+}
+
+MAX_MOOD_TAGS = 3
+BATCH_SIZE = 64
+CACHE_FILE = os.path.join(DATA_DIR, "cache", "tags.json")
+
+# Changing a lexicon changes every bio hash, so stale cache entries are ignored
+_LEXICON_VERSION = hashlib.sha1(
+    json.dumps([MOOD_LEXICON, GENRE_LEXICON], sort_keys=True).encode()
+).hexdigest()[:8]
+
+
+def _compile_lexicon(lexicon: Dict[str, List[str]]) -> Dict[str, re.Pattern]:
+    """Compile one regex per tag, matching any of its stems at a word start."""
+    return {
+        tag: re.compile(r"\b(?:" + "|".join(stems) + ")", re.IGNORECASE)
+        for tag, stems in lexicon.items()
+    }
+
+
+_MOOD_PATTERNS = _compile_lexicon(MOOD_LEXICON)
+_GENRE_PATTERNS = _compile_lexicon(GENRE_LEXICON)
+
+
+def _bio_text(artist: dict) -> str:
+    """Join the short and long bio of an artist."""
+    return f"{artist.get('bio_short') or ''}\n{artist.get('bio_long') or ''}"
+
+
+def bio_hash(artist: dict) -> str:
+    """Hash the bio text an artist's tags are derived from."""
+    text = f"{_LEXICON_VERSION}\n{_bio_text(artist)}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def tag_text(text: str) -> Dict[str, List[str]]:
+    """
+    Tag a bio with genres and mood tags.
+
+    Args:
+        text: Bio text to classify
+
+    Returns:
+        Dict with "genres" and "mood_tags" lists, strongest matches first
+    """
+    mood_hits = {
+        tag: len(pattern.findall(text)) for tag, pattern in _MOOD_PATTERNS.items()
+    }
+    moods = sorted(
+        (tag for tag, hits in mood_hits.items() if hits),
+        key=lambda tag: -mood_hits[tag],
+    )
+    return {
+        "genres": [
+            genre for genre, pattern in _GENRE_PATTERNS.items() if pattern.search(text)
+        ],
+        "mood_tags": moods[:MAX_MOOD_TAGS],
+    }
+
+
+def _tag_batch(texts: List[str]) -> List[Dict[str, List[str]]]:
+    """Tag a batch of bios (runs in a worker process)."""
+    return [tag_text(text) for text in texts]
+
+
+def tag_artists(
+    artists: List[dict],
+    cache_file: Optional[str] = CACHE_FILE,
+    batch_size: int = BATCH_SIZE,
+    max_workers: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Write genre and mood tags into ``other_data`` for every artist.
+
+    Args:
+        artists: Artist records as written by run_scraper (modified in place)
+        cache_file: JSON file with tags keyed by bio hash, or None to disable
+        batch_size: Number of artists tagged per worker task
+        max_workers: Worker processes for tagging (default: CPU count)
+
+    Returns:
+        Dict with the number of "cached" and "tagged" artists
+    """
+    cache = {}
+    if cache_file and os.path.exists(cache_file):
+        cache = load_json_file(cache_file)
+
+    hashes = [bio_hash(artist) for artist in artists]
+    missing = [i for i, key in enumerate(hashes) if key not in cache]
+
+    if missing:
+        texts = [_bio_text(artists[i]) for i in missing]
+        batches = [
+            texts[start : start + batch_size]
+            for start in range(0, len(texts), batch_size)
+        ]
+        if len(batches) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = [
+                    tags
+                    for batch in executor.map(_tag_batch, batches)
+                    for tags in batch
+                ]
+        else:
+            results = _tag_batch(texts)
+
+        for i, tags in zip(missing, results):
+            cache[hashes[i]] = tags
+
+        if cache_file:
+            save_json_file(cache, cache_file)
+
+    for artist, key in zip(artists, hashes):
+        artist.setdefault("other_data", {}).update(cache[key])
+
+    return {"cached": len(artists) - len(missing), "tagged": len(missing)}
+
+
+def build_tag_index(artists: List[dict]) -> Dict[str, Dict[str, List[int]]]:
+    """
+    Index artist positions by genre and mood tag.
+
+    Args:
+        artists: Tagged artist records
+
+    Returns:
+        Dict mapping "genres" and "mood_tags" to {tag: [artist positions]}
+    """
+    index = {"genres": {}, "mood_tags": {}}
+    for position, artist in enumerate(artists):
+        other_data = artist.get("other_data", {})
+        for field, tags in index.items():
+            for tag in other_data.get(field, []):
+                tags.setdefault(tag, []).append(position)
+    return index
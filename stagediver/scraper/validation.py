@@ -0,0 +1,138 @@
+"""
+Validation and data-quality report of scraped artist records.
+
+All records of a scrape are validated in a single call of a compiled schema,
+then counted for problems that pass the schema but still show up in the web
+app: sets without a time or stage, and artists listed twice.
+"""
+
+import time
+from collections import Counter
+from datetime import date
+from typing import Dict, List, Optional
+
+from pydantic import AwareDatetime, BaseModel, Field, TypeAdapter, ValidationError
+
+# Stage names of sets whose stage is not announced
+UNKNOWN_STAGES = {"", "TBA"}
+
+# Largest share of artists with each problem before a scrape is warned about
+WARN_THRESHOLDS = {
+    "invalid": 0.0,
+    "missing_times": 0.0,
+    "unknown_stages": 0.0,
+    "duplicates": 0.0,
+}
+# Largest share of artists with each problem before a scrape is rejected.
+# Times and stages are announced weeks after the lineup, so by default they
+# never reject a scrape.
+FAIL_THRESHOLDS = {"invalid": 0.0, "duplicates": 0.05}
+
+# Validation errors kept in a report
+MAX_ERRORS = 10
+
+
+class ArtistRecord(BaseModel):
+    """An artist as returned by a scraper's fetch_lineup"""
+
+    name: str = Field(min_length=1)
+    url: str
+    performance_date: Optional[date] = None
+    stage: Optional[str] = None
+    start_ts: Optional[AwareDatetime] = None
+    short_description: Optional[str] = None
+    long_description: Optional[str] = None
+    spotify_link: Optional[str] = None
+    country_code: Optional[List[str]] = None
+
+
+# Built once: the schema is compiled when the adapter is created
+ARTIST_RECORDS = TypeAdapter(List[ArtistRecord])
+
+
+class QualityReport(BaseModel):
+    """Problem counts of a scrape's artist records"""
+
+    artists: int
+    invalid: int = 0
+    missing_times: int = 0
+    unknown_stages: int = 0
+    duplicates: int = 0
+    duplicate_names: List[str] = Field(default_factory=list)
+    errors: List[str] = Field(default_factory=list)
+    seconds: float = 0.0
+
+    def exceeded(self, thresholds: Dict[str, float]) -> List[str]:
+        """
+        Describe the problems found in more than their share of artists.
+
+        Args:
+            thresholds: Largest share (0-1) of artists by problem count name
+
+        Returns:
+            One message per problem over its threshold
+        """
+        problems = []
+        for name, threshold in thresholds.items():
+            count = getattr(self, name)
+            if count > threshold * self.artists:
+                problems.append(
+                    f"{name.replace('_', ' ')}: {count} of {self.artists} artists "
+                    f"(more than {threshold:.0%})"
+                )
+        return problems
+
+    def summary(self) -> str:
+        """Describe the report in a few lines."""
+        lines = [
+            f"Validated {self.artists} artists in {self.seconds * 1000:.1f} ms: "
+            f"{self.invalid} invalid, {self.missing_times} without a time, "
+            f"{self.unknown_stages} without a stage, {self.duplicates} duplicates"
+        ]
+        if self.duplicate_names:
+            lines.append(f"  Duplicate names: {', '.join(self.duplicate_names)}")
+        lines += [f"  {error}" for error in self.errors]
+        return "\n".join(lines)
+
+
+def validate_artists(records: List[dict]) -> QualityReport:
+    """
+    Validate a scrape's artist records and count their problems.
+
+    Args:
+        records: Artist dicts from ScrapedData.raw_content["artists"]
+
+    Returns:
+        Quality report of the records
+    """
+    start = time.perf_counter()
+    try:
+        ARTIST_RECORDS.validate_python(records)
+        errors = []
+    except ValidationError as e:
+        errors = e.errors(include_url=False)
+
+    names = Counter()
+    missing_times = unknown_stages = 0
+    for record in records:
+        if not isinstance(record, dict):
+            continue  # Already counted as invalid
+        names[record.get("name")] += 1
+        missing_times += not record.get("start_ts")
+        unknown_stages += str(record.get("stage") or "").strip() in UNKNOWN_STAGES
+    repeated = {name: count for name, count in names.items() if count > 1 and name}
+
+    return QualityReport(
+        artists=len(records),
+        invalid=len({error["loc"][0] for error in errors}),
+        missing_times=missing_times,
+        unknown_stages=unknown_stages,
+        duplicates=sum(count - 1 for count in repeated.values()),
+        duplicate_names=sorted(map(str, repeated)),
+        errors=[
+            f"artists[{error['loc'][0]}].{'.'.join(map(str, error['loc'][1:]))}: "
+            f"{error['msg']}"
+            for error in errors[:MAX_ERRORS]
+        ],
+        seconds=time.perf_counter() - start,
+    )
@@ -1,24 +1,19 @@
-import re
-from datetime import datetime
-
-import pycountry
 import streamlit as st
 
-from stagediver.web.components.sidebar import RATING_INFO
-
+from stagediver.web.components.ratings import RATING_INFO, set_rating
 
-def extract_spotify_id(spotify_url):
-    """Extract Spotify artist ID from full URL"""
-    if not spotify_url:
-        return None
-    match = re.search(r"artist/([a-zA-Z0-9]+)", spotify_url)
-    return match.group(1) if match else None
 
-
-def create_spotify_player_with_overlay(spotify_id, visible=True):
-    """Create a Spotify player with an overlay"""
+def create_spotify_player_with_overlay(spotify_id, visible=True, prefetch_ids=()):
+    """Create a Spotify player with an overlay, prefetching the upcoming players"""
+    # Warm the browser cache with the next artists' embeds while this one plays
+    prefetch_links = "".join(
+        f'<link rel="prefetch" href="https://open.spotify.com/embed/artist/{prefetch_id}">'
+        for prefetch_id in prefetch_ids
+    )
     st.iframe(
         f"""
+        <link rel="preconnect" href="https://open.spotify.com">
+        {prefetch_links}
         <style>
             .player-container {{
                 position: relative;
@@ -55,50 +50,15 @@ def create_spotify_player_with_overlay(spotify_id, visible=True):
     )
 
 
-def country_code_to_flag(country_code):
-    """Convert a country code to a flag emoji using pycountry"""
-    if not country_code:
-        return ""
-    try:
-        # Map UK to GB
-        if country_code.upper() == "UK":
-            country_code = "GB"
-        if country_code.upper() == "INT":
-            country_code = "🌐"
-        country = pycountry.countries.get(alpha_2=country_code.upper())
-        return country.flag if country else country_code
-    except (KeyError, AttributeError):
-        return country_code
-
-
-def display_artist_card(artist, blind_mode=False):
+def display_artist_card(view, blind_mode=False, prefetch_spotify_ids=()):
     """Display an artist card with optional rating controls and blind mode"""
-    name = artist["artist_name"]
+    artist = view.artist
+    name = view.name
 
     # Artist info - only show if not in blind mode
     if not blind_mode:
-
-        # Convert country codes to flags
-        country_flags = " ".join(
-            country_code_to_flag(code) for code in artist.get("country_code", [])
-        )
-        st.header(f"{name} {country_flags}", anchor=False)
-
-        text = ""
-        if stage := artist.get("stage_name"):
-            text += f"{stage}: "
-
-        if start_ts := artist.get("start_ts"):
-            start_time = datetime.fromisoformat(start_ts)
-            text += f"{start_time.strftime('%A, %-d %B, %H:%M')}"
-
-        if artist.get("scrape_url"):
-            text += f"&nbsp;&nbsp;[🔗]({artist['scrape_url']})"
-
-        if artist.get("social_links", {}).get("spotify"):
-            text += f"&nbsp;&nbsp;&nbsp;[▶️]({artist['social_links']['spotify']})"
-
-        st.markdown(f":gray[{text}]")
+        st.header(view.header, anchor=False)
+        st.markdown(view.info)
 
         if artist.get("bio_short"):
             st.markdown(f"*{artist['bio_short']}*")
@@ -108,11 +68,12 @@ def display_artist_card(artist, blind_mode=False):
         st.header(f"Mystery Artist 🏴‍☠️", anchor=False)
 
     # Spotify embed with optional overlay
-    if spotify_url := artist.get("social_links", {}).get("spotify"):
-        if spotify_id := extract_spotify_id(spotify_url):
-            create_spotify_player_with_overlay(
-                spotify_id=spotify_id, visible=blind_mode
-            )
+    if view.spotify_id:
+        create_spotify_player_with_overlay(
+            spotify_id=view.spotify_id,
+            visible=blind_mode,
+            prefetch_ids=prefetch_spotify_ids,
+        )
 
     # Rating buttons
     current_rating = st.session_state.ratings.get(name, "")
@@ -134,16 +95,12 @@ def display_artist_card(artist, blind_mode=False):
     )
 
     if rating:
-        emoji = rating.split(" ")[0]
-        st.session_state.ratings[name] = emoji
+        set_rating(name, rating.split(" ")[0])
     elif name in st.session_state.ratings:
-        del st.session_state.ratings[name]
+        set_rating(name, None)
 
-    if artist.get("bio_long") and not blind_mode:
+    if view.bio_long_html and not blind_mode:
         with st.expander(f"Read more about {name}"):
-            st.markdown(
-                artist["bio_long"].replace("\n", "<br><br>"),
-                unsafe_allow_html=True,
-            )
+            st.markdown(view.bio_long_html, unsafe_allow_html=True)
 
     return rating
@@ -0,0 +1,84 @@
+import re
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from stagediver.web.components.flags import COUNTRY_FLAGS
+
+SPOTIFY_ARTIST_ID = re.compile(r"artist/([a-zA-Z0-9]+)")
+
+
+def extract_spotify_id(spotify_url):
+    """Extract Spotify artist ID from full URL"""
+    if not spotify_url:
+        return None
+    match = SPOTIFY_ARTIST_ID.search(spotify_url)
+    return match.group(1) if match else None
+
+
+def country_code_to_flag(country_code):
+    """Convert a country code to a flag emoji using a precomputed lookup table"""
+    if not country_code:
+        return ""
+    return COUNTRY_FLAGS.get(country_code.upper(), country_code)
+
+
+class ArtistView:
+    """Render-ready fields of an artist, derived once when the lineup is loaded"""
+
+    __slots__ = (
+        "artist",
+        "name",
+        "header",
+        "info",
+        "spotify_id",
+        "bio_long_html",
+        "start_iso",
+        "end_iso",
+    )
+
+    def __init__(self, artist):
+        self.artist = artist
+        self.name = artist["artist_name"]
+
+        country_flags = " ".join(
+            country_code_to_flag(code) for code in artist.get("country_code") or []
+        )
+        self.header = f"{self.name} {country_flags}"
+
+        start_time = None
+        self.start_iso = self.end_iso = None
+        if start_ts := artist.get("start_ts"):
+            start_time = datetime.fromisoformat(start_ts)
+            end_ts = artist.get("end_ts")
+            end_time = (
+                datetime.fromisoformat(end_ts)
+                if end_ts
+                else start_time + timedelta(hours=1)
+            )
+            self.start_iso = start_time.isoformat()
+            self.end_iso = end_time.isoformat()
+
+        text = ""
+        if stage := artist.get("stage_name"):
+            text += f"{stage}: "
+
+        if start_time:
+            text += f"{start_time.strftime('%A, %-d %B, %H:%M')}"
+
+        if artist.get("scrape_url"):
+            text += f"&nbsp;&nbsp;[🔗]({artist['scrape_url']})"
+
+        spotify_url = (artist.get("social_links") or {}).get("spotify")
+        if spotify_url:
+            text += f"&nbsp;&nbsp;&nbsp;[▶️]({spotify_url})"
+
+        self.info = f":gray[{text}]"
+        self.spotify_id = extract_spotify_id(spotify_url)
+        self.bio_long_html = (artist.get("bio_long") or "").replace("\n", "<br><br>")
+
+
+@st.cache_resource(max_entries=16)
+def get_artist_views(festival, year, digest, _artists):
+    """Build the artist views once per festival-year, by artist name"""
+    return {artist["artist_name"]: ArtistView(artist) for artist in _artists}
@@ -0,0 +1,132 @@
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional, Tuple
+
+import streamlit as st
+
+from stagediver.common import dumps_json, loads_json
+
+# Key of the content hash stored on every lineup dict the cache serves
+DIGEST_KEY = "_digest"
+
+
+class LineupFile(NamedTuple):
+    """A parsed lineup file and the version of the file it was parsed from"""
+
+    path: str
+    mtime_ns: int
+    size: int
+    digest: str
+    data: Optional[dict]
+
+    @property
+    def stat_key(self) -> Tuple[int, int]:
+        return self.mtime_ns, self.size
+
+
+class LineupFileCache:
+    """
+    Parsed lineup files shared by all sessions, checked for changes on every get.
+
+    A changed file (new mtime or size) is reloaded in the background while the
+    old copy keeps being served, so a scraper rewriting one festival-year never
+    blocks a rerun and never reloads the other files. Files whose content hash
+    did not change keep their parsed data. Each parsed dict carries the hash of
+    the content it was parsed from under DIGEST_KEY, so it stays valid for the
+    copy a session is rendering after a newer one replaced it.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self._entries = {}
+        self._reloading = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="lineup-reload"
+        )
+
+    def _load(self, path: str, stat_key: Tuple[int, int]) -> LineupFile:
+        with open(path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+
+        previous = self._entries.get(path)
+        if previous is not None and previous.digest == digest:
+            data = previous.data
+        else:
+            try:
+                data = loads_json(raw)
+            except ValueError:
+                data = None
+            if isinstance(data, dict) and "artists" in data:
+                data[DIGEST_KEY] = digest
+            else:
+                # Keep serving the last good copy of a broken file
+                data = previous.data if previous is not None else None
+
+        entry = LineupFile(path, *stat_key, digest, data)
+        self._entries[path] = entry
+        return entry
+
+    def _reload(self, path: str, stat_key: Tuple[int, int]) -> None:
+        try:
+            self._load(path, stat_key)
+        except OSError:
+            self._entries.pop(path, None)
+        finally:
+            with self._lock:
+                self._reloading.discard(path)
+
+    def get(self, path: str) -> Optional[dict]:
+        """
+        Get a lineup file's data, starting a background reload if it changed.
+
+        Args:
+            path: Lineup JSON file
+
+        Returns:
+            Lineup dict, or None if the file is missing or not a valid lineup
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            self._entries.pop(path, None)
+            return None
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._entries.get(path)
+        if entry is None:
+            # Nothing to serve yet, so the first load blocks
+            try:
+                return self._load(path, stat_key).data
+            except OSError:
+                return None
+
+        if entry.stat_key != stat_key:
+            with self._lock:
+                if path not in self._reloading:
+                    self._reloading.add(path)
+                    self._executor.submit(self._reload, path, stat_key)
+        return entry.data
+
+
+@st.cache_resource(max_entries=1)
+def get_lineup_cache():
+    """Get the lineup file cache shared by all sessions"""
+    return LineupFileCache()
+
+
+def lineup_digest(data: dict) -> str:
+    """
+    Get the version of a loaded lineup to key derived caches on.
+
+    Unlike scrape_ts, the digest also changes when a lineup file is enriched or
+    edited by hand, so nothing derived from the old content is served. Lineups
+    not loaded through the cache are hashed once by content.
+    """
+    digest = data.get(DIGEST_KEY)
+    if digest is None:
+        digest = hashlib.sha256(dumps_json(data, compact=True)).hexdigest()
+        data[DIGEST_KEY] = digest
+    return digest
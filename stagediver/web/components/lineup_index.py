@@ -0,0 +1,128 @@
+import numpy as np
+import streamlit as st
+
+from stagediver.common import format_festival_day, get_start_and_day
+
+UNRATED = "⚪"
+TBA = "TBA"
+SORT_OPTIONS = ["Lineup", "Artist", "Stage", "Time", "Rating"]
+
+
+class LineupIndex:
+    """Precomputed filter and sort indexes for one festival-year's artists"""
+
+    def __init__(self, artists, tag_index=None):
+        self.size = len(artists)
+        self.positions = {artist["artist_name"]: i for i, artist in enumerate(artists)}
+
+        self.by_stage = {}
+        self.by_day = {}
+        self.by_country = {}
+        festival_days = {}
+        start_times = []
+        for i, artist in enumerate(artists):
+            self.by_stage.setdefault(artist.get("stage_name") or TBA, []).append(i)
+            start_epoch, festival_day = get_start_and_day(artist)
+            festival_days.setdefault(festival_day, []).append(i)
+            for code in artist.get("country_code") or []:
+                self.by_country.setdefault(code, []).append(i)
+            start_times.append(np.inf if start_epoch is None else start_epoch)
+
+        self.by_mood = (tag_index or {}).get("mood_tags", {})
+
+        # Days are labelled once and listed in festival order, with TBA last
+        self.by_day = {
+            format_festival_day(day): festival_days[day]
+            for day in sorted(day for day in festival_days if day)
+        }
+        if None in festival_days:
+            self.by_day[TBA] = festival_days[None]
+        self.days = list(self.by_day)
+
+        names = [artist["artist_name"].casefold() for artist in artists]
+        stages = [artist.get("stage_name") or TBA for artist in artists]
+        self.sort_orders = {
+            "Lineup": np.arange(self.size),
+            "Artist": np.array(sorted(range(self.size), key=names.__getitem__)),
+            "Stage": np.array(
+                sorted(range(self.size), key=lambda i: (stages[i], start_times[i]))
+            ),
+            "Time": np.argsort(np.array(start_times, dtype=float), kind="stable"),
+        }
+
+    def _mask(self, index, keys):
+        """Boolean mask of artists matching any of the keys in an index"""
+        mask = np.zeros(self.size, dtype=bool)
+        for key in keys:
+            mask[index.get(key, [])] = True
+        return mask
+
+    def _rating_ranks(self, ratings, rating_order):
+        """Rank of each artist's rating (unrated last) for the current ratings"""
+        rank_of = {rating: rank for rank, rating in enumerate(rating_order)}
+        ranks = np.full(self.size, len(rating_order), dtype=np.int8)
+        for name, rating in ratings.items():
+            if (position := self.positions.get(name)) is not None:
+                ranks[position] = rank_of.get(rating, len(rating_order))
+        return ranks
+
+    def query(
+        self,
+        ratings,
+        rating_order,
+        stages=(),
+        days=(),
+        countries=(),
+        moods=(),
+        rating_filter=(),
+        sort_by="Lineup",
+        descending=False,
+    ):
+        """
+        Filter and sort the lineup.
+
+        Args:
+            ratings: The user's ratings by artist name
+            rating_order: Rating emojis, best first
+            stages, days, countries, moods: Keep artists matching any of these
+                (an empty filter keeps everything)
+            rating_filter: Keep artists with any of these ratings (UNRATED for
+                artists without a rating)
+            sort_by: One of SORT_OPTIONS
+            descending: Reverse the sort order
+
+        Returns:
+            Array of the matching artists' positions, in sort order
+        """
+        mask = np.ones(self.size, dtype=bool)
+        for index, keys in (
+            (self.by_stage, stages),
+            (self.by_day, days),
+            (self.by_country, countries),
+            (self.by_mood, moods),
+        ):
+            if keys:
+                mask &= self._mask(index, keys)
+
+        ranks = None
+        if rating_filter or sort_by == "Rating":
+            ranks = self._rating_ranks(ratings, rating_order)
+        if rating_filter:
+            rating_values = [*rating_order, UNRATED]
+            allowed = np.array([rating in rating_filter for rating in rating_values])
+            mask &= allowed[ranks]
+
+        if sort_by == "Rating":
+            order = np.argsort(ranks, kind="stable")
+        else:
+            order = self.sort_orders[sort_by]
+        if descending:
+            order = order[::-1]
+
+        return order[mask[order]]
+
+
+@st.cache_resource(max_entries=16)
+def get_lineup_index(festival, year, digest, _artists, _tag_index=None):
+    """Build the lineup index once per festival-year"""
+    return LineupIndex(_artists, _tag_index)
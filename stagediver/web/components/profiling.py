@@ -0,0 +1,156 @@
+"""
+Opt-in timing of web app reruns.
+
+Set STAGEDIVER_PROFILE=1 to time each rerun, broken down by the sections
+marked with ``timed`` and ``section``, and show the last reruns in a sidebar
+panel. Set STAGEDIVER_PROFILE_DIR to also write a cProfile dump of every rerun
+there (open with ``python -m pstats`` or snakeviz). Only one rerun is profiled
+at a time, since Python 3.12+ allows one active profiler; reruns of other
+sessions in the meantime are only timed.
+
+Both are read once at startup. When profiling is off, ``timed`` returns the
+function itself and ``section`` a shared no-op context manager, so marked code
+runs as if it were not marked.
+"""
+
+import cProfile
+import functools
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+import streamlit as st
+
+PROFILE_DIR = os.environ.get("STAGEDIVER_PROFILE_DIR")
+ENABLED = bool(os.environ.get("STAGEDIVER_PROFILE") or PROFILE_DIR)
+RECENT_RERUNS = 20
+
+_NO_SECTION = nullcontext()
+_local = threading.local()
+# Held while a rerun is being profiled
+_profiler_lock = threading.Lock()
+
+
+class RerunTimings:
+    """Time spent in each section of one rerun"""
+
+    def __init__(self, page):
+        self.page = page
+        self.started_at = time.time()
+        self.total_ms = 0.0
+        self.sections = {}  # name -> [milliseconds, calls]
+
+    def add(self, name, ms):
+        timing = self.sections.setdefault(name, [0.0, 0])
+        timing[0] += ms
+        timing[1] += 1
+
+
+@contextmanager
+def _timed_section(name):
+    rerun = getattr(_local, "rerun", None)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if rerun is not None:
+            rerun.add(name, (time.perf_counter() - start) * 1000)
+
+
+def section(name):
+    """Time a block of code as part of the current rerun"""
+    return _timed_section(name) if ENABLED else _NO_SECTION
+
+
+def timed(func):
+    """Time every call of a function as part of the current rerun"""
+    if not ENABLED:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _timed_section(func.__name__):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def profile_rerun(page):
+    """Time (and optionally cProfile) a page's main function on each rerun"""
+
+    def decorator(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper():
+            rerun = _local.rerun = RerunTimings(page)
+            profiler = _start_profiler() if PROFILE_DIR else None
+            start = time.perf_counter()
+            try:
+                func()
+            finally:
+                # Also reached when the page calls st.rerun() or st.stop()
+                if profiler:
+                    profiler.disable()
+                    _profiler_lock.release()
+                rerun.total_ms = (time.perf_counter() - start) * 1000
+                _local.rerun = None
+                reruns = st.session_state.setdefault(
+                    "profile_reruns", deque(maxlen=RECENT_RERUNS)
+                )
+                reruns.append(rerun)
+                if profiler:
+                    _dump_profile(profiler, rerun)
+            show_profile_panel(reruns)
+
+        return wrapper
+
+    return decorator
+
+
+def _start_profiler():
+    """Start profiling this thread, unless another rerun is being profiled"""
+    if not _profiler_lock.acquire(blocking=False):
+        return None
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another profiler is active, e.g. the app runs under cProfile itself
+        _profiler_lock.release()
+        return None
+    return profiler
+
+
+def _dump_profile(profiler, rerun):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(rerun.started_at))
+    millis = int(rerun.started_at * 1000) % 1000
+    profiler.dump_stats(
+        os.path.join(PROFILE_DIR, f"{rerun.page}_{stamp}.{millis:03d}.prof")
+    )
+
+
+def show_profile_panel(reruns):
+    """Show the last reruns' timings by section in the sidebar"""
+    rows = [
+        {
+            "page": rerun.page,
+            "total": round(rerun.total_ms, 1),
+            **{name: round(ms, 1) for name, (ms, _) in rerun.sections.items()},
+        }
+        for rerun in reversed(reruns)
+    ]
+    with st.sidebar.expander("⏱️ Rerun timings (ms)"):
+        st.dataframe(rows, hide_index=True)
+        calls = {
+            name: count for name, (_, count) in reruns[-1].sections.items() if count > 1
+        }
+        if calls:
+            st.caption(
+                "Calls in the last rerun: "
+                + ", ".join(f"{name} ×{count}" for name, count in calls.items())
+            )
@@ -0,0 +1,93 @@
+import heapq
+
+import streamlit as st
+
+from stagediver.web.components.ratings import get_rating_listener
+from stagediver.web.components.recommender import (
+    LIKED_RATING,
+    SCORE_DIGITS,
+    get_similarity_scores,
+)
+
+# Number of artists after the current one whose players are prefetched
+PREFETCH_COUNT = 3
+
+
+class RatingQueue:
+    """
+    Unrated artists of one festival-year, most promising first.
+
+    Artists are kept in a heap ordered by similarity to the user's liked
+    artists, then lineup order. Rating changes only touch the changed artist
+    and its similar artists; outdated heap entries are skipped when read.
+    """
+
+    def __init__(self, artists, ratings):
+        self.artists = {artist["artist_name"]: artist for artist in artists}
+        self.positions = {name: i for i, name in enumerate(self.artists)}
+        self.scores = get_similarity_scores(artists, ratings)
+        self.unrated = {name for name in self.artists if name not in ratings}
+        self._heap = [self._entry(name) for name in self.unrated]
+        heapq.heapify(self._heap)
+
+    def _entry(self, name):
+        return (-self.scores.get(name, 0.0), self.positions[name], name)
+
+    def update(self, name, old_rating, new_rating):
+        """Apply one rating change"""
+        if name not in self.artists:
+            return
+
+        # Liking (or un-liking) an artist moves its similar artists
+        if (old_rating == LIKED_RATING) != (new_rating == LIKED_RATING):
+            sign = 1 if new_rating == LIKED_RATING else -1
+            for similar in (
+                self.artists[name].get("other_data", {}).get("similar_to", [])
+            ):
+                other = similar["artist_name"]
+                if other not in self.artists:
+                    continue
+                self.scores[other] = round(
+                    self.scores[other] + sign * similar["score"], SCORE_DIGITS
+                )
+                if other in self.unrated:
+                    heapq.heappush(self._heap, self._entry(other))
+
+        if new_rating:
+            self.unrated.discard(name)
+        elif name not in self.unrated:
+            self.unrated.add(name)
+            heapq.heappush(self._heap, self._entry(name))
+
+    def _is_current(self, entry):
+        score, _, name = entry
+        return name in self.unrated and -score == self.scores.get(name, 0.0)
+
+    def peek(self, count=1 + PREFETCH_COUNT):
+        """
+        Get the next artists to rate.
+
+        Args:
+            count: Number of artists to return
+
+        Returns:
+            List of artist names, most promising first
+        """
+        upcoming = []
+        while self._heap and len(upcoming) < count:
+            entry = heapq.heappop(self._heap)
+            # Drop artists rated since, and entries superseded by a new score
+            if self._is_current(entry) and entry not in upcoming:
+                upcoming.append(entry)
+        for entry in upcoming:
+            heapq.heappush(self._heap, entry)
+
+        return [name for _, _, name in upcoming]
+
+
+def get_rating_queue(festival, year, digest, artists):
+    """Get the rating queue for a festival-year's lineup, building it on first use"""
+    return get_rating_listener(
+        ("queue", festival, year, digest),
+        lambda: RatingQueue(artists, st.session_state.ratings),
+    )
@@ -0,0 +1,150 @@
+import streamlit as st
+
+from stagediver.export import RATING_INFO
+from stagediver.models.identity import ArtistIdentityIndex
+from stagediver.web.components.lineup_cache import lineup_digest
+
+
+class RatingStats:
+    """Rating counts for one festival-year, updated incrementally"""
+
+    def __init__(self, artists, ratings):
+        names = [artist["artist_name"] for artist in artists if artist["artist_name"]]
+        self.artist_names = frozenset(names)
+        self.total_concerts = len(names)
+        self.counts = {emoji: 0 for emoji in RATING_INFO}
+        for name in self.artist_names:
+            if (rating := ratings.get(name)) in self.counts:
+                self.counts[rating] += 1
+        self._table_html = None
+
+    @property
+    def rated_concerts(self):
+        return sum(self.counts.values())
+
+    def update(self, name, old_rating, new_rating):
+        """Move one artist between rating counts"""
+        if name not in self.artist_names or old_rating == new_rating:
+            return
+        if old_rating in self.counts:
+            self.counts[old_rating] -= 1
+        if new_rating in self.counts:
+            self.counts[new_rating] += 1
+        self._table_html = None
+
+    @property
+    def table_html(self):
+        """Proportional rating table, rendered again only when counts change"""
+        if self._table_html is None:
+            self._table_html = render_rating_table(self.counts)
+        return self._table_html
+
+
+def render_rating_table(rating_counts):
+    """Render rating counts as a proportional HTML table"""
+    total_rated = sum(rating_counts.values())
+
+    # Filter out ratings with 0 count
+    active_ratings = {
+        emoji: (count, count / total_rated * 100)
+        for emoji, count in rating_counts.items()
+        if count > 0
+    }
+    if not active_ratings:
+        return ""
+
+    return f"""
+        <style>
+            .rating-table {{
+                width: 100%;
+            }}
+            .rating-table, .rating-table tr, .rating-table td {{
+                border: none !important;
+            }}
+            .rating-cell {{
+                padding: 8px;
+                text-align: center;
+                color: white;
+            }}
+            .rating-cell:first-child {{
+                border-top-left-radius: 0.5rem;
+                border-bottom-left-radius: 0.5rem;
+            }}
+            .rating-cell:last-child {{
+                border-top-right-radius: 0.5rem;
+                border-bottom-right-radius: 0.5rem;
+            }}
+            {''.join(
+                f'.rating-cell.{info["short_name"]} {{ background-color: {info["bg_color"]}; }}'
+                for info in RATING_INFO.values()
+            )}
+        </style>
+        <table class="rating-table">
+            <tr>
+                {''.join(
+                    f'<td class="rating-cell {RATING_INFO[emoji]["short_name"]}" style="width: {percentage}%">'
+                    f'{emoji}<br>{count}</td>'
+                    for emoji, (count, percentage) in active_ratings.items()
+                )}
+            </tr>
+        </table>
+        """
+
+
+def get_rating_listener(key, factory):
+    """Get a session object that is kept in sync with ratings via its update method"""
+    listeners = st.session_state.setdefault("rating_listeners", {})
+    if key not in listeners:
+        listeners[key] = factory()
+    return listeners[key]
+
+
+def get_rating_stats(festival, year, digest, artists):
+    """Get the rating stats for a festival-year's lineup, building them on first use"""
+    return get_rating_listener(
+        ("stats", festival, year, digest),
+        lambda: RatingStats(artists, st.session_state.ratings),
+    )
+
+
+def set_rating(name, rating):
+    """Set (or clear, if rating is empty) an artist's rating and notify listeners"""
+    ratings = st.session_state.ratings
+    old_rating = ratings.get(name)
+    if rating:
+        ratings[name] = rating
+    else:
+        ratings.pop(name, None)
+
+    for listener in st.session_state.get("rating_listeners", {}).values():
+        listener.update(name, old_rating, rating)
+
+
+def replace_ratings(new_ratings):
+    """Replace all ratings, e.g. after an import"""
+    st.session_state.ratings = new_ratings
+    st.session_state.rating_listeners = {}
+    st.session_state.ratings_carried_over = set()
+
+
+@st.cache_resource(max_entries=4)
+def get_identity_index(lineup_keys, _lineups):
+    """Build the cross-festival artist identity index once per set of lineups"""
+    return ArtistIdentityIndex.from_lineups(_lineups)
+
+
+def carry_over_ratings(lineups, festival, year, artists):
+    """Rate artists already rated at another festival-year, once per session"""
+    carried_over = st.session_state.setdefault("ratings_carried_over", set())
+    if (festival, year) in carried_over:
+        return
+    carried_over.add((festival, year))
+
+    lineup_keys = tuple(
+        (lineup["festival_name"], lineup["festival_year"], lineup_digest(lineup))
+        for lineup in lineups
+    )
+    index = get_identity_index(lineup_keys, lineups)
+    ratings = st.session_state.ratings
+    for name, rating in index.carry_over(ratings, festival, year, artists).items():
+        set_rating(name, rating)
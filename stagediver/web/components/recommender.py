@@ -0,0 +1,18 @@
+from collections import defaultdict
+
+LIKED_RATING = "❤️"
+# Scores are rounded, so adding and removing a like gives back the same score
+SCORE_DIGITS = 9
+
+
+def get_similarity_scores(artists, ratings):
+    """Sum the precomputed similarity of every artist to the user's liked picks"""
+    scores = defaultdict(float)
+    for artist in artists:
+        if ratings.get(artist["artist_name"]) != LIKED_RATING:
+            continue
+        for similar in artist.get("other_data", {}).get("similar_to", []):
+            scores[similar["artist_name"]] += similar["score"]
+    for name, score in scores.items():
+        scores[name] = round(score, SCORE_DIGITS)
+    return scores
@@ -0,0 +1,245 @@
+"""
+Session state memory accounting and limits.
+
+A session's state is measured by walking its values and adding up the
+``sys.getsizeof`` of every object reachable from them, each counted once.
+Lineups in ``artists_data`` come from the shared lineup cache, so they and
+everything in them (e.g. the artist dicts rating queues hold on to) are counted
+once per process instead of once per session.
+
+Set STAGEDIVER_MEMORY=1 (read once at startup) to measure each session on
+every rerun and show a sidebar panel with the session's largest keys, keys
+over OVERSIZED_KEY_BYTES and totals across the active sessions of this
+process. Sessions over SESSION_LIMIT_BYTES then have their transient values
+evicted.
+
+Transient values (TRANSIENT_TTL, e.g. the clicked calendar event) are always
+limited: they are evicted once they are older than their TTL, and values over
+MAX_TRANSIENT_BYTES are not stored at all.
+"""
+
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from types import ModuleType
+from typing import AbstractSet, Any, Dict, FrozenSet, Mapping, NamedTuple, Tuple
+
+import streamlit as st
+
+from stagediver.web.components.lineup_cache import lineup_digest
+
+ENABLED = bool(os.environ.get("STAGEDIVER_MEMORY"))
+
+# Keys this large are flagged in the memory panel
+OVERSIZED_KEY_BYTES = 256 * 1024
+# Sessions this large have their transient values evicted
+SESSION_LIMIT_BYTES = 2 * 1024 * 1024
+# Sessions not measured for this long are taken to be closed
+SESSION_TTL = 30 * 60
+
+# Seconds a transient value is kept after it was set, by key
+TRANSIENT_TTL = {"clicked_event": 10 * 60}
+MAX_TRANSIENT_BYTES = 16 * 1024
+
+
+class StateSize(NamedTuple):
+    """Bytes held by a session's state, in total and by key"""
+
+    total: int
+    by_key: Dict[str, int]
+
+
+def deep_size(obj: Any, seen: set, shared: AbstractSet[int] = frozenset()) -> int:
+    """
+    Bytes of an object and everything reachable from it.
+
+    Args:
+        obj: Object to measure
+        seen: Ids of objects already counted (updated in place)
+        shared: Ids of objects not to count, nor look into
+
+    Returns:
+        Bytes of the objects not counted before
+    """
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or id(obj) in shared:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj, 0)
+        # Code, classes and modules belong to the process, not the session
+        if isinstance(obj, (type, ModuleType)) or callable(obj):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            stack.extend(obj)
+        # Objects sizing themselves (e.g. DataFrames) already include their data
+        elif type(obj).__sizeof__ is object.__sizeof__:
+            if hasattr(obj, "__dict__"):
+                stack.append(vars(obj))
+            for name in getattr(type(obj), "__slots__", ()):
+                if hasattr(obj, name):
+                    stack.append(getattr(obj, name))
+    return size
+
+
+def reachable_ids(obj: Any) -> FrozenSet[int]:
+    """Ids of an object and everything reachable from it."""
+    seen = set()
+    deep_size(obj, seen)
+    return frozenset(seen)
+
+
+def measure_state(
+    state: Mapping[str, Any], shared: AbstractSet[int] = frozenset()
+) -> StateSize:
+    """
+    Measure a session's state.
+
+    Args:
+        state: Session state (or any mapping of keys to values)
+        shared: Ids of objects shared between sessions, e.g. everything
+            reachable from the cached lineups (see reachable_ids); they are
+            not counted
+
+    Returns:
+        Total bytes and bytes by key; an object held under several keys is
+        counted for the first key only
+    """
+    seen = set()
+    by_key = {}
+    for key in sorted(state.keys(), key=str):
+        try:
+            by_key[str(key)] = deep_size(state[key], seen, shared)
+        except Exception:  # values Streamlit no longer holds are skipped
+            continue
+    return StateSize(sum(by_key.values()), by_key)
+
+
+class SessionMemoryRegistry:
+    """Latest state size of each active session of this process"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, tuple] = {}  # id -> (measured at, StateSize)
+        # (versions of the measured lineups, ids reachable from them, bytes)
+        self._shared = ((), frozenset(), 0)
+
+    def update(self, session_id: str, size: StateSize) -> None:
+        with self._lock:
+            self._sessions[session_id] = (time.time(), size)
+
+    def shared(self, lineups: list) -> Tuple[FrozenSet[int], int]:
+        """
+        Measure the shared lineups, again only when one of them changes.
+
+        Args:
+            lineups: Lineups from the shared lineup cache
+
+        Returns:
+            Ids of every object reachable from the lineups, and their bytes
+        """
+        key = tuple(lineup_digest(lineup) for lineup in lineups)
+        with self._lock:
+            if self._shared[0] != key:
+                seen = set()
+                size = deep_size(lineups, seen)
+                self._shared = (key, frozenset(seen), size)
+            return self._shared[1:]
+
+    def totals(self) -> Dict[str, int]:
+        """
+        Sum up the active sessions.
+
+        Returns:
+            Dict of session count and total, mean and largest session bytes
+        """
+        now = time.time()
+        with self._lock:
+            self._sessions = {
+                session_id: entry
+                for session_id, entry in self._sessions.items()
+                if now - entry[0] < SESSION_TTL
+            }
+            sizes = [size.total for _, size in self._sessions.values()]
+        return {
+            "sessions": len(sizes),
+            "total": sum(sizes),
+            "mean": sum(sizes) // len(sizes) if sizes else 0,
+            "max": max(sizes, default=0),
+        }
+
+
+@st.cache_resource(max_entries=1)
+def get_session_registry() -> SessionMemoryRegistry:
+    """Get the registry of session sizes shared by all sessions"""
+    return SessionMemoryRegistry()
+
+
+def set_transient(key: str, value: Any) -> None:
+    """Store a transient value, to be evicted after TRANSIENT_TTL[key] seconds"""
+    if deep_size(value, set()) > MAX_TRANSIENT_BYTES:
+        value = None
+    st.session_state[key] = value
+    st.session_state.setdefault("transient_set_at", {})[key] = time.time()
+
+
+def evict_transient(force: bool = False) -> None:
+    """Drop transient values older than their TTL (or all of them if forced)"""
+    set_at = st.session_state.setdefault("transient_set_at", {})
+    now = time.time()
+    for key, ttl in TRANSIENT_TTL.items():
+        if force or now - set_at.get(key, now) > ttl:
+            st.session_state.pop(key, None)
+            set_at.pop(key, None)
+
+
+def _format_kb(size: int) -> str:
+    return f"{size / 1024:,.1f} KB"
+
+
+def track_session_memory() -> None:
+    """Enforce the transient limits and, if enabled, measure this session"""
+    evict_transient()
+    if not ENABLED:
+        return
+
+    registry = get_session_registry()
+    session_id = st.session_state.setdefault("memory_session_id", uuid.uuid4().hex)
+    shared, shared_bytes = registry.shared(st.session_state.get("artists_data") or [])
+    size = measure_state(st.session_state, shared)
+    if size.total > SESSION_LIMIT_BYTES:
+        evict_transient(force=True)
+        size = measure_state(st.session_state, shared)
+    registry.update(session_id, size)
+    show_memory_panel(size, registry.totals(), shared_bytes)
+
+
+def show_memory_panel(size: StateSize, totals: Dict[str, int], shared: int) -> None:
+    """Show this session's largest keys and totals across sessions in the sidebar"""
+    with st.sidebar.expander("🧠 Session memory"):
+        st.caption(
+            f"This session: {_format_kb(size.total)}. "
+            f"{totals['sessions']} active sessions: {_format_kb(totals['total'])} "
+            f"(mean {_format_kb(totals['mean'])}, largest "
+            f"{_format_kb(totals['max'])}), plus {_format_kb(shared)} of shared "
+            "lineups."
+        )
+        largest = sorted(size.by_key.items(), key=lambda item: -item[1])[:10]
+        st.dataframe(
+            [{"key": key, "KB": round(value / 1024, 1)} for key, value in largest],
+            hide_index=True,
+        )
+        if oversized := [
+            key for key, value in size.by_key.items() if value > OVERSIZED_KEY_BYTES
+        ]:
+            st.warning(
+                f"Keys over {_format_kb(OVERSIZED_KEY_BYTES)}: {', '.join(oversized)}"
+            )
@@ -0,0 +1,171 @@
+import base64
+import zlib
+from urllib.parse import urlencode
+
+import streamlit as st
+
+from stagediver.web.components.ratings import RATING_INFO, replace_ratings
+
+# Share links carry the ratings of one festival-year in a query parameter:
+#   version (1 byte) | checksum of the artist list (4 bytes) | flags (1 byte)
+#   | presence bitmask (1 bit per artist) | rating codes (2 bits per rated artist)
+# base64url encoded, with the body after the flags deflated when that is shorter.
+SHARE_LINK_VERSION = 1
+FLAG_DEFLATED = 1
+RATING_CODES = {emoji: code for code, emoji in enumerate(RATING_INFO)}
+CODE_RATINGS = list(RATING_INFO)
+
+
+def get_share_artist_names(artists):
+    """Stable artist ordering the share link bits refer to"""
+    return sorted(
+        {artist["artist_name"] for artist in artists if artist["artist_name"]}
+    )
+
+
+def _checksum(names):
+    return zlib.crc32("\n".join(names).encode()).to_bytes(4, "little")
+
+
+def encode_ratings(ratings, artists):
+    """
+    Encode the ratings of one festival-year's artists as a URL-safe token.
+
+    Args:
+        ratings: Ratings by artist name (other festival-years' are ignored)
+        artists: The lineup's artists
+
+    Returns:
+        base64url token without padding
+    """
+    names = get_share_artist_names(artists)
+    mask = codes = rated = 0
+    for i, name in enumerate(names):
+        if (code := RATING_CODES.get(ratings.get(name))) is not None:
+            mask |= 1 << i
+            codes |= code << (2 * rated)
+            rated += 1
+
+    body = mask.to_bytes((len(names) + 7) // 8, "little") + codes.to_bytes(
+        (2 * rated + 7) // 8, "little"
+    )
+    flags = 0
+    if len(deflated := zlib.compress(body, 9)) < len(body):
+        body, flags = deflated, FLAG_DEFLATED
+
+    payload = bytes([SHARE_LINK_VERSION]) + _checksum(names) + bytes([flags]) + body
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_ratings(token, artists):
+    """
+    Decode a share link token against a festival-year's artists.
+
+    Args:
+        token: Token made by encode_ratings
+        artists: The lineup's artists
+
+    Returns:
+        Dict of rating by artist name
+
+    Raises:
+        ValueError: If the token is malformed, from a newer version, or was
+            made for a different version of the lineup
+    """
+    try:
+        payload = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except ValueError as e:
+        raise ValueError("Invalid share link") from e
+    if len(payload) < 6:
+        raise ValueError("Invalid share link")
+    if payload[0] != SHARE_LINK_VERSION:
+        raise ValueError(f"Unsupported share link version {payload[0]}")
+
+    names = get_share_artist_names(artists)
+    if payload[1:5] != _checksum(names):
+        raise ValueError("The lineup has changed since this link was shared")
+
+    body = payload[6:]
+    if payload[5] & FLAG_DEFLATED:
+        try:
+            body = zlib.decompress(body)
+        except zlib.error as e:
+            raise ValueError("Invalid share link") from e
+
+    mask_size = (len(names) + 7) // 8
+    mask = int.from_bytes(body[:mask_size], "little")
+    if len(body) != mask_size + (2 * bin(mask).count("1") + 7) // 8:
+        raise ValueError("Invalid share link")
+    codes = int.from_bytes(body[mask_size:], "little")
+    ratings = {}
+    for i, name in enumerate(names):
+        if mask >> i & 1:
+            ratings[name] = CODE_RATINGS[codes & 3]
+            codes >>= 2
+    return ratings
+
+
+def get_share_url(festival, year, digest, artists, ratings):
+    """
+    Link to the app that loads these ratings for a festival-year
+
+    The token is only encoded again when the lineup or the ratings changed since
+    the last rerun; hashing the ratings is much cheaper than encoding them.
+    """
+    key = (festival, year, digest, hash(frozenset(ratings.items())))
+    cached_key, token = st.session_state.get("share_token", (None, None))
+    if cached_key != key:
+        token = encode_ratings(ratings, artists)
+        st.session_state.share_token = (key, token)
+    query = urlencode({"festival": festival, "year": year, "ratings": token})
+    base_url = (st.context.url or "").split("?", 1)[0]
+    return f"{base_url}?{query}"
+
+
+def apply_share_link(lineups):
+    """
+    Load ratings from a share link's query parameters, once.
+
+    The festival-year's ratings are replaced by the shared ones and it is
+    selected; ratings for other festival-years are kept.
+
+    Returns:
+        Message to show the user, or None if there was no share link
+    """
+    params = st.query_params
+    if "ratings" not in params:
+        return None
+    token = params["ratings"]
+    festival = params.get("festival")
+    year = params.get("year")
+    for key in ("ratings", "festival", "year"):
+        params.pop(key, None)
+
+    lineup = next(
+        (
+            lineup
+            for lineup in lineups
+            if lineup.get("festival_name") == festival
+            and str(lineup.get("festival_year")) == year
+        ),
+        None,
+    )
+    if lineup is None:
+        return f"⚠️ No lineup for {festival} ({year}) to load the shared ratings into"
+    try:
+        shared = decode_ratings(token, lineup["artists"])
+    except ValueError as e:
+        return f"⚠️ {e}"
+
+    names = set(get_share_artist_names(lineup["artists"]))
+    new_ratings = {
+        name: rating
+        for name, rating in st.session_state.ratings.items()
+        if name not in names
+    }
+    new_ratings.update(shared)
+    replace_ratings(new_ratings)
+    st.session_state.selected_festival = lineup["festival_name"]
+    st.session_state.selected_year = lineup["festival_year"]
+    st.session_state.pop("festival_selector", None)
+    return f"✅ Loaded {len(shared)} shared ratings for {festival} ({year})"
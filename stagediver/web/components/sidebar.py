@@ -1,105 +1,55 @@
 import glob
 import json
 import os
-from datetime import datetime, timedelta
-from pathlib import Path
 
 import streamlit as st
-from ics import Calendar, Event
 
 from stagediver.common import DATA_DIR
+from stagediver.export import (
+    create_calendar_export,
+    ratings_from_export,
+    ratings_to_export,
+)
+from stagediver.web.components.lineup_cache import get_lineup_cache, lineup_digest
+from stagediver.web.components.profiling import section, timed
+from stagediver.web.components.ratings import (
+    carry_over_ratings,
+    get_rating_stats,
+    replace_ratings,
+)
+from stagediver.web.components.session_memory import track_session_memory
+from stagediver.web.components.share_link import apply_share_link, get_share_url
 from stagediver.web.components.utils import get_data_for_festival_year
 
-# Constants
-RATING_INFO = {
-    "❤️": {"text": "Must see", "short_name": "heart", "bg_color": "#ff4b4b"},
-    "🟢": {"text": "Yes", "short_name": "yes", "bg_color": "#177233"},
-    "🟡": {"text": "Meh", "short_name": "meh", "bg_color": "#ffa421"},
-    "🚫": {"text": "No", "short_name": "no", "bg_color": "#808080"},
-}
 
-
-@st.cache_data
+@timed
 def load_lineup_data():
     """Load all lineup data from JSON files in the data directory"""
-    data_files = glob.glob(os.path.join(DATA_DIR, "*.json"))
+    lineup_cache = get_lineup_cache()
     all_data = []
-    for file_path in data_files:
-        try:
-            with open(file_path) as f:
-                data = json.load(f)
-            if isinstance(data, dict) and "artists" in data:
-                all_data.append(data)
-        except (FileNotFoundError, json.JSONDecodeError):
-            # Skip invalid files
-            pass
+    for file_path in sorted(glob.glob(os.path.join(DATA_DIR, "*.json"))):
+        if data := lineup_cache.get(file_path):
+            all_data.append(data)
     return all_data
 
 
-def create_calendar_export(artists_data, ratings):
-    """Create ICS calendar with rated artists"""
-    cal = Calendar()
-
-    for artist in artists_data["artists"]:
-        # Skip artists that haven't been rated or that sucks
-        if (
-            artist["artist_name"] not in ratings
-            or ratings[artist["artist_name"]] == "🚫"
-        ):
-            continue
-
-        event = Event()
-        event.name = f"{ratings[artist['artist_name']]} {artist['artist_name']}"
-        event.begin = artist.get("start_ts") or datetime(
-            artists_data["festival_year"], 7, 1, 13, 37
-        )
-        event.end = artist.get("end_ts") or event.begin + timedelta(hours=1)
-        event.url = artist.get("scrape_url", "")
-        event.location = artist.get("stage_name", "TBA")
-
-        description = artist.get("bio_short", "")
-        if spotify_url := artist.get("social_links", {}).get("spotify"):
-            description += f"\n\n▶️: {spotify_url}"
-        event.description = description
-
-        cal.events.add(event)
-    return cal
-
-
 def export_ratings():
     """Export ratings data as JSON string"""
-    export_data = {
-        info["text"]: sorted(
-            artist
-            for artist, rating in st.session_state.ratings.items()
-            if rating == emoji
-        )
-        for emoji, info in RATING_INFO.items()
-    }
-    export_data["timestamp"] = datetime.now().isoformat()
-    return json.dumps(export_data, indent=2)
+    return json.dumps(ratings_to_export(st.session_state.ratings), indent=2)
 
 
 def import_ratings(json_str):
     """Import ratings data from JSON string"""
     try:
-        data = json.loads(json_str)
-        categories_to_emoji = {
-            info["text"]: emoji for emoji, info in RATING_INFO.items()
-        }
-        new_ratings = {
-            artist: emoji
-            for category, emoji in categories_to_emoji.items()
-            for artist in data.get(category, [])
-        }
-
-        if new_ratings != st.session_state.ratings:
-            st.session_state.ratings = new_ratings
-            return True
-        return False
-    except (json.JSONDecodeError, KeyError):
+        new_ratings = ratings_from_export(json.loads(json_str))
+    except (json.JSONDecodeError, AttributeError):
         return False
 
+    if new_ratings != st.session_state.ratings:
+        replace_ratings(new_ratings)
+        return True
+    return False
+
 
 def get_festivals_and_years(data_list):
     """Extract unique festival/year combinations from all data"""
@@ -111,69 +61,18 @@ def get_festivals_and_years(data_list):
     return festival_years
 
 
-def display_rating_stats(rating_counts, total_concerts, rated_concerts):
+def display_rating_stats(stats):
     """Display rating statistics in a proportional table format"""
     # Display stats text
     st.text(
-        f"You've rated {rated_concerts} out of {total_concerts} concerts ({rated_concerts/total_concerts*100:.0f}%), spread across the following ratings:"
+        f"You've rated {stats.rated_concerts} out of {stats.total_concerts} concerts ({stats.rated_concerts/stats.total_concerts*100:.0f}%), spread across the following ratings:"
     )
 
-    # Calculate percentages for each rating
-    total_rated = sum(rating_counts.values())
-    rating_percentages = {
-        emoji: (count / total_rated * 100) if total_rated > 0 else 0
-        for emoji, count in rating_counts.items()
-    }
-
-    # Filter out ratings with 0 count
-    active_ratings = {
-        emoji: (count, rating_percentages[emoji])
-        for emoji, count in rating_counts.items()
-        if count > 0
-    }
-
-    if active_ratings:
-        st.markdown(
-            f"""
-            <style>
-                .rating-table {{
-                    width: 100%;
-                }}
-                .rating-table, .rating-table tr, .rating-table td {{
-                    border: none !important;
-                }}
-                .rating-cell {{
-                    padding: 8px;
-                    text-align: center;
-                    color: white;
-                }}
-                .rating-cell:first-child {{
-                    border-top-left-radius: 0.5rem;
-                    border-bottom-left-radius: 0.5rem;
-                }}
-                .rating-cell:last-child {{
-                    border-top-right-radius: 0.5rem;
-                    border-bottom-right-radius: 0.5rem;
-                }}
-                {''.join(
-                    f'.rating-cell.{info["short_name"]} {{ background-color: {info["bg_color"]}; }}'
-                    for info in RATING_INFO.values()
-                )}
-            </style>
-            <table class="rating-table">
-                <tr>
-                    {''.join(
-                        f'<td class="rating-cell {RATING_INFO[emoji]["short_name"]}" style="width: {percentage}%">'
-                        f'{emoji}<br>{count}</td>'
-                        for emoji, (count, percentage) in active_ratings.items()
-                    )}
-                </tr>
-            </table>
-            """,
-            unsafe_allow_html=True,
-        )
+    if table_html := stats.table_html:
+        st.markdown(table_html, unsafe_allow_html=True)
 
 
+@timed
 def show_sidebar(layout="centered"):
     """Display the shared sidebar content"""
     st.set_page_config(page_title="Stagediver", page_icon="🎸", layout=layout)
@@ -183,8 +82,11 @@ def show_sidebar(layout="centered"):
         st.session_state.ratings = {}
     if "show_import" not in st.session_state:
         st.session_state.show_import = True
-    if "artists_data" not in st.session_state:
-        st.session_state.artists_data = load_lineup_data()
+    # Only stats the files; changed festival-years are reloaded in the background
+    st.session_state.artists_data = load_lineup_data()
+    if message := apply_share_link(st.session_state.artists_data):
+        st.toast(message)
+    track_session_memory()
 
     # Festival selection
     festival_years = get_festivals_and_years(st.session_state.artists_data)
@@ -222,6 +124,15 @@ def show_sidebar(layout="centered"):
                 st.session_state.selected_year,
             )
 
+            # Ratings given to the same artists at other festival-years apply here
+            if selected_data:
+                carry_over_ratings(
+                    st.session_state.artists_data,
+                    st.session_state.selected_festival,
+                    st.session_state.selected_year,
+                    selected_data["artists"],
+                )
+
             # Ratings import/export
             if st.session_state.show_import:
                 if uploaded_file := st.file_uploader(
@@ -256,12 +167,14 @@ def show_sidebar(layout="centered"):
                         type="tertiary",
                     )
                 with col2:
+                    with section("create_calendar_export"):
+                        calendar_ics = create_calendar_export(
+                            selected_data, st.session_state.ratings
+                        ).serialize()
                     st.download_button(
                         label="Calendar",
                         icon="📅",
-                        data=create_calendar_export(
-                            selected_data, st.session_state.ratings
-                        ).serialize(),
+                        data=calendar_ics,
                         file_name="my_lineup.ics",
                         mime="text/calendar",
                         help="Download your lineup as calendar",
@@ -269,23 +182,27 @@ def show_sidebar(layout="centered"):
                         type="tertiary",
                     )
 
+                st.caption("🔗 Share your ratings for this festival")
+                st.code(
+                    get_share_url(
+                        st.session_state.selected_festival,
+                        st.session_state.selected_year,
+                        lineup_digest(selected_data),
+                        selected_data["artists"],
+                        st.session_state.ratings,
+                    ),
+                    language=None,
+                )
+
                 # Show rating statistics
                 st.divider()
 
-                # Get total concerts and rated count
-                total_concerts = len(
-                    [a for a in selected_data["artists"] if a["artist_name"]]
+                # Counts are kept up to date as ratings change
+                stats = get_rating_stats(
+                    st.session_state.selected_festival,
+                    st.session_state.selected_year,
+                    lineup_digest(selected_data),
+                    selected_data["artists"],
                 )
-                rated_concerts = len(st.session_state.ratings)
-
-                # Count each rating type
-                rating_counts = {
-                    emoji: len(
-                        [r for r in st.session_state.ratings.values() if r == emoji]
-                    )
-                    for emoji in RATING_INFO
-                }
-
-                # Create proportional table for ratings
-                if rating_counts:
-                    display_rating_stats(rating_counts, total_concerts, rated_concerts)
+                if stats.total_concerts:
+                    display_rating_stats(stats)
@@ -0,0 +1,89 @@
+from bisect import bisect_left
+from collections import Counter
+from datetime import date, datetime, time
+
+import streamlit as st
+
+from stagediver.common import (
+    FESTIVAL_DAY_START_HOUR,
+    format_festival_day,
+    get_start_and_day,
+)
+from stagediver.web.components.lineup_index import TBA
+
+# Festival days run from FESTIVAL_DAY_START_HOUR to the same hour the next day,
+# so hours past midnight are written as 24-30
+DAY_HOURS = list(range(FESTIVAL_DAY_START_HOUR, FESTIVAL_DAY_START_HOUR + 25))
+# Stages shown by default host at least this share of the timed sets
+MAIN_STAGE_MIN_SHARE = 0.05
+
+
+def get_stage(artist):
+    """Stage of a set, or TBA if none is announced"""
+    return artist.get("stage_name") or TBA
+
+
+def format_hour(hour):
+    """Format an hour of the festival day as a clock time"""
+    return f"{hour % 24:02d}:00"
+
+
+class TimeIndex:
+    """Timed sets of one festival-year sorted by start, for day and time queries"""
+
+    def __init__(self, artists):
+        timed = []
+        midnights = {}
+        for i, artist in enumerate(artists):
+            start_epoch, festival_day = get_start_and_day(artist)
+            if start_epoch is None:
+                continue
+            timed.append((start_epoch, i))
+            if festival_day not in midnights:
+                # Local midnight starting the festival day, in the set's timezone
+                tzinfo = datetime.fromisoformat(artist["start_ts"]).tzinfo
+                midnights[festival_day] = datetime.combine(
+                    date.fromisoformat(festival_day), time(), tzinfo=tzinfo
+                ).timestamp()
+        timed.sort()
+
+        self.starts = [start for start, _ in timed]
+        self.positions = [i for _, i in timed]
+        self.set_stages = [get_stage(artists[i]) for i in self.positions]
+        self.day_midnights = dict(sorted(midnights.items()))
+        self.days = {day: format_festival_day(day) for day in self.day_midnights}
+        stage_counts = Counter(self.set_stages)
+        self.stages = sorted(stage_counts)
+        self.main_stages = [
+            stage
+            for stage in self.stages
+            if stage_counts[stage] >= MAIN_STAGE_MIN_SHARE * len(self.positions)
+        ]
+
+    def window(self, day, start_hour, end_hour, stages=None):
+        """
+        Find the sets starting in a time window of one festival day.
+
+        Args:
+            day: Festival day (ISO date), one of days
+            start_hour: Start of the window, in hours of the festival day
+            end_hour: End of the window (exclusive); hours past midnight are 24+
+            stages: Stages to keep, as listed in stages (default: all)
+
+        Returns:
+            Positions of the matching artists, by start time
+        """
+        midnight = self.day_midnights[day]
+        lo = bisect_left(self.starts, midnight + start_hour * 3600)
+        hi = bisect_left(self.starts, midnight + end_hour * 3600, lo)
+        if stages is None:
+            return self.positions[lo:hi]
+        return [
+            self.positions[k] for k in range(lo, hi) if self.set_stages[k] in stages
+        ]
+
+
+@st.cache_resource(max_entries=16)
+def get_time_index(festival, year, digest, _artists):
+    """Build the time index once per festival-year"""
+    return TimeIndex(_artists)
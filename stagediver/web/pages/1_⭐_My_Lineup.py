@@ -1,22 +1,58 @@
+import math
+import zlib
+
+import pandas as pd
 import streamlit as st
 
-from stagediver.web.components.sidebar import RATING_INFO, show_sidebar
+from stagediver.web.components.artist_view import country_code_to_flag
+from stagediver.web.components.lineup_cache import lineup_digest
+from stagediver.web.components.lineup_index import (
+    SORT_OPTIONS,
+    UNRATED,
+    get_lineup_index,
+)
+from stagediver.web.components.profiling import profile_rerun, section
+from stagediver.web.components.ratings import RATING_INFO, set_rating
+from stagediver.web.components.sidebar import show_sidebar
 from stagediver.web.components.utils import get_data_for_festival_year
 
+PAGE_SIZES = [50, 100, 250, 500]
+
+
+@st.cache_resource(max_entries=16)
+def get_lineup_table(festival, year, digest, _artists):
+    """Build the rating-independent columns of the lineup table once per festival-year"""
+    return pd.DataFrame(
+        {
+            "Artist": [artist["artist_name"] for artist in _artists],
+            "Stage": [artist.get("stage_name", "TBA") for artist in _artists],
+            "Description": [artist.get("bio_short") or "" for artist in _artists],
+            "Spotify": [
+                artist.get("social_links", {}).get("spotify", "") for artist in _artists
+            ],
+        }
+    )
+
+
+def apply_rating_edits(editor_key, artist_names):
+    """
+    Apply all pending rating edits from the table in one pass
 
-def update_ratings(edited_data, all_artists):
-    """Update session state ratings when table is edited"""
-    for i, artist in enumerate(all_artists):
-        new_rating = edited_data["Rating"][i]
-        current_rating = st.session_state.ratings.get(artist["name"], "")
-        if new_rating != current_rating:
-            if new_rating:  # Only update if a rating was selected
-                st.session_state.ratings[artist["name"]] = new_rating
-            elif artist["name"] in st.session_state.ratings:  # Remove rating if empty
-                del st.session_state.ratings[artist["name"]]
-            st.rerun()
+    Edited rows are positions in the table the editor showed, so they are mapped
+    to artists through the names that editor was created with, never through
+    whatever table the current rerun would show.
+    """
+    for row, changes in st.session_state[editor_key]["edited_rows"].items():
+        if "Rating" not in changes:
+            continue
+        name = artist_names[int(row)]
+        new_rating = changes["Rating"] or ""
+        if new_rating != st.session_state.ratings.get(name, ""):
+            # An empty rating removes the artist's rating
+            set_rating(name, new_rating)
 
 
+@profile_rerun("my_lineup")
 def main():
     # Show shared sidebar with wide layout
     show_sidebar(layout="wide")
@@ -35,70 +71,144 @@ def main():
         )
         return
 
-    # Cache the ratings dictionary lookup
-    ratings_dict = st.session_state.ratings
+    table = get_lineup_table(
+        st.session_state.selected_festival,
+        st.session_state.selected_year,
+        lineup_digest(data),
+        artists,
+    )
 
-    # Create a list of all artists with their full info - optimized version
-    all_artists = [
-        {
-            "name": artist["artist_name"],
-            "rating": ratings_dict.get(artist["artist_name"], ""),
-            "stage": artist.get("stage_name", "TBA"),
-            # Only include bio if it exists
-            "bio": artist.get("bio_short", "") if "bio_short" in artist else "",
-            # Optimize nested dictionary lookup
-            "spotify": (
-                artist.get("social_links", {}).get("spotify", "")
-                if "social_links" in artist
-                else ""
-            ),
-        }
-        for artist in artists
-    ]
-
-    # Create DataFrame only once and reuse
-    data = {
-        "Rating": [artist["rating"] for artist in all_artists],
-        "Artist": [artist["name"] for artist in all_artists],
-        "Stage": [artist["stage"] for artist in all_artists],
-        "Description": [artist["bio"] for artist in all_artists],
-        "Spotify": [artist["spotify"] for artist in all_artists],
-    }
+    index = get_lineup_index(
+        st.session_state.selected_festival,
+        st.session_state.selected_year,
+        lineup_digest(data),
+        artists,
+        data.get("tag_index"),
+    )
 
-    # Display as an editable table
-    edited_data = st.data_editor(
-        data,
-        hide_index=True,
-        height=800,
-        use_container_width=True,
-        column_config={
-            "Rating": st.column_config.SelectboxColumn(
-                "Rating", width="small", options=[""] + list(RATING_INFO.keys())
-            ),
-            "Artist": st.column_config.TextColumn(
-                "Artist",
-                width="medium",
-            ),
-            "Stage": st.column_config.TextColumn(
-                "Stage",
-                width="small",
-            ),
-            "Description": st.column_config.TextColumn(
-                "Description",
-                width="large",
-            ),
-            "Spotify": st.column_config.LinkColumn(
-                "Spotify",
-                width="small",
-                display_text="▶️",
+    # Filters and sorting are served from the precomputed index, so only the
+    # visible page of the table is built and sent to the browser
+    filter_columns = st.columns(5 if index.by_mood else 4)
+    with filter_columns[0]:
+        stages = st.multiselect("Stage", options=sorted(index.by_stage))
+    with filter_columns[1]:
+        days = st.multiselect("Day", options=index.days)
+    with filter_columns[2]:
+        countries = st.multiselect(
+            "Country",
+            options=sorted(index.by_country),
+            format_func=lambda code: f"{country_code_to_flag(code)} {code}",
+        )
+    with filter_columns[3]:
+        rating_filter = st.multiselect(
+            "Rating",
+            options=[*RATING_INFO, UNRATED],
+            format_func=lambda emoji: (
+                f"{emoji} {RATING_INFO[emoji]['text']}"
+                if emoji in RATING_INFO
+                else f"{emoji} Unrated"
             ),
-        },
-        disabled=["Artist", "Stage", "Description", "Spotify"],
-        key="lineup_editor",
+        )
+    moods = []
+    if index.by_mood:
+        with filter_columns[4]:
+            # Tag index precomputed at scrape time
+            moods = st.multiselect(
+                "Mood",
+                options=sorted(index.by_mood),
+                help="Only show artists matching any of the selected moods",
+            )
+
+    sort_column, order_column, size_column = st.columns([2, 1, 1])
+    with sort_column:
+        sort_by = st.selectbox("Sort by", options=SORT_OPTIONS)
+    with order_column:
+        descending = st.toggle("Descending")
+    with size_column:
+        page_size = st.selectbox("Artists per page", options=PAGE_SIZES, index=1)
+
+    matches = index.query(
+        st.session_state.ratings,
+        list(RATING_INFO),
+        stages=stages,
+        days=days,
+        countries=countries,
+        moods=moods,
+        rating_filter=rating_filter,
+        sort_by=sort_by,
+        descending=descending,
+    )
+
+    # Keep the page from the previous run, unless the filters left fewer pages
+    page_count = max(1, math.ceil(len(matches) / page_size))
+    page = st.session_state.lineup_page = min(
+        st.session_state.get("lineup_page", 1), page_count
     )
+    first = (page - 1) * page_size
+    positions = matches[first : first + page_size].tolist()
+
+    table = table.iloc[positions].reset_index(drop=True)
 
-    # Check for changes and update ratings
-    update_ratings(edited_data, all_artists)
+    # Only the Rating column changes between reruns
+    artist_names = table["Artist"].tolist()
+    ratings_dict = st.session_state.ratings
+    table.insert(0, "Rating", [ratings_dict.get(name, "") for name in artist_names])
+    # A new page, filter or sort shows other artists in each row, so it gets a
+    # fresh editor: pending edits of the old one never land on the new rows
+    shown = zlib.crc32("\n".join(artist_names).encode())
+    editor_key = f"lineup_editor_{shown:08x}"
+
+    # Display as an editable table
+    # Edits are applied in a callback before the rerun, so any number of
+    # pending edits costs a single round trip
+    with section("data_editor"):
+        st.data_editor(
+            table,
+            hide_index=True,
+            height=800,
+            use_container_width=True,
+            column_config={
+                "Rating": st.column_config.SelectboxColumn(
+                    "Rating", width="small", options=[""] + list(RATING_INFO.keys())
+                ),
+                "Artist": st.column_config.TextColumn(
+                    "Artist",
+                    width="medium",
+                ),
+                "Stage": st.column_config.TextColumn(
+                    "Stage",
+                    width="small",
+                ),
+                "Description": st.column_config.TextColumn(
+                    "Description",
+                    width="large",
+                ),
+                "Spotify": st.column_config.LinkColumn(
+                    "Spotify",
+                    width="small",
+                    display_text="▶️",
+                ),
+            },
+            disabled=["Artist", "Stage", "Description", "Spotify"],
+            key=editor_key,
+            on_change=apply_rating_edits,
+            args=(editor_key, artist_names),
+        )
+
+    caption_column, page_column = st.columns([3, 1], vertical_alignment="center")
+    with caption_column:
+        st.caption(
+            f"Showing {min(first + 1, len(matches))}-{first + len(positions)} "
+            f"of {len(matches)} artists"
+        )
+    with page_column:
+        st.number_input(
+            "Page",
+            min_value=1,
+            max_value=page_count,
+            key="lineup_page",
+            label_visibility="collapsed",
+        )
 
 
 if __name__ == "__main__":
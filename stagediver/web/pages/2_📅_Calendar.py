@@ -1,58 +1,65 @@
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, Optional
 
 import streamlit as st
 from streamlit_calendar import calendar
 
 from stagediver.web.components.artist_card import display_artist_card
-from stagediver.web.components.sidebar import RATING_INFO, show_sidebar
+from stagediver.web.components.artist_view import ArtistView, get_artist_views
+from stagediver.web.components.lineup_cache import lineup_digest
+from stagediver.web.components.profiling import profile_rerun, section, timed
+from stagediver.web.components.ratings import RATING_INFO, set_rating
+from stagediver.web.components.session_memory import set_transient
+from stagediver.web.components.sidebar import show_sidebar
+from stagediver.web.components.time_index import (
+    DAY_HOURS,
+    format_hour,
+    get_stage,
+    get_time_index,
+)
 from stagediver.web.components.utils import get_data_for_festival_year
 
+# Fields of a clicked calendar event kept in session state
+CLICKED_EVENT_FIELDS = ("title", "start", "end")
 
-def create_calendar_event(artist: Dict[str, Any], rating: str) -> Dict[str, Any]:
-    """Creates a calendar event from artist data."""
-    start_time = (
-        datetime.fromisoformat(artist.get("start_ts"))
-        if artist.get("start_ts")
-        else datetime(2024, 7, 1, 13, 37)
-    )
-    end_time = (
-        datetime.fromisoformat(artist.get("end_ts"))
-        if artist.get("end_ts")
-        else start_time + timedelta(hours=1)
-    )
+
+@timed
+def create_calendar_event(view: ArtistView, rating: str) -> Dict[str, Any]:
+    """Creates a calendar event from an artist view."""
+    start = view.start_iso or datetime(2024, 7, 1, 13, 37).isoformat()
+    end = view.end_iso or datetime(2024, 7, 1, 14, 37).isoformat()
+    artist = view.artist
 
     # Get color from RATING_INFO or use gray for unrated
     color = RATING_INFO[rating]["bg_color"] if rating in RATING_INFO else "#a9a9a9"
 
     return {
-        "title": f"{rating} {artist['artist_name']}",
-        "start": start_time.isoformat(),
-        "end": end_time.isoformat(),
-        "resourceId": artist.get("stage_name", "Unknown Stage"),
+        "title": f"{rating} {view.name}",
+        "start": start,
+        "end": end,
+        # The same stage as the resources and stage filter, so no set is hidden
+        "resourceId": get_stage(artist),
         "description": artist.get("bio_short", ""),
         "backgroundColor": color,
         "borderColor": color,
-        "artist_data": artist,
     }
 
 
-def get_calendar_options(events: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Returns calendar configuration options."""
+def get_calendar_options(day: str, start_hour: int, end_hour: int) -> Dict[str, Any]:
+    """Returns calendar configuration options for one festival day."""
     return {
         "editable": False,
         "selectable": True,
-        "initialDate": (
-            events[0]["start"].split("T")[0]
-            if events
-            else datetime.now().strftime("%Y-%m-%d")
-        ),
+        "initialDate": day,
         "initialView": "resourceTimeGridDay",
-        "slotMinTime": "11:00:00",
-        "slotMaxTime": "28:30:00",  # 28:30 represents 04:30 the next day
+        # The day is picked with the filters above, so no navigation buttons
+        "headerToolbar": {"left": "", "center": "title", "right": ""},
+        # Hours past midnight (e.g. 28:30 for 04:30) stay on the same day
+        "slotMinTime": f"{start_hour:02d}:00:00",
+        "slotMaxTime": f"{end_hour:02d}:30:00",
         "resourceGroupField": "building",
         "height": "500px",  # Set a fixed height for the calendar
-        "scrollTime": "17:00:00",
+        "scrollTime": f"{max(start_hour, min(end_hour, 17)):02d}:00:00",
         "slotLabelFormat": {
             "hour": "2-digit",
             "hour12": False,
@@ -62,23 +69,23 @@ def get_calendar_options(events: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 
 def handle_event_click(
-    clicked_event: Dict[str, Any], artists: List[Dict[str, Any]]
+    clicked_event: Dict[str, Any], views: Dict[str, ArtistView]
 ) -> None:
     """Handles calendar event click and displays artist card."""
     artist_name = clicked_event.get("title", "Unknown Artist")[2:]
-    artist = next((a for a in artists if a["artist_name"] == artist_name), None)
 
-    if artist:
-        selected = display_artist_card(artist)
+    if view := views.get(artist_name):
+        selected = display_artist_card(view)
         if selected is not None:
             new_rating = selected.split()[0]  # Get just the emoji
             if new_rating != st.session_state.ratings.get(artist_name, ""):
-                st.session_state.ratings[artist_name] = new_rating
+                set_rating(artist_name, new_rating)
                 st.rerun()
     else:
         st.error(f"Could not find artist data for: {artist_name}")
 
 
+@profile_rerun("calendar")
 def main() -> None:
     """Main function to render the calendar view."""
     # Show shared sidebar with wide layout
@@ -102,37 +109,53 @@ def main() -> None:
         )
         return
 
-    # Create calendar events
-    calendar_events = [
-        create_calendar_event(
-            artist,
-            st.session_state.ratings.get(artist["artist_name"], "⚪"),
-        )
-        for artist in artists
-    ]
+    views = get_artist_views(
+        st.session_state.selected_festival,
+        st.session_state.selected_year,
+        lineup_digest(data),
+        artists,
+    )
 
-    # Get unique stages for resources
-    stages = sorted(set(event["resourceId"] for event in calendar_events))
+    index = get_time_index(
+        st.session_state.selected_festival,
+        st.session_state.selected_year,
+        lineup_digest(data),
+        artists,
+    )
+    if not index.days:
+        st.info("No set times have been announced for this festival yet.")
+        return
 
     # Add filters in a more compact layout
-    col1, col2 = st.columns(2)
+    col1, col2, col3, col4 = st.columns([2, 2, 3, 3])
     with col1:
+        selected_day = st.selectbox(
+            "Day",
+            options=list(index.days),
+            format_func=index.days.get,
+            key="calendar_day",
+            help="Festival day; sets after midnight belong to the night before",
+        )
+
+    with col2:
+        start_hour, end_hour = st.select_slider(
+            "Time",
+            options=DAY_HOURS,
+            value=(DAY_HOURS[0], DAY_HOURS[-1]),
+            format_func=format_hour,
+            key="calendar_hours",
+            help="Show sets starting in this time window",
+        )
+
+    with col3:
         selected_stages = st.multiselect(
             "Stages",
-            options=stages,
-            default=[
-                "Apollo",
-                "Arena",
-                "Avalon",
-                "Gaia",
-                "Gloria",
-                "Orange Scene",
-                "Platform",
-            ],
-            help="Select stages to display",
+            options=index.stages,
+            default=index.main_stages,
+            help="Select stages to display (defaults to the busiest stages)",
         )
 
-    with col2:
+    with col4:
         rating_options = [
             f"{emoji} {info['text']}" for emoji, info in RATING_INFO.items()
         ]
@@ -146,47 +169,50 @@ def main() -> None:
         # Extract just the emoji from the selected ratings
         selected_ratings = [rating.split()[0] for rating in selected_ratings]
 
-    # Filter events and resources
-    filtered_events = [
-        event
-        for event in calendar_events
-        if (
-            # If "⚪" is selected, include unrated events
-            ("⚪" in selected_ratings and event["title"].split()[0] not in RATING_INFO)
-            or
-            # Otherwise, only include events with selected ratings
-            event["title"].split()[0] in selected_ratings
-        )
-    ]
+    # Only the sets in the time window are looked at, not the whole lineup
+    filtered_events = []
+    for position in index.window(
+        selected_day, start_hour, end_hour, set(selected_stages)
+    ):
+        view = views[artists[position]["artist_name"]]
+        rating = st.session_state.ratings.get(view.name, "⚪")
+        # Unrated events show "⚪", which is also how they are filtered
+        if rating not in selected_ratings:
+            continue
+        filtered_events.append(create_calendar_event(view, rating))
 
     filtered_resources = [
         {"id": stage, "building": stage, "title": stage} for stage in selected_stages
     ]
 
     # Configure and render calendar
-    calendar_options = get_calendar_options(filtered_events)
+    calendar_options = get_calendar_options(selected_day, start_hour, end_hour)
     calendar_options["resources"] = filtered_resources
 
     # Create a unique key based on the filters and current ratings state
     ratings_state = "-".join(
         f"{k}:{v}" for k, v in sorted(st.session_state.ratings.items())
     )
-    calendar_key = f"calendar_view_{'-'.join(selected_ratings)}_{'-'.join(selected_stages)}_{ratings_state}"
-
-    calendar_result = calendar(
-        events=filtered_events,
-        options=calendar_options,
-        key=calendar_key,
-        callbacks=["eventClick"],
-    )
+    calendar_key = f"calendar_view_{selected_day}_{start_hour}-{end_hour}_{'-'.join(selected_ratings)}_{'-'.join(selected_stages)}_{ratings_state}"
+
+    with section("calendar"):
+        calendar_result = calendar(
+            events=filtered_events,
+            options=calendar_options,
+            key=calendar_key,
+            callbacks=["eventClick"],
+        )
 
-    # Handle event clicks
+    # Handle event clicks; only the fields needed to find the artist are kept
     if calendar_result and "eventClick" in calendar_result:
-        st.session_state.clicked_event = calendar_result["eventClick"]["event"]
+        event = calendar_result["eventClick"]["event"]
+        set_transient(
+            "clicked_event", {key: event.get(key) for key in CLICKED_EVENT_FIELDS}
+        )
 
     # Display artist card if an event was clicked
     if st.session_state.clicked_event:
-        handle_event_click(st.session_state.clicked_event, artists)
+        handle_event_click(st.session_state.clicked_event, views)
 
 
 if __name__ == "__main__":
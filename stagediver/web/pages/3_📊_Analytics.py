@@ -0,0 +1,123 @@
+import pandas as pd
+import streamlit as st
+
+from stagediver.analytics import LineupAnalytics
+from stagediver.web.components.lineup_cache import lineup_digest
+from stagediver.web.components.profiling import profile_rerun, section
+from stagediver.web.components.sidebar import show_sidebar
+
+PERCENT = st.column_config.NumberColumn(format="%.0f%%")
+
+
+@st.cache_resource(max_entries=4)
+def get_analytics(lineup_keys, _lineups):
+    """Build the analytics tables once per set of loaded lineups"""
+    return LineupAnalytics(_lineups)
+
+
+def label_festival_years(frame: pd.DataFrame) -> pd.DataFrame:
+    """Label rows "<festival> <year>", so tables and charts have one index"""
+    frame = frame.copy()
+    frame.index = [f"{festival} {year}" for festival, year in frame.index]
+    return frame
+
+
+@profile_rerun("analytics")
+def main():
+    # Show shared sidebar with wide layout
+    show_sidebar(layout="wide")
+
+    lineups = st.session_state.artists_data
+    if not lineups:
+        st.info("No lineups found. Scrape a festival first.")
+        return
+
+    # Rebuilt only when a lineup is added or scraped again
+    analytics = get_analytics(
+        tuple(
+            (lineup["festival_name"], lineup["festival_year"], lineup_digest(lineup))
+            for lineup in lineups
+        ),
+        lineups,
+    )
+
+    festivals = st.multiselect(
+        "Festivals",
+        options=list(analytics.sets["festival"].cat.categories),
+        help="Festivals to compare (default: all)",
+    )
+
+    summary_tab, countries_tab, stages_tab, returning_tab = st.tabs(
+        ["Festival-years", "Countries", "Stages", "Returning artists"]
+    )
+
+    with summary_tab, section("festival_years"):
+        summary = label_festival_years(analytics.festival_years(festivals))
+        summary[["scheduled", "new_artists"]] *= 100
+        st.dataframe(
+            summary,
+            column_config={
+                "scheduled": st.column_config.NumberColumn(
+                    "Scheduled", format="%.0f%%", help="Sets with announced times"
+                ),
+                "new_artists": st.column_config.NumberColumn(
+                    "New artists",
+                    format="%.0f%%",
+                    help="Artists not in any earlier lineup",
+                ),
+            },
+        )
+
+    with countries_tab:
+        top = st.slider("Countries", min_value=3, max_value=25, value=10)
+        with section("country_mix"):
+            mix = label_festival_years(analytics.country_mix(festivals, top=top)) * 100
+        st.caption(
+            "Share of each festival-year's artists by country; artists from "
+            "several countries count towards each."
+        )
+        st.bar_chart(mix, y_label="% of artists")
+        st.dataframe(
+            mix,
+            column_config={column: PERCENT for column in mix.columns},
+        )
+
+    with stages_tab:
+        share = st.toggle("Share of sets", help="Show each stage's share of the sets")
+        with section("stage_allocation"):
+            allocation = label_festival_years(
+                analytics.stage_allocation(festivals, share=share)
+            )
+        if share:
+            allocation *= 100
+        st.bar_chart(allocation, y_label="% of sets" if share else "Sets")
+        st.dataframe(
+            allocation,
+            column_config=(
+                {column: PERCENT for column in allocation.columns} if share else None
+            ),
+        )
+
+    with returning_tab:
+        min_appearances = st.number_input(
+            "Festival-years at least", min_value=2, value=2
+        )
+        with section("returning_artists"):
+            returning = analytics.returning_artists(
+                festivals, min_appearances=min_appearances
+            )
+        st.caption(f"{len(returning)} artists in at least {min_appearances} lineups")
+        st.dataframe(
+            returning,
+            hide_index=True,
+            column_config={
+                "artist": "Artist",
+                "appearances": "Festival-years",
+                "first_year": st.column_config.NumberColumn("First", format="%d"),
+                "last_year": st.column_config.NumberColumn("Last", format="%d"),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,16 @@ from datetime import datetime, timedelta
 import streamlit as st
 
 from stagediver.web.components.artist_card import display_artist_card
-from stagediver.web.components.sidebar import RATING_INFO, show_sidebar
+from stagediver.web.components.artist_view import get_artist_views
+from stagediver.web.components.lineup_cache import lineup_digest
+from stagediver.web.components.profiling import profile_rerun, section
+from stagediver.web.components.rating_queue import get_rating_queue
+from stagediver.web.components.ratings import set_rating
+from stagediver.web.components.sidebar import show_sidebar
 from stagediver.web.components.utils import get_data_for_festival_year
 
 
-def get_unrated_artists(artists_data, ratings):
-    """Get list of artists that haven't been rated yet"""
-    return [artist for artist in artists_data if artist["artist_name"] not in ratings]
-
-
+@profile_rerun("stagediver")
 def main():
     # Initialize session state for ratings if not exists
     if "ratings" not in st.session_state:
@@ -73,27 +74,49 @@ Use the sidebar to see overviews of your lineup, and import/export your progress
         st.session_state.selected_year,
     )
     artists = data["artists"] if data else []
+    if not artists:
+        st.info(
+            "No artists found for this festival. Please select a different festival from the sidebar."
+        )
+        return
 
     # Display content based on selected view mode
     if st.session_state.view_mode in ["explore", "blind"]:
-        # Get unrated artists
-        unrated_artists = get_unrated_artists(artists, st.session_state.ratings)
+        # Get the next unrated artists
+        queue = get_rating_queue(
+            st.session_state.selected_festival,
+            st.session_state.selected_year,
+            lineup_digest(data),
+            artists,
+        )
+        upcoming = queue.peek()
 
-        if not unrated_artists:
+        if not upcoming:
             st.success("🎉 You've rated all artists!")
         else:
-            current_artist = unrated_artists[0]
+            views = get_artist_views(
+                st.session_state.selected_festival,
+                st.session_state.selected_year,
+                lineup_digest(data),
+                artists,
+            )
+            current_artist, *next_artists = (views[name] for name in upcoming)
 
             # Create a card-like container
             with st.container():
-                selected = display_artist_card(
-                    current_artist, blind_mode=(st.session_state.view_mode == "blind")
-                )
+                with section("display_artist_card"):
+                    selected = display_artist_card(
+                        current_artist,
+                        blind_mode=(st.session_state.view_mode == "blind"),
+                        prefetch_spotify_ids=[
+                            view.spotify_id for view in next_artists if view.spotify_id
+                        ],
+                    )
 
                 # Handle rating selection
                 if selected is not None:
                     new_rating = selected.split()[0]  # Get just the emoji
-                    st.session_state.ratings[current_artist["artist_name"]] = new_rating
+                    set_rating(current_artist.name, new_rating)
                     st.rerun()
 
 
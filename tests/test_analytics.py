@@ -0,0 +1,143 @@
+import math
+
+import pytest
+
+from stagediver.analytics import LineupAnalytics
+from stagediver.common import save_json_file
+
+
+def artist(name, stage="Arena", countries=("DK",), start_ts=None):
+    return {
+        "artist_name": name,
+        "stage_name": stage,
+        "country_code": list(countries),
+        "start_ts": start_ts,
+    }
+
+
+def lineup(festival, year, artists):
+    return {"festival_name": festival, "festival_year": year, "artists": artists}
+
+
+LINEUPS = [
+    lineup(
+        "Roskilde Festival",
+        2024,
+        [
+            artist("Moderat", countries=["DE"], start_ts="2024-07-03T23:30:00+02:00"),
+            artist("Ghost", "Orange", ["SE"]),
+            artist("Fontaines D.C.", "Orange", ["IE", "GB"]),
+        ],
+    ),
+    lineup(
+        "Roskilde Festival",
+        2025,
+        [
+            artist("Moderat", countries=["DE"], start_ts="2025-07-02T23:30:00+02:00"),
+            artist("Ghost", "Orange", ["SE"], "2025-07-05T21:00:00+02:00"),
+            artist("Tove Lo", "Avalon", ["SE"]),
+            artist("Agnes Obel", "Avalon"),
+        ],
+    ),
+    lineup(
+        "Smukfest",
+        2025,
+        [
+            artist("Tove Lo", countries=["SE"]),
+            artist("Fontaines D.C.", countries=["IE", "GB"]),
+            artist("Lukas Graham"),
+        ],
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def analytics():
+    return LineupAnalytics(LINEUPS)
+
+
+def test_sets_table(analytics):
+    assert len(analytics.sets) == 10
+    assert analytics.sets["start"].notna().sum() == 3
+    moderat = analytics.sets[analytics.sets["artist"] == "Moderat"]
+    # Festival days come from the ISO start time of older lineups
+    assert list(moderat["festival_day"]) == ["2024-07-03", "2025-07-02"]
+
+
+def test_festival_years(analytics):
+    summary = analytics.festival_years()
+
+    roskilde_2025 = summary.loc[("Roskilde Festival", 2025)]
+    assert roskilde_2025["sets"] == 4
+    assert roskilde_2025["stages"] == 3
+    assert roskilde_2025["countries"] == 3
+    assert roskilde_2025["scheduled"] == 0.5
+    # Tove Lo plays Smukfest the same year, which is not an earlier lineup
+    assert roskilde_2025["new_artists"] == 0.5
+    # Fontaines D.C. played Roskilde Festival the year before
+    assert summary.loc[("Smukfest", 2025), "new_artists"] == pytest.approx(2 / 3)
+    # The first year has no earlier lineups to compare with
+    assert math.isnan(summary.loc[("Roskilde Festival", 2024), "new_artists"])
+
+
+def test_festival_years_compare_with_filtered_out_festivals(analytics):
+    summary = analytics.festival_years(["Smukfest"])
+
+    assert list(summary.index) == [("Smukfest", 2025)]
+    assert summary.loc[("Smukfest", 2025), "new_artists"] == pytest.approx(2 / 3)
+
+
+def test_country_mix(analytics):
+    mix = analytics.country_mix()
+
+    assert mix.columns[0] == "SE"
+    # Fontaines D.C. count towards both Ireland and Britain
+    assert mix.loc[("Roskilde Festival", 2024)].sum() == pytest.approx(4 / 3)
+    assert mix.loc[("Smukfest", 2025), "DK"] == pytest.approx(1 / 3)
+
+    top = analytics.country_mix(top=1)
+    assert list(top.columns) == ["SE", "Other"]
+    assert top.loc[("Roskilde Festival", 2024)].to_dict() == pytest.approx(
+        {"SE": 1 / 3, "Other": 1}
+    )
+
+
+def test_stage_allocation(analytics):
+    allocation = analytics.stage_allocation(["Roskilde Festival"])
+
+    assert list(allocation.columns) == ["Orange", "Arena", "Avalon"]
+    assert allocation.loc[("Roskilde Festival", 2025)].to_dict() == {
+        "Orange": 1,
+        "Arena": 1,
+        "Avalon": 2,
+    }
+    shares = analytics.stage_allocation(share=True)
+    assert shares.sum(axis=1).tolist() == pytest.approx([1, 1, 1])
+
+
+def test_returning_artists(analytics):
+    returning = analytics.returning_artists()
+
+    assert list(returning["artist"]) == [
+        "Fontaines D.C.",
+        "Ghost",
+        "Moderat",
+        "Tove Lo",
+    ]
+    assert returning.iloc[0][["appearances", "first_year", "last_year"]].tolist() == [
+        2,
+        2024,
+        2025,
+    ]
+    assert analytics.returning_artists(["Smukfest"]).empty
+
+
+def test_from_dir_skips_files_without_a_festival(tmp_path):
+    for i, data in enumerate(LINEUPS):
+        save_json_file(data, str(tmp_path / f"lineup_{i}.json"))
+    save_json_file({"artists": []}, str(tmp_path / "ratings.json"))
+    save_json_file([{"artist_id": "x"}], str(tmp_path / "spotify_cache.json"))
+
+    analytics = LineupAnalytics.from_dir(str(tmp_path))
+
+    assert len(analytics.festival_years()) == 3
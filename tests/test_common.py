@@ -0,0 +1,125 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from stagediver.common import (
+    get_festival_day,
+    get_start_and_day,
+    iter_json_array,
+    load_json_file,
+    save_json_file,
+)
+from stagediver.scraper import add_performance_times, get_performance_times
+from stagediver.scraper.scraper import RoskildeFestival2025Scraper
+
+CEST = timezone(timedelta(hours=2))
+
+LINEUP = {
+    "festival_name": "Roskilde Festival",
+    "other": {"nested": [1, 2, {"artists": []}]},
+    "artists": [
+        {"artist_name": "Æ Band", "score": 12345.678, "tags": ["a", "b"]},
+        {"artist_name": "Other", "score": -1e-05, "bio": 'quote " and [brackets]'},
+        123456789,
+        None,
+    ],
+    "after": True,
+}
+
+
+@pytest.mark.parametrize("name", ["lineup.json", "lineup.json.gz"])
+@pytest.mark.parametrize("compact", [False, True])
+def test_save_and_load_round_trip(tmp_path, name, compact):
+    filepath = str(tmp_path / "nested" / name)
+    save_json_file(LINEUP, filepath, compact=compact)
+    assert load_json_file(filepath) == LINEUP
+
+
+def test_failed_save_keeps_the_old_file(tmp_path, monkeypatch):
+    filepath = str(tmp_path / "lineup.json")
+    save_json_file({"version": 1}, filepath)
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError):
+        save_json_file({"version": 2}, filepath)
+
+    assert load_json_file(filepath) == {"version": 1}
+    assert os.listdir(tmp_path) == ["lineup.json"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+@pytest.mark.parametrize("name", ["lineup.json", "lineup.json.gz"])
+def test_iter_json_array_streams_the_items(tmp_path, chunk_size, name):
+    filepath = str(tmp_path / name)
+    save_json_file(LINEUP, filepath)
+
+    items = list(iter_json_array(filepath, chunk_size=chunk_size))
+
+    assert items == LINEUP["artists"]
+
+
+def test_iter_json_array_without_items(tmp_path):
+    filepath = str(tmp_path / "lineup.json")
+    save_json_file({"festival_name": "Empty", "artists": []}, filepath)
+    assert list(iter_json_array(filepath)) == []
+    assert list(iter_json_array(filepath, key="missing")) == []
+
+    save_json_file({}, filepath)
+    assert list(iter_json_array(filepath)) == []
+
+
+def test_iter_json_array_rejects_other_json(tmp_path):
+    filepath = str(tmp_path / "lineup.json")
+    save_json_file(["not", "an", "object"], filepath)
+    with pytest.raises(ValueError):
+        list(iter_json_array(filepath))
+
+
+@pytest.mark.parametrize(
+    "local_time, festival_day",
+    [
+        ("2025-07-03T23:30", "2025-07-03"),
+        ("2025-07-04T01:30", "2025-07-03"),
+        ("2025-07-04T05:59", "2025-07-03"),
+        ("2025-07-04T06:00", "2025-07-04"),
+    ],
+)
+def test_night_sets_belong_to_the_day_before(local_time, festival_day):
+    start_time = datetime.fromisoformat(local_time).replace(tzinfo=CEST)
+    assert get_festival_day(start_time) == festival_day
+
+
+def test_localized_times_follow_daylight_saving():
+    localize = RoskildeFestival2025Scraper.localize
+
+    summer = localize(datetime(2025, 7, 4, 7, 0))
+    winter = localize(datetime(2025, 1, 10, 7, 0))
+
+    assert summer.utcoffset() == timedelta(hours=2)
+    assert winter.utcoffset() == timedelta(hours=1)
+    times = get_performance_times(summer, summer + timedelta(hours=1))
+    assert times == {
+        "start_epoch": int(datetime(2025, 7, 4, 5, tzinfo=timezone.utc).timestamp()),
+        "end_epoch": int(datetime(2025, 7, 4, 6, tzinfo=timezone.utc).timestamp()),
+        # By local time: 05:00 UTC would still be the night before
+        "festival_day": "2025-07-04",
+    }
+
+
+def test_start_and_day_of_old_lineups():
+    old = {"start_ts": "2025-07-04T01:30:00+02:00", "end_ts": None}
+    epoch = int(datetime(2025, 7, 3, 23, 30, tzinfo=timezone.utc).timestamp())
+
+    assert get_start_and_day(old) == (epoch, "2025-07-03")
+    assert get_start_and_day({"start_ts": None}) == (None, None)
+
+    # Enriching an old lineup adds the precomputed fields, which then win
+    add_performance_times([old])
+    assert old["start_epoch"] == epoch
+    assert old["end_epoch"] is None
+    old["festival_day"] = "precomputed"
+    assert get_start_and_day(old) == (epoch, "precomputed")
@@ -0,0 +1,145 @@
+import os
+from datetime import datetime
+
+import pytest
+
+from stagediver.scraper.embedded import (
+    embedded_artist_details,
+    extract_embedded_data,
+    find_artist_records,
+    record_details,
+)
+from stagediver.scraper.scraper import RoskildeFestival2025Scraper
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+BASE_URL = "https://festival.test"
+URLS = [
+    f"{BASE_URL}/program/{slug}"
+    for slug in ("moderat", "ghost", "late-addition", "unlisted")
+]
+MODERAT, GHOST, LATE_ADDITION, UNLISTED = URLS
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def localize(local_time):
+    return RoskildeFestival2025Scraper.localize(local_time)
+
+
+class FixtureResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FixtureSession:
+    """Serves the saved program page"""
+
+    def get(self, url):
+        assert url == f"{BASE_URL}/program"
+        return FixtureResponse(read_fixture("roskilde_program.html"))
+
+
+class FixtureScraper(RoskildeFestival2025Scraper):
+    """Roskilde 2025 scraper reading saved pages instead of the festival site"""
+
+    base_url = BASE_URL
+
+    def _setup_cookies(self):
+        self.session = FixtureSession()
+        self.fetched = []
+
+    def _fetch_page(self, url):
+        self.fetched.append(url)
+        return read_fixture(f"roskilde_artist_{url.rsplit('/', 1)[-1]}.html")
+
+
+@pytest.fixture(scope="module")
+def payload():
+    return extract_embedded_data(read_fixture("roskilde_program.html"))
+
+
+def test_extract_embedded_data_prefers_next_data(payload):
+    # Not the schema.org JSON-LD script that comes first on the page
+    assert payload["page"] == "/program"
+    assert len(payload["props"]["pageProps"]["program"]["artists"]) == 3
+
+
+def test_extract_embedded_data_without_payload():
+    assert extract_embedded_data(read_fixture("roskilde_artist_ghost.html")) is None
+
+
+def test_find_artist_records(payload):
+    records = find_artist_records(payload, URLS)
+
+    assert sorted(records) == sorted([MODERAT, GHOST, LATE_ADDITION])
+    # Moderat's record links to Ghost too, but Ghost's own record is bigger
+    assert records[GHOST]["id"] == 102
+    assert records[MODERAT]["id"] == 101
+
+
+def test_record_details_of_a_full_record(payload):
+    details = record_details(find_artist_records(payload, URLS)[MODERAT], localize)
+
+    assert details == {
+        "start_ts": datetime.fromisoformat("2025-07-03T23:30:00+02:00"),
+        "performance_date": "2025-07-03",
+        "stage": "Arena",
+        "short_description": "Berlin electronica trio",
+        "long_description": "Moderat return with a new live show.\nExpect lasers.",
+        "country_code": ["DE"],
+        "spotify_link": "https://open.spotify.com/artist/2exkZbmNqMKnT8LRWuxWgy",
+    }
+
+
+def test_record_details_skip_nested_objects_of_their_own(payload):
+    details = record_details(find_artist_records(payload, URLS)[GHOST], localize)
+
+    # The image's description is not the artist's
+    assert "long_description" not in details
+    assert "spotify_link" not in details
+    assert details["stage"] == "Orange"
+    assert details["country_code"] == ["SE"]
+
+
+def test_record_details_leave_out_empty_fields(payload):
+    records = find_artist_records(payload, URLS)
+    assert record_details(records[LATE_ADDITION], localize) == {}
+
+
+def test_embedded_artist_details_have_no_placeholders():
+    details = embedded_artist_details(
+        read_fixture("roskilde_program.html"), URLS, localize
+    )
+
+    assert sorted(details) == sorted([MODERAT, GHOST, LATE_ADDITION])
+    assert details[LATE_ADDITION] == {}
+    assert None not in details[GHOST].values()
+
+
+def test_fetch_lineup_falls_back_to_artist_pages():
+    scraper = FixtureScraper()
+
+    lineup = scraper.fetch_lineup(parse_workers=0)
+
+    # Only the artists whose embedded record is incomplete are fetched
+    assert sorted(scraper.fetched) == sorted([GHOST, LATE_ADDITION, UNLISTED])
+    artists = {artist["name"]: artist for artist in lineup.raw_content["artists"]}
+    assert list(artists) == ["Moderat", "Ghost", "Late Addition", "Unlisted"]
+    assert artists["Moderat"]["stage"] == "Arena"
+    assert artists["Ghost"]["long_description"] == (
+        "Papa Emeritus and his Nameless Ghouls.\nBring earplugs."
+    )
+    assert artists["Ghost"]["spotify_link"] == (
+        "https://open.spotify.com/artist/1Qp56T7n950O3EGMsSl81D"
+    )
+    # Empty embedded fields never hide the artist page's values
+    assert artists["Late Addition"]["stage"] == "Avalon"
+    assert artists["Late Addition"]["start_ts"] == datetime.fromisoformat(
+        "2025-07-05T14:00:00+02:00"
+    )
+    assert artists["Late Addition"]["country_code"] == ["GB", "IE"]
+    assert artists["Unlisted"]["stage"] == "TBA"
+    assert artists["Unlisted"]["start_ts"] is None
@@ -0,0 +1,104 @@
+import csv
+import os
+
+from stagediver.common import save_json_file
+from stagediver.export import build_plan, find_clashes, ratings_to_export
+from stagediver.export.batch import export_schedules
+
+
+def artist(name, stage, start=None, end=None):
+    return {
+        "artist_name": name,
+        "stage_name": stage,
+        "start_ts": f"2026-07-01T{start}:00+02:00" if start else None,
+        "end_ts": f"2026-07-01T{end}:00+02:00" if end else None,
+    }
+
+
+LINEUP = {
+    "festival_name": "Roskilde Festival",
+    "festival_year": 2026,
+    "artists": [
+        artist("Early", "Arena", "18:00", "19:00"),
+        artist("Overlap", "Orange", "18:30", "19:30"),
+        artist("Back To Back", "Avalon", "19:30", "20:30"),
+        artist("Skipped", "Apollo", "18:00", "20:00"),
+        artist("Late Night", "Arena", "01:00", "02:00"),
+        artist("Unannounced", "TBA"),
+    ],
+}
+RATINGS = {
+    "Early": "❤️",
+    "Overlap": "🟢",
+    "Back To Back": "🟡",
+    "Skipped": "🚫",
+    "Unannounced": "❤️",
+}
+
+
+def test_find_clashes():
+    clashes = find_clashes(LINEUP["artists"], RATINGS)
+
+    # Sets that only touch do not clash, nor do skipped or unannounced ones
+    assert clashes == [
+        {
+            "artist": "Early",
+            "stage": "Arena",
+            "rating": "❤️",
+            "other_artist": "Overlap",
+            "other_stage": "Orange",
+            "other_rating": "🟢",
+            "overlap_minutes": 30,
+        }
+    ]
+
+
+def test_build_plan_lists_clashes_by_day():
+    plan = build_plan(LINEUP, {**RATINGS, "Late Night": "🟢"})
+
+    assert "Rated 6 of 6 artists: 5 sets planned, 1 clashes." in plan
+    assert "## Wednesday 1 July" in plan
+    assert "- 18:00–19:00 ❤️ Early (Arena) ⚠️ clashes with Overlap" in plan
+    # Sets after midnight belong to the previous festival day
+    assert "## Tuesday 30 June\n\n- 01:00–02:00 🟢 Late Night (Arena)" in plan
+    assert "Unannounced" in plan.split("## Wednesday 1 July")[1]
+
+
+def test_export_schedules(tmp_path):
+    lineup_file = str(tmp_path / "lineup.json")
+    ratings_dir = tmp_path / "ratings"
+    output_dir = str(tmp_path / "exports")
+    save_json_file(LINEUP, lineup_file)
+    save_json_file(ratings_to_export(RATINGS), str(ratings_dir / "alex.json"))
+    save_json_file(
+        ratings_to_export({"Late Night": "🟢"}), str(ratings_dir / "sam.json")
+    )
+    (ratings_dir / "broken.json").write_text("[not a ratings file")
+
+    summary = export_schedules(lineup_file, str(ratings_dir), output_dir, 1)
+
+    by_user = {row["user"]: row for row in summary}
+    assert by_user["alex"] == {
+        "user": "alex",
+        "rated": 5,
+        "planned": 4,
+        "clashes": 1,
+        "error": "",
+    }
+    assert by_user["sam"]["clashes"] == 0
+    assert by_user["broken"]["error"].startswith("Invalid ratings file")
+
+    with open(os.path.join(output_dir, "alex_clashes.csv"), encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [(row["artist"], row["other_artist"]) for row in rows] == [
+        ("Early", "Overlap")
+    ]
+    assert sorted(os.listdir(output_dir)) == [
+        "alex.ics",
+        "alex_clashes.csv",
+        "alex_plan.md",
+        "sam.ics",
+        "sam_clashes.csv",
+        "sam_plan.md",
+        "summary.csv",
+    ]
@@ -0,0 +1,64 @@
+from stagediver.models.identity import ArtistIdentityIndex, normalize_name
+
+
+def artist(name, spotify_id=None):
+    links = {"spotify": f"https://open.spotify.com/artist/{spotify_id}"}
+    return {"artist_name": name, "social_links": links if spotify_id else {}}
+
+
+def lineup(festival, year, *artists):
+    return {"festival_name": festival, "festival_year": year, "artists": list(artists)}
+
+
+def test_normalize_name():
+    assert normalize_name("The Smile") == normalize_name("smile")
+    assert normalize_name("Simon & Garfunkel") == normalize_name("Simon and Garfunkel")
+    assert normalize_name("Sigur Rós") == normalize_name("SIGUR ROS")
+    assert normalize_name("!!!") == "!!!"
+
+
+def test_spotify_id_merges_renamed_acts():
+    index = ArtistIdentityIndex()
+    assert index.add(artist("The Smile", "AAA")) == index.add(artist("Smile!", "AAA"))
+
+
+def test_name_merges_when_one_side_has_no_spotify_id():
+    index = ArtistIdentityIndex()
+    with_id = index.add(artist("Ghost", "AAA"))
+    assert index.add(artist("ghost")) == with_id
+    assert index.lookup(artist("GHOST")) == with_id
+
+    index = ArtistIdentityIndex()
+    without_id = index.add(artist("Ghost"))
+    assert index.add(artist("Ghost", "AAA")) == without_id
+
+
+def test_name_never_merges_different_spotify_ids():
+    index = ArtistIdentityIndex()
+    first = index.add(artist("Ghost", "AAA"))
+    second = index.add(artist("Ghost", "BBB"))
+    assert first != second
+    assert index.add(artist("Ghost", "BBB")) == second
+    assert index.lookup(artist("Ghost", "CCC")) is None
+
+
+def test_carry_over_resolves_rated_artists_by_spotify_id():
+    artists = [
+        artist("GHOST!", "AAA"),
+        artist("Ghost.", "BBB"),
+        artist("Moderat"),
+        artist("The Moderat"),
+    ]
+    index = ArtistIdentityIndex.from_lineups(
+        [
+            lineup("Roskilde", 2025, artist("Ghost", "AAA"), artist("Moderat")),
+            lineup("Roskilde", 2026, *artists),
+        ]
+    )
+
+    carried = index.carry_over(
+        {"Ghost": "❤️", "Moderat": "🟢"}, "Roskilde", 2026, artists
+    )
+
+    # "Ghost." is another act with a similar name; "Moderat" is rated already
+    assert carried == {"GHOST!": "❤️", "The Moderat": "🟢"}
@@ -0,0 +1,65 @@
+import time
+
+from stagediver.common import save_json_file
+from stagediver.web.components.lineup_cache import LineupFileCache, lineup_digest
+
+LINEUP = {
+    "festival_name": "Roskilde Festival",
+    "festival_year": 2026,
+    "scrape_ts": "2026-04-01T00:00:00",
+    "artists": [{"artist_name": "Moderat"}],
+}
+
+
+def wait_for_reload(cache, path, old_data, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while (data := cache.get(path)) is old_data:
+        assert time.monotonic() < deadline, "lineup file was not reloaded"
+        time.sleep(0.01)
+    return data
+
+
+def test_digest_follows_the_file_content_not_the_scrape(tmp_path):
+    path = str(tmp_path / "roskilde_festival__2026.json")
+    save_json_file(LINEUP, path)
+    cache = LineupFileCache()
+    data = cache.get(path)
+    digest = lineup_digest(data)
+
+    # Enriching rewrites the file but keeps its scrape_ts
+    enriched = {**LINEUP, "tag_index": {"mood": {"calm": [0]}}}
+    save_json_file(enriched, path)
+    # The old copy is still served until the reload finishes
+    assert cache.get(path) is data
+    new_data = wait_for_reload(cache, path, data)
+
+    assert new_data["tag_index"] == enriched["tag_index"]
+    assert lineup_digest(new_data) != digest
+    # The copy a session is still rendering keeps the digest of its content
+    assert lineup_digest(data) == digest
+
+
+def test_broken_file_keeps_the_digest_of_the_served_copy(tmp_path):
+    path = str(tmp_path / "roskilde_festival__2026.json")
+    save_json_file(LINEUP, path)
+    cache = LineupFileCache()
+    data = cache.get(path)
+    digest = lineup_digest(data)
+
+    with open(path, "w") as f:
+        f.write('{"artists": [')
+    deadline = time.monotonic() + 5.0
+    while cache._entries[path].digest == digest:
+        assert time.monotonic() < deadline, "lineup file was not reloaded"
+        cache.get(path)
+        time.sleep(0.01)
+
+    assert cache.get(path) is data
+    assert lineup_digest(data) == digest
+
+
+def test_lineups_from_elsewhere_are_hashed_by_content():
+    digest = lineup_digest(dict(LINEUP))
+
+    assert digest == lineup_digest(dict(LINEUP))
+    assert digest != lineup_digest({**LINEUP, "festival_year": 2027})
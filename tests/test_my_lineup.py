@@ -0,0 +1,75 @@
+import importlib.util
+import logging
+import os
+
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.synthetic import write_lineup
+
+PAGE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "stagediver",
+    "web",
+    "pages",
+    "1_⭐_My_Lineup.py",
+)
+# Session state is used without `streamlit run`, which Streamlit warns about
+logging.getLogger("streamlit.runtime.state.session_state_proxy").setLevel(logging.ERROR)
+
+
+@pytest.fixture(scope="module")
+def my_lineup():
+    spec = importlib.util.spec_from_file_location("my_lineup", PAGE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_each_page_of_artists_gets_its_own_editor(tmp_path, monkeypatch):
+    write_lineup(str(tmp_path / "data"), 120)
+    monkeypatch.chdir(tmp_path)
+    at = AppTest.from_file(PAGE, default_timeout=60)
+    at.session_state["ratings"] = {}
+    at.run()
+    first_page = at.dataframe[0].value["Artist"].tolist()
+    first_key = at.dataframe[0].key
+
+    # Ratings only change the Rating column, so pending edits are kept
+    at.session_state["ratings"] = {first_page[0]: "❤️"}
+    at.run()
+    assert at.dataframe[0].key == first_key
+    assert at.dataframe[0].value["Rating"][0] == "❤️"
+
+    at.number_input(key="lineup_page").set_value(2).run()
+    assert not at.exception
+    assert at.dataframe[0].value["Artist"].tolist() != first_page
+    assert at.dataframe[0].key != first_key
+
+
+def test_edits_rate_the_artists_the_editor_showed(my_lineup):
+    st.session_state.clear()
+    st.session_state.ratings = {"Kept": "🟡", "Cleared": "🟢", "Unchanged": "🚫"}
+    st.session_state["lineup_editor_test"] = {
+        "edited_rows": {
+            "0": {"Rating": "❤️"},
+            "2": {"Rating": None},
+            "3": {"Rating": "🚫"},
+            "4": {"Description": "not a rating"},
+        },
+        "added_rows": [],
+        "deleted_rows": [],
+    }
+
+    # Rows are positions in the shown names, not in the current lineup table
+    my_lineup.apply_rating_edits(
+        "lineup_editor_test", ["Liked", "Kept", "Cleared", "Unchanged", "Other"]
+    )
+
+    assert st.session_state.ratings == {
+        "Liked": "❤️",
+        "Kept": "🟡",
+        "Unchanged": "🚫",
+    }
+    st.session_state.clear()
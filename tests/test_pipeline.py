@@ -0,0 +1,65 @@
+import random
+import time
+
+import pytest
+
+from stagediver.scraper.pipeline import format_metrics, run_pipeline
+
+
+def slow_fetch(item):
+    # Later items tend to be fetched first, so results arrive out of order
+    time.sleep(random.uniform(0, 0.002) * (20 - item % 20))
+    return f"page {item}"
+
+
+def parse(page):
+    return page.upper()
+
+
+def failing_fetch(item):
+    if item == 5:
+        raise ConnectionError(f"could not fetch {item}")
+    return f"page {item}"
+
+
+@pytest.mark.parametrize("parse_workers", [0, 2])
+def test_results_keep_input_order(parse_workers):
+    items = list(range(60))
+
+    results, metrics = run_pipeline(
+        items, slow_fetch, parse, fetch_workers=6, parse_workers=parse_workers
+    )
+
+    assert results == [f"PAGE {item}" for item in items]
+    for stage in ("fetch", "parse", "write"):
+        assert metrics[stage]["items"] == len(items)
+        assert metrics[stage]["rate"] > 0
+    assert metrics["parse"]["workers"] == parse_workers
+    assert metrics["elapsed"] > 0
+    assert "fetch: 60 items" in format_metrics(metrics)
+
+
+def test_full_queue_holds_back_the_fetchers():
+    def slow_parse(page):
+        time.sleep(0.005)
+        return page
+
+    items = list(range(40))
+    results, metrics = run_pipeline(
+        items, str, slow_parse, fetch_workers=4, parse_workers=0, queue_size=3
+    )
+
+    assert results == [str(item) for item in items]
+    assert metrics["max_queue"] <= 3
+    assert metrics["fetch"]["blocked"] > 0
+
+
+def test_fetch_errors_stop_the_pipeline():
+    with pytest.raises(ConnectionError, match="could not fetch 5"):
+        run_pipeline(range(50), failing_fetch, parse, fetch_workers=2, parse_workers=0)
+
+
+def test_no_items():
+    results, metrics = run_pipeline([], slow_fetch, parse, parse_workers=0)
+    assert results == []
+    assert metrics["write"]["items"] == 0
@@ -0,0 +1,49 @@
+import logging
+import threading
+
+import streamlit as st
+
+from stagediver.web.components import profiling
+
+# Session state is used without `streamlit run`, which Streamlit warns about
+logging.getLogger("streamlit.runtime.state.session_state_proxy").setLevel(logging.ERROR)
+
+
+def test_overlapping_reruns_profile_one_at_a_time(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, "ENABLED", True)
+    monkeypatch.setattr(profiling, "PROFILE_DIR", str(tmp_path))
+    st.session_state.clear()
+    errors = []
+
+    @profiling.profile_rerun("other")
+    def other_page():
+        pass
+
+    def other_session():
+        try:
+            other_page()
+        except Exception as e:
+            errors.append(e)
+
+    @profiling.profile_rerun("page")
+    def page():
+        # Another session reruns while this one is being profiled
+        thread = threading.Thread(target=other_session)
+        thread.start()
+        thread.join()
+
+    page()
+    # Profiling is free again once the rerun is done
+    other_page()
+
+    assert errors == []
+    assert sorted(path.name.split("_")[0] for path in tmp_path.iterdir()) == [
+        "other",
+        "page",
+    ]
+    assert [rerun.page for rerun in st.session_state.profile_reruns] == [
+        "other",
+        "page",
+        "other",
+    ]
+    st.session_state.clear()
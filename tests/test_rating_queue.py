@@ -0,0 +1,95 @@
+import logging
+
+import pytest
+import streamlit as st
+
+from stagediver.web.components.rating_queue import RatingQueue, get_rating_queue
+from stagediver.web.components.ratings import set_rating
+
+# Session state is used without `streamlit run`, which Streamlit warns about
+logging.getLogger("streamlit.runtime.state.session_state_proxy").setLevel(logging.ERROR)
+
+
+def artist(name, **similar):
+    return {
+        "artist_name": name,
+        "other_data": {
+            "similar_to": [
+                {"artist_name": other, "score": score}
+                for other, score in similar.items()
+            ]
+        },
+    }
+
+
+ARTISTS = [
+    artist("A", C=0.5, D=0.2),
+    artist("B", D=0.4),
+    artist("C"),
+    artist("D"),
+    artist("E", F=0.9),
+    artist("F", Unlisted=1.0),
+]
+
+
+@pytest.fixture
+def queue():
+    st.session_state.clear()
+    st.session_state.ratings = {}
+    yield get_rating_queue("Festival", 2026, "digest", ARTISTS)
+    st.session_state.clear()
+
+
+def rate(queue, name, rating):
+    set_rating(name, rating)
+    upcoming = queue.peek(len(ARTISTS))
+    # The incremental updates keep the same order as a queue built from scratch
+    assert upcoming == RatingQueue(ARTISTS, st.session_state.ratings).peek(len(ARTISTS))
+    return upcoming
+
+
+def test_lineup_order_without_likes(queue):
+    assert queue.peek() == ["A", "B", "C", "D"]
+    assert queue.peek(len(ARTISTS)) == ["A", "B", "C", "D", "E", "F"]
+
+
+def test_liking_moves_similar_artists_up(queue):
+    assert rate(queue, "A", "❤️") == ["C", "D", "B", "E", "F"]
+    # Scores add up across liked artists
+    assert rate(queue, "B", "❤️") == ["D", "C", "E", "F"]
+
+
+def test_other_ratings_only_remove_the_artist(queue):
+    assert rate(queue, "E", "🚫") == ["A", "B", "C", "D", "F"]
+    assert rate(queue, "A", "🟡") == ["B", "C", "D", "F"]
+
+
+def test_re_rating(queue):
+    rate(queue, "A", "❤️")
+    rate(queue, "B", "❤️")
+
+    # No longer liked: A's similar artists lose its scores
+    assert rate(queue, "A", "🟢") == ["D", "C", "E", "F"]
+    # A meh artist becoming liked moves its similar artists up
+    rate(queue, "E", "🟡")
+    assert rate(queue, "E", "❤️") == ["F", "D", "C"]
+
+
+def test_clearing_a_rating_requeues_the_artist(queue):
+    rate(queue, "A", "❤️")
+    rate(queue, "B", "❤️")
+
+    assert rate(queue, "B", "") == ["C", "D", "B", "E", "F"]
+    assert rate(queue, "A", None) == ["A", "B", "C", "D", "E", "F"]
+
+
+def test_everyone_rated(queue):
+    for name in "ABCDEF":
+        set_rating(name, "🟢")
+
+    assert queue.peek() == []
+    assert rate(queue, "D", "") == ["D"]
+
+
+def test_unknown_artists_are_ignored(queue):
+    assert rate(queue, "Not In The Lineup", "❤️") == ["A", "B", "C", "D", "E", "F"]
@@ -0,0 +1,91 @@
+from datetime import date, datetime
+
+from stagediver.scraper.scheduler import (
+    DAY,
+    HOUR,
+    MINUTE,
+    FakeClock,
+    LineupScheduler,
+    refresh_interval,
+)
+
+START = datetime(2026, 7, 1, 12).timestamp()
+
+
+class FarFestival:
+    festival_id = "far__2026"
+
+    @classmethod
+    def festival_dates(cls):
+        return None
+
+
+class LiveFestival:
+    festival_id = "live__2026"
+
+    @classmethod
+    def festival_dates(cls):
+        return date(2026, 6, 27), date(2026, 7, 4)
+
+
+class FlakyFestival(FarFestival):
+    festival_id = "flaky__2026"
+
+
+class RecordingScrape:
+    """Records scrapes, fails FlakyFestival's first and checks they never overlap"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.running = False
+        self.scraped = []
+        self.failed = False
+
+    def __call__(self, scraper):
+        assert not self.running
+        self.running = True
+        try:
+            self.scraped.append((self.clock.now() - START, scraper.festival_id))
+            if isinstance(scraper, FlakyFestival) and not self.failed:
+                self.failed = True
+                raise ConnectionError("festival site is down")
+        finally:
+            self.running = False
+
+
+def test_refresh_interval():
+    dates = date(2026, 6, 27), date(2026, 7, 4)
+    assert refresh_interval(date(2026, 1, 1), None) == DAY
+    assert refresh_interval(date(2026, 3, 1), dates) == DAY
+    assert refresh_interval(date(2026, 5, 1), dates) == 6 * HOUR
+    assert refresh_interval(date(2026, 6, 24), dates) == HOUR
+    assert refresh_interval(date(2026, 6, 30), dates) == 15 * MINUTE
+    assert refresh_interval(date(2026, 7, 10), dates) == 7 * DAY
+
+
+def test_scheduler_refreshes_on_each_cadence_one_at_a_time():
+    clock = FakeClock(START)
+    scrape = RecordingScrape(clock)
+    refreshed = []
+    scheduler = LineupScheduler(
+        [LiveFestival, FlakyFestival, FarFestival],
+        clock=clock,
+        scrape=scrape,
+        on_refresh=lambda festival_id, at: refreshed.append(festival_id),
+    )
+
+    scheduler.run(until=START + HOUR)
+
+    # Due scrapes run in class name order; a failed one is retried in 15 minutes
+    assert scrape.scraped == [
+        (0, "far__2026"),
+        (0, "flaky__2026"),
+        (0, "live__2026"),
+        (15 * MINUTE, "flaky__2026"),
+        (15 * MINUTE, "live__2026"),
+        (30 * MINUTE, "live__2026"),
+        (45 * MINUTE, "live__2026"),
+    ]
+    assert refreshed.count("flaky__2026") == 1
+    assert [success for _, name, success in scheduler.history].count(False) == 1
+    assert clock.now() == START + HOUR
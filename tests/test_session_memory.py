@@ -0,0 +1,44 @@
+from benchmarks.synthetic import make_lineup
+from stagediver.web.components.rating_queue import RatingQueue
+from stagediver.web.components.session_memory import (
+    SessionMemoryRegistry,
+    deep_size,
+    measure_state,
+    reachable_ids,
+)
+
+
+def test_state_referencing_shared_artists_measures_near_zero():
+    lineups = [make_lineup(300)]
+    artists = lineups[0]["artists"]
+    ratings = {artists[0]["artist_name"]: "❤️"}
+    state = {
+        "artists_data": lineups,
+        "ratings": ratings,
+        # Listeners hold on to the lineup's artist dicts
+        "rating_listeners": {
+            ("queue", "Synthetic Festival"): RatingQueue(artists, ratings)
+        },
+        "selected_artists": artists[:50],
+    }
+
+    unshared = measure_state(state)
+    size = measure_state(state, reachable_ids(lineups))
+
+    assert unshared.total > deep_size(lineups, set())
+    assert size.by_key["artists_data"] == 0
+    assert size.by_key["selected_artists"] < 1024
+    # The queue's own dicts, sets and heap remain, a fraction of the lineup
+    assert size.total < unshared.total / 10
+
+
+def test_registry_measures_shared_lineups_once():
+    lineups = [make_lineup(50)]
+    registry = SessionMemoryRegistry()
+
+    shared, size = registry.shared(lineups)
+
+    assert size == deep_size(lineups, set())
+    assert id(lineups[0]["artists"][0]) in shared
+    assert registry.shared(lineups)[0] is shared
+    assert registry.shared(lineups + [make_lineup(5)])[0] is not shared
@@ -0,0 +1,53 @@
+import base64
+
+import pytest
+
+from stagediver.web.components.share_link import (
+    CODE_RATINGS,
+    decode_ratings,
+    encode_ratings,
+)
+
+ARTISTS = [{"artist_name": f"Artist {i:04d}"} for i in range(500)]
+
+
+@pytest.mark.parametrize("rated", [0, 1, 7, 100, 500])
+def test_share_link_round_trip(rated):
+    ratings = {
+        f"Artist {i:04d}": CODE_RATINGS[i % len(CODE_RATINGS)] for i in range(rated)
+    }
+    # Ratings of other festival-years are left out of the link
+    token = encode_ratings({**ratings, "Elsewhere": CODE_RATINGS[0]}, ARTISTS)
+
+    assert decode_ratings(token, ARTISTS) == ratings
+
+
+def test_share_link_is_short():
+    ratings = {artist["artist_name"]: CODE_RATINGS[0] for artist in ARTISTS[::10]}
+    assert len(encode_ratings(ratings, ARTISTS)) < 120
+
+
+def test_share_link_does_not_depend_on_lineup_order():
+    ratings = {"Artist 0003": CODE_RATINGS[1]}
+    token = encode_ratings(ratings, ARTISTS)
+    assert decode_ratings(token, ARTISTS[::-1]) == ratings
+
+
+def test_share_link_for_a_changed_lineup_is_rejected():
+    token = encode_ratings({"Artist 0003": CODE_RATINGS[1]}, ARTISTS)
+    with pytest.raises(ValueError, match="lineup has changed"):
+        decode_ratings(token, ARTISTS + [{"artist_name": "Late Addition"}])
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "",
+        "not base64!",
+        base64.urlsafe_b64encode(b"\x02" + bytes(8)).decode(),
+        encode_ratings({"Artist 0003": CODE_RATINGS[1]}, ARTISTS)[:-4],
+    ],
+)
+def test_invalid_share_links_are_rejected(token):
+    with pytest.raises(ValueError):
+        decode_ratings(token, ARTISTS)
@@ -0,0 +1,89 @@
+from stagediver.scraper.similarity import add_similar_artists, build_tfidf_matrix
+
+# Unrelated bios, so shared terms stay under the max_df cutoff
+OTHERS = [
+    {"artist_name": f"Other {word}", "bio_short": word}
+    for word in ("jazz", "folk", "reggae", "opera", "blues", "polka")
+]
+
+
+def artist(name, bio):
+    return {"artist_name": name, "bio_short": bio, "bio_long": None}
+
+
+def similar(artist):
+    return [
+        (other["artist_name"], other["score"])
+        for other in artist["other_data"]["similar_to"]
+    ]
+
+
+def test_tfidf_rows_are_normalised():
+    matrix = build_tfidf_matrix(
+        ["dark techno warehouse", "dark techno rave", "acoustic folk", "nothing"],
+        max_df=1.0,
+    )
+
+    assert matrix.shape[0] == 4
+    assert abs(float((matrix[0] ** 2).sum()) - 1.0) < 1e-6
+    # Terms in a single document are left out, so this row is all zeros
+    assert not matrix[2].any()
+
+
+def test_neighbours_are_ranked_by_shared_terms():
+    artists = [
+        artist("Techno", "dark techno warehouse rave all night"),
+        artist("Rave", "dark techno warehouse rave"),
+        artist("Warehouse", "warehouse party with dark lights"),
+        artist("Folk", "acoustic folk songs about the sea"),
+        artist("Sea Shanties", "acoustic songs about the sea"),
+        artist("Jazz", "smooth jazz trio"),
+    ]
+
+    add_similar_artists(artists)
+
+    names = [name for name, _ in similar(artists[0])]
+    assert names == ["Rave", "Warehouse"]
+    scores = [score for _, score in similar(artists[0])]
+    assert scores == sorted(scores, reverse=True)
+    assert [name for name, _ in similar(artists[3])] == ["Sea Shanties"]
+    # No shared terms, no neighbours
+    assert similar(artists[5]) == []
+
+
+def test_never_similar_to_itself_and_limited():
+    artists = [artist(f"Artist {i}", "dark techno") for i in range(5)] + OTHERS
+
+    add_similar_artists(artists, limit=3)
+
+    for a in artists[:5]:
+        names = [name for name, _ in similar(a)]
+        assert a["artist_name"] not in names
+        assert len(names) == 3
+
+
+def test_ties_keep_lineup_order():
+    # Big enough that numpy's partition and sort do not keep ties in order
+    artists = [artist(f"Artist {i}", "dark techno") for i in range(40)]
+    artists += [
+        artist(f"Other {i}", f"solo{chr(97 + i // 26)}{chr(97 + i % 26)}")
+        for i in range(60)
+    ]
+
+    add_similar_artists(artists)
+
+    assert similar(artists[0]) == [(f"Artist {i}", 1.0) for i in range(1, 11)]
+    assert [name for name, _ in similar(artists[39])] == [
+        f"Artist {i}" for i in range(10)
+    ]
+
+
+def test_small_lineups():
+    single = [artist("Solo", "dark techno")]
+    add_similar_artists(single)
+    assert "other_data" not in single[0]
+
+    pair = [artist("A", "dark techno"), artist("B", "dark techno")]
+    add_similar_artists(pair, limit=10)
+    # Every term is in both bios, above the default max_df, so nothing matches
+    assert similar(pair[0]) == []
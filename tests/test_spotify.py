@@ -0,0 +1,95 @@
+import pytest
+
+from stagediver.common import load_json_file, save_json_file
+from stagediver.models import ScrapedData
+from stagediver.scraper import run_scraper
+from stagediver.scraper.scraper import BaseFestivalScraper
+from stagediver.scraper.spotify import (
+    FileMetadataSource,
+    MetadataSource,
+    enrich_spotify,
+)
+
+
+def make_artist(artist_id):
+    return {
+        "artist_name": f"Artist {artist_id}",
+        "social_links": {"spotify": f"https://open.spotify.com/artist/{artist_id}"},
+    }
+
+
+class FlakySource(MetadataSource):
+    """Knows every artist, but fails from the given batch on"""
+
+    def __init__(self, fail_from: int):
+        self.fail_from = fail_from
+        self.batches = 0
+
+    def fetch(self, artist_ids):
+        self.batches += 1
+        if self.batches > self.fail_from:
+            raise ConnectionError("source went away")
+        return {artist_id: {"genres": ["rock"]} for artist_id in artist_ids}
+
+
+class FakeScraper(BaseFestivalScraper):
+    """Scrapes the same two artists without touching the network"""
+
+    def __init__(self):
+        super().__init__()
+        self.festival_name = "Fake Festival"
+        self.festival_year = 2026
+        self.program_url = "http://festival.invalid/program"
+
+    def fetch_lineup(self, sample_size=None, **fetch_options):
+        artists = [
+            {
+                "name": f"Artist {artist_id}",
+                "url": f"{self.program_url}/{artist_id}",
+                "stage": "Arena",
+                "spotify_link": f"https://open.spotify.com/artist/{artist_id}",
+            }
+            for artist_id in ("a1", "a2")
+        ]
+        return ScrapedData(
+            source_url=self.program_url,
+            raw_content={"artists": artists},
+            festival_name=self.festival_name,
+            festival_year=self.festival_year,
+        )
+
+
+def test_metadata_source_needs_fetch():
+    with pytest.raises(TypeError):
+        MetadataSource()
+
+
+def test_fetched_batches_are_cached_when_a_later_batch_fails(tmp_path):
+    cache_file = str(tmp_path / "spotify.json")
+    artists = [make_artist(f"id{i}") for i in range(4)]
+
+    with pytest.raises(ConnectionError):
+        enrich_spotify(
+            artists, FlakySource(fail_from=1), cache_file, batch_size=2, max_workers=1
+        )
+
+    assert sorted(load_json_file(cache_file)) == ["id0", "id1"]
+
+
+def test_rescrape_keeps_cached_metadata(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    save_json_file({"a1": {"genres": ["rock"]}}, "dataset.json")
+    enrich_spotify(
+        [make_artist("a1"), make_artist("a2")], FileMetadataSource("dataset.json")
+    )
+
+    lineup = load_json_file(run_scraper(FakeScraper()))
+
+    metadata = {
+        artist["artist_name"]: artist["other_data"].get("spotify")
+        for artist in lineup["artists"]
+    }
+    assert metadata == {
+        "Artist a1": {"genres": ["rock"], "popularity": None, "related_artists": None},
+        "Artist a2": None,
+    }
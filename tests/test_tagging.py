@@ -0,0 +1,81 @@
+import os
+
+from stagediver.common import load_json_file
+from stagediver.scraper.tagging import bio_hash, build_tag_index, tag_artists, tag_text
+
+
+def artist(name, bio_short, bio_long=None):
+    return {"artist_name": name, "bio_short": bio_short, "bio_long": bio_long}
+
+
+def lineup():
+    return [
+        artist("Rave", "Mørk techno til natten", "Hypnotisk og intens techno."),
+        artist("Shanty", "Akustisk folk", "Rolige sange om havet."),
+        artist("Unknown", None),
+    ]
+
+
+def test_tag_text():
+    tags = tag_text("Dark techno from a warehouse. Dark, dark, and electronic.")
+
+    assert tags["genres"] == ["electronic", "techno"]
+    # Strongest mood first
+    assert tags["mood_tags"][0] == "🌙 Late Night"
+    assert tag_text("") == {"genres": [], "mood_tags": []}
+
+
+def test_cache_hits_skip_tagging(tmp_path):
+    cache_file = str(tmp_path / "cache" / "tags.json")
+
+    first = lineup()
+    assert tag_artists(first, cache_file) == {"cached": 0, "tagged": 3}
+    assert len(load_json_file(cache_file)) == 3
+
+    second = lineup()
+    assert tag_artists(second, cache_file) == {"cached": 3, "tagged": 0}
+    assert [a["other_data"] for a in second] == [a["other_data"] for a in first]
+    assert second[0]["other_data"]["genres"] == ["techno"]
+    assert second[1]["other_data"]["genres"] == ["folk"]
+
+
+def test_changed_description_is_tagged_again(tmp_path):
+    cache_file = str(tmp_path / "tags.json")
+    tag_artists(lineup(), cache_file)
+
+    changed = lineup()
+    changed[1]["bio_long"] = "Nu med punk og larm."
+
+    assert tag_artists(changed, cache_file) == {"cached": 2, "tagged": 1}
+    assert "🤘 Moshpit" in changed[1]["other_data"]["mood_tags"]
+    # The old bio stays cached, the new one is added
+    assert len(load_json_file(cache_file)) == 4
+    assert bio_hash(changed[1]) != bio_hash(lineup()[1])
+
+
+def test_without_cache_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    assert tag_artists(lineup(), cache_file=None) == {"cached": 0, "tagged": 3}
+    assert os.listdir(tmp_path) == []
+
+
+def test_batches_in_worker_processes_match():
+    artists = lineup() * 4
+    in_process = [dict(a) for a in artists]
+    tag_artists(in_process, cache_file=None)
+
+    tag_artists(artists, cache_file=None, batch_size=2, max_workers=2)
+
+    assert [a["other_data"] for a in artists] == [a["other_data"] for a in in_process]
+
+
+def test_build_tag_index():
+    artists = lineup()
+    tag_artists(artists, cache_file=None)
+
+    index = build_tag_index(artists)
+
+    assert index["genres"]["techno"] == [0]
+    assert index["genres"]["folk"] == [1]
+    assert all(2 not in positions for positions in index["mood_tags"].values())
@@ -0,0 +1,91 @@
+from stagediver.web.components.time_index import TimeIndex, get_stage
+
+
+def artist(name, stage, start=None):
+    return {
+        "artist_name": name,
+        "stage_name": stage,
+        "start_ts": f"{start}:00+02:00" if start else None,
+    }
+
+
+ARTISTS = [
+    artist("Opener", "Arena", "2026-07-01T14:00"),
+    artist("Headliner", "Orange", "2026-07-01T21:00"),
+    artist("No Stage", None, "2026-07-01T22:00"),
+    artist("Late", "Arena", "2026-07-01T23:30"),
+    artist("Midnight", "", "2026-07-02T00:00"),
+    artist("Night", "Avalon", "2026-07-02T01:30"),
+    artist("Dawn", "Orange", "2026-07-02T06:00"),
+    artist("Unannounced", "Arena"),
+    artist("Thursday", "Arena", "2026-07-02T18:00"),
+]
+
+
+def names(positions):
+    return [ARTISTS[i]["artist_name"] for i in positions]
+
+
+def test_days_and_stages():
+    index = TimeIndex(ARTISTS)
+
+    # Sets before 06:00 belong to the night before
+    assert index.days == {
+        "2026-07-01": "Wednesday 1 July",
+        "2026-07-02": "Thursday 2 July",
+    }
+    # Sets without a stage are listed under TBA, unannounced sets not at all
+    assert index.stages == ["Arena", "Avalon", "Orange", "TBA"]
+    assert len(index.positions) == 8
+
+
+def test_window_includes_sets_starting_at_its_start():
+    index = TimeIndex(ARTISTS)
+
+    assert names(index.window("2026-07-01", 21, 24)) == [
+        "Headliner",
+        "No Stage",
+        "Late",
+    ]
+
+
+def test_window_is_by_start_time():
+    index = TimeIndex(ARTISTS)
+
+    # Headliner is still playing at 22:00 but started before the window
+    assert names(index.window("2026-07-01", 22, 23)) == ["No Stage"]
+    # The end is exclusive, and hours past midnight are 24 and up
+    assert names(index.window("2026-07-01", 24, 26)) == ["Midnight", "Night"]
+    # The full day stops before the next day's first set at 06:00
+    assert names(index.window("2026-07-01", 6, 30))[-1] == "Night"
+    assert names(index.window("2026-07-02", 6, 30)) == ["Dawn", "Thursday"]
+
+
+def test_window_filters_stages():
+    index = TimeIndex(ARTISTS)
+
+    assert names(index.window("2026-07-01", 6, 30, {"Arena", "TBA"})) == [
+        "Opener",
+        "No Stage",
+        "Late",
+        "Midnight",
+    ]
+    assert index.window("2026-07-01", 6, 30, set()) == []
+
+
+def test_main_stages_leave_out_rarely_used_stages():
+    artists = [
+        artist(f"Arena {i}", "Arena", f"2026-07-01T{12 + i // 4}:{i % 4 * 15:02d}")
+        for i in range(25)
+    ] + [artist("Pop-up", "Apollo", "2026-07-01T15:00")]
+
+    index = TimeIndex(artists)
+
+    assert index.stages == ["Apollo", "Arena"]
+    assert index.main_stages == ["Arena"]
+
+
+def test_get_stage():
+    assert get_stage({"stage_name": "Arena"}) == "Arena"
+    assert get_stage({"stage_name": ""}) == "TBA"
+    assert get_stage({}) == "TBA"
@@ -0,0 +1,111 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from stagediver.common import load_json_file
+from stagediver.models import ScrapedData
+from stagediver.scraper import run_scraper
+from stagediver.scraper.scraper import BaseFestivalScraper
+from stagediver.scraper.validation import (
+    FAIL_THRESHOLDS,
+    WARN_THRESHOLDS,
+    validate_artists,
+)
+
+START = datetime(2026, 7, 1, 20, tzinfo=timezone.utc)
+
+
+def record(name, stage="Arena", start_ts=START, **fields):
+    return {
+        "name": name,
+        "url": f"https://festival.test/program/{name}",
+        "stage": stage,
+        "start_ts": start_ts,
+        **fields,
+    }
+
+
+def lineup(count, duplicates=0):
+    records = [record(f"artist-{i}") for i in range(count - duplicates)]
+    return records + [record("artist-0") for _ in range(duplicates)]
+
+
+class FakeScraper(BaseFestivalScraper):
+    """Scrapes the given records without touching the network"""
+
+    def __init__(self, records):
+        super().__init__()
+        self.festival_name = "Fake Festival"
+        self.festival_year = 2026
+        self.records = records
+
+    def fetch_lineup(self, sample_size=None, **fetch_options):
+        return ScrapedData(
+            source_url="https://festival.test/program",
+            raw_content={"artists": self.records},
+            festival_name=self.festival_name,
+            festival_year=self.festival_year,
+        )
+
+
+def test_clean_lineup_passes():
+    report = validate_artists(lineup(20))
+
+    assert report.artists == 20
+    assert report.exceeded(WARN_THRESHOLDS) == []
+    assert report.summary().startswith("Validated 20 artists in ")
+
+
+def test_problems_are_counted():
+    records = lineup(6, duplicates=2) + [
+        record("no-time", start_ts=None),
+        record("no-stage", stage="TBA"),
+        record("naive-time", start_ts=datetime(2026, 7, 1, 20)),
+        record("", stage=None),
+        "not a record",
+    ]
+
+    report = validate_artists(records)
+
+    assert report.artists == 11
+    assert report.invalid == 3
+    assert report.missing_times == 1
+    assert report.unknown_stages == 2
+    assert report.duplicates == 2
+    assert report.duplicate_names == ["artist-0"]
+    assert any(error.startswith("artists[8].start_ts:") for error in report.errors)
+
+
+@pytest.mark.parametrize("duplicates, rejected", [(1, False), (2, True)])
+def test_duplicates_reject_above_five_percent(duplicates, rejected):
+    report = validate_artists(lineup(20, duplicates))
+
+    assert bool(report.exceeded(FAIL_THRESHOLDS)) == rejected
+    assert report.exceeded(WARN_THRESHOLDS) == [
+        f"duplicates: {duplicates} of 20 artists (more than 0%)"
+    ]
+
+
+def test_missing_times_and_stages_only_warn():
+    report = validate_artists([record(f"artist-{i}", "TBA", None) for i in range(5)])
+
+    assert report.exceeded(FAIL_THRESHOLDS) == []
+    assert len(report.exceeded(WARN_THRESHOLDS)) == 2
+
+
+def test_rejected_scrape_keeps_the_saved_lineup(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    file_path = run_scraper(FakeScraper(lineup(20)))
+    saved = load_json_file(file_path)
+
+    with pytest.raises(ValueError, match="duplicates: 2 of 20"):
+        run_scraper(FakeScraper(lineup(20, duplicates=2)))
+    assert load_json_file(file_path) == saved
+
+    # Strict runs also reject problems that only warn by default
+    with pytest.raises(ValueError, match="missing times"):
+        run_scraper(
+            FakeScraper(lineup(19) + [record("no-time", start_ts=None)]),
+            fail_thresholds=WARN_THRESHOLDS,
+        )
+    assert load_json_file(file_path) == saved